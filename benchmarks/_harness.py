@@ -0,0 +1,94 @@
+"""Shared helpers for the benchmark scripts.
+
+Every benchmark reports a JSON document with the same envelope — the
+commit, interpreter and platform it ran on, plus its ``results`` — so
+two runs can be compared with ``benchmarks/compare.py``. Timings are
+given in milliseconds (``*_ms``) or microseconds (``*_us``); lower is
+better for every metric with one of those suffixes.
+
+Importing this module quiets the ``axm_mcp`` loggers, whose per-tool
+INFO lines would otherwise flood stderr during a run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logging.getLogger("axm_mcp").setLevel(logging.WARNING)
+
+
+@dataclass
+class FakeToolResult:
+    """ToolResult stand-in."""
+
+    success: bool = True
+    data: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+def measure(func: Callable[[], Any], *, repeat: int = 5) -> dict[str, float]:
+    """Time *func* over *repeat* runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples, unit="ms")
+
+
+def summarize(samples: list[float], *, unit: str) -> dict[str, float]:
+    """Median, min and max of *samples*, keyed with their *unit*."""
+    ordered = sorted(samples)
+    return {
+        f"median_{unit}": round(statistics.median(ordered), 3),
+        f"min_{unit}": round(ordered[0], 3),
+        f"max_{unit}": round(ordered[-1], 3),
+    }
+
+
+def envelope(benchmark: str, params: dict[str, Any], results: Any) -> dict[str, Any]:
+    """Wrap *results* with what is needed to compare runs."""
+    return {
+        "benchmark": benchmark,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+
+
+def emit(report: dict[str, Any], output: Path | None) -> None:
+    """Write *report* to *output*, or to stdout when None."""
+    text = json.dumps(report, indent=2) + "\n"
+    if output is None:
+        sys.stdout.write(text)
+        return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(text, encoding="utf-8")
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
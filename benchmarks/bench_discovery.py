@@ -0,0 +1,112 @@
+"""Benchmark: tool discovery and registration with many entry points.
+
+Installs a synthetic distribution exposing N ``axm.tools`` entry points
+(on a temporary ``sys.path`` entry) and times, for each N:
+
+- ``eager``: import and instantiate every tool (module re-imported on
+  each run);
+- ``lazy``: build load-on-first-call proxies from entry-point metadata;
+- ``lazy_cached``: the same from a warm discovery cache;
+- ``register``: register the discovered tools on a FastMCP server.
+
+Usage::
+
+    python benchmarks/bench_discovery.py [--sizes 10,100,500] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from _harness import emit, envelope, measure
+from mcp.server.fastmcp import FastMCP
+
+from axm_mcp.discovery import discover_tools, register_tools
+
+_TOOL = '''
+
+class Tool{i}:
+    """Synthetic tool number {i}."""
+
+    name = "synth_{n}_{i}"
+
+    def execute(self, *, path: str = ".", limit: int = 10) -> dict:
+        """Return nothing useful, quickly."""
+        return {{"path": path, "limit": limit}}
+'''
+
+
+def _install(root: Path, n: int) -> str:
+    """Write a distribution with *n* entry points under *root*."""
+    module = f"synth_axm_tools_{n}"
+    dist_info = root / f"{module}-0.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {module.replace('_', '-')}\nVersion: 0.0\n"
+    )
+    lines = [f"synth_{n}_{i} = {module}:Tool{i}" for i in range(n)]
+    (dist_info / "entry_points.txt").write_text(
+        "[axm.tools]\n" + "\n".join(lines) + "\n"
+    )
+    body = "".join(_TOOL.format(i=i, n=n) for i in range(n))
+    (root / f"{module}.py").write_text(body)
+    return module
+
+
+def _bench_size(n: int, repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "site"
+        cache_dir = Path(tmp) / "cache"
+        module = _install(root, n)
+        sys.path.insert(0, str(root))
+        importlib.invalidate_caches()
+        try:
+
+            def eager() -> dict[str, Any]:
+                sys.modules.pop(module, None)
+                return discover_tools()
+
+            found = sum(name.startswith(f"synth_{n}_") for name in eager())
+            discover_tools(lazy=True, cache_dir=cache_dir)  # warm the cache
+            tools = discover_tools(lazy=True)
+            return {
+                "entry_points": found,
+                "eager": measure(eager, repeat=repeat),
+                "lazy": measure(lambda: discover_tools(lazy=True), repeat=repeat),
+                "lazy_cached": measure(
+                    lambda: discover_tools(lazy=True, cache_dir=cache_dir),
+                    repeat=repeat,
+                ),
+                "register": measure(
+                    lambda: register_tools(FastMCP("bench"), tools), repeat=repeat
+                ),
+            }
+        finally:
+            sys.path.remove(str(root))
+            sys.modules.pop(module, None)
+            importlib.invalidate_caches()
+
+
+def main() -> None:
+    """Run every size and emit the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,50,100,500")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = {str(n): _bench_size(n, args.repeat) for n in sizes}
+    emit(
+        envelope("discovery", {"sizes": sizes, "repeat": args.repeat}, results),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Benchmark: per-call overhead of the tool registration wrapper.
+
+Calls a trivial synthetic tool through the async wrapper that
+``_register_one`` builds (argument unwrapping and validation, time
+limits, coalescing, dispatch to the thread pool, result envelope) and
+compares it with a direct ``execute`` call. Variants:
+
+- ``direct``: ``tool.execute(**kwargs)``, the floor;
+- ``wrapper``: flat arguments, validated against the inferred schema;
+- ``wrapper_unvalidated``: a tool taking ``**kwargs``, which has no
+  validator — the wrapper as it was before validation;
+- ``wrapper_coerced``: arguments sent as strings and coerced;
+- ``wrapper_rejected``: an invalid call, answered without dispatch;
+- ``validator``: the compiled validator alone;
+- ``wrapper_kwargs``: arguments wrapped as ``{"kwargs": {...}}``, as MCP
+  clients send them;
+- ``wrapper_no_coalesce``: a tool opted out of coalescing;
+- ``wrapper_cache_hit``: a cached tool answering from memory;
+- ``wrapper_large_result``: a 2000-item result cut by the response
+  budget.
+
+Usage::
+
+    python benchmarks/bench_dispatch.py [--calls 2000] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from _harness import FakeToolResult, emit, envelope, summarize
+
+from axm_mcp.discovery import _register_one, catalog_entry
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.paging import Paginator
+from axm_mcp.result_cache import ResultCache
+from axm_mcp.validation import compile_validator
+
+
+class EchoTool:
+    """Tool returning its arguments."""
+
+    name = "echo"
+
+    def execute(self, *, path: str = ".", limit: int = 10) -> FakeToolResult:
+        """Echo the arguments."""
+        return FakeToolResult(data={"path": path, "limit": limit})
+
+
+class OpenEchoTool:
+    """Echo tool accepting any arguments (no schema, no validation)."""
+
+    name = "echo"
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Echo the arguments."""
+        return FakeToolResult(data=kwargs)
+
+
+class SideEffectTool(EchoTool):
+    """Echo tool opted out of coalescing."""
+
+    coalesce = False
+
+
+class ListTool(EchoTool):
+    """Tool returning a long list."""
+
+    def execute(self, *, path: str = ".", limit: int = 10) -> FakeToolResult:
+        """Return 2000 errors."""
+        return FakeToolResult(data={"errors": [f"{path}:{i}" for i in range(2000)]})
+
+
+class CaptureMCP:
+    """FastMCP stand-in keeping the registered wrappers."""
+
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+
+    def tool(self, *, name: str) -> Any:
+        def decorator(fn: Any) -> Any:
+            self.tools[name] = fn
+            return fn
+
+        return decorator
+
+
+def _wrapper(tool: Any, **options: Any) -> Callable[..., Awaitable[Any]]:
+    server = CaptureMCP()
+    _register_one(server, "echo", tool, options.pop("dispatcher"), **options)
+    wrapper: Callable[..., Awaitable[Any]] = server.tools["echo"]
+    return wrapper
+
+
+async def _per_call_us(
+    call: Callable[[], Awaitable[Any]], calls: int, rounds: int
+) -> dict[str, float]:
+    await call()  # warm up (pool threads, caches)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await call()
+        samples.append((time.perf_counter() - start) / calls * 1e6)
+    return summarize(samples, unit="us")
+
+
+async def _run(calls: int, rounds: int) -> dict[str, Any]:
+    dispatcher = Dispatcher()
+    args: dict[str, Any] = {"path": "project", "limit": 5}
+    echo = EchoTool()
+
+    validator = compile_validator(catalog_entry("echo", echo)["input_schema"])
+    assert validator is not None
+
+    async def direct() -> Any:
+        return echo.execute(**args)
+
+    async def validate() -> Any:
+        return validator(args)
+
+    plain = _wrapper(echo, dispatcher=dispatcher)
+    unvalidated = _wrapper(OpenEchoTool(), dispatcher=dispatcher)
+    no_coalesce = _wrapper(SideEffectTool(), dispatcher=dispatcher)
+    cached = _wrapper(echo, dispatcher=dispatcher, cache=ResultCache(), cache_ttl=0.0)
+    paged = _wrapper(ListTool(), dispatcher=dispatcher, pages=Paginator(max_items=200))
+    try:
+        return {
+            "direct": await _per_call_us(direct, calls, rounds),
+            "wrapper": await _per_call_us(lambda: plain(**args), calls, rounds),
+            "wrapper_unvalidated": await _per_call_us(
+                lambda: unvalidated(**args), calls, rounds
+            ),
+            "wrapper_coerced": await _per_call_us(
+                lambda: plain(path="project", limit="5"), calls, rounds
+            ),
+            "wrapper_rejected": await _per_call_us(
+                lambda: plain(limit="many"), calls, rounds
+            ),
+            "validator": await _per_call_us(validate, calls, rounds),
+            "wrapper_kwargs": await _per_call_us(
+                lambda: plain(kwargs=dict(args)), calls, rounds
+            ),
+            "wrapper_no_coalesce": await _per_call_us(
+                lambda: no_coalesce(**args), calls, rounds
+            ),
+            "wrapper_cache_hit": await _per_call_us(
+                lambda: cached(**args), calls, rounds
+            ),
+            "wrapper_large_result": await _per_call_us(
+                lambda: paged(**args), max(1, calls // 10), rounds
+            ),
+        }
+    finally:
+        dispatcher.shutdown()
+
+
+def main() -> None:
+    """Run every variant and emit the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.calls, args.rounds))
+    emit(
+        envelope("dispatch", {"calls": args.calls, "rounds": args.rounds}, results),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark: ``list_tools`` latency while a ``verify`` is running.
+
+Registers a synthetic slow ``audit`` tool on an in-process FastMCP
+server, starts ``verify`` and samples ``list_tools`` latency during the
+run. The same measurement is repeated with a verify handler that runs
+synchronously on the event loop (the pre-dispatcher behaviour) for
+comparison. Prints a JSON report to stdout.
+
+Usage::
+
+    python benchmarks/bench_list_tools_under_load.py [--verify-seconds 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from _harness import FakeToolResult
+from mcp.server.fastmcp import FastMCP
+
+from axm_mcp.discovery import register_tools
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.verify import verify_project
+
+
+class SlowAudit:
+    """Audit stand-in that blocks its thread like a real audit."""
+
+    name = "audit"
+
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Block, then report a clean project."""
+        time.sleep(self._seconds)
+        return FakeToolResult(data={"score": 100, "failed": []})
+
+
+def _build(seconds: float, *, blocking: bool) -> FastMCP:
+    server = FastMCP("bench")
+    tools = {"audit": SlowAudit(seconds)}
+    dispatcher = Dispatcher()
+    register_tools(server, tools, {"verify": "bench verify"}, dispatcher=dispatcher)
+
+    if blocking:
+
+        @server.tool(name="verify")
+        def _verify_blocking(**kwargs: Any) -> dict[str, Any]:
+            return verify_project(tempfile.gettempdir(), tools)
+
+    else:
+
+        @server.tool(name="verify")
+        async def _verify(**kwargs: Any) -> dict[str, Any]:
+            return await dispatcher.run_sync(
+                verify_project, tempfile.gettempdir(), tools
+            )
+
+    return server
+
+
+async def _sample_list_tools(server: FastMCP, seconds: float) -> list[float]:
+    """Issue list_tools every 10 ms; latency counts from the scheduled time.
+
+    Measuring from the scheduled issue time (not from when the sampler
+    got to run) captures time spent waiting on a blocked event loop.
+    """
+    samples: list[float] = []
+    scheduled = time.perf_counter()
+    deadline = scheduled + seconds
+    while scheduled < deadline:
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        await server.call_tool("list_tools", {"kwargs": "{}"})
+        done = time.perf_counter()
+        samples.append((done - scheduled) * 1000)
+        scheduled = max(scheduled + 0.01, done)
+    return samples
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+async def _run(seconds: float, *, blocking: bool) -> dict[str, Any]:
+    server = _build(seconds, blocking=blocking)
+    idle = await _sample_list_tools(server, 0.3)
+    sampler = asyncio.create_task(_sample_list_tools(server, seconds * 0.8))
+    await asyncio.sleep(0.05)
+    await server.call_tool("verify", {"kwargs": "{}"})
+    busy = await sampler
+    return {"idle": _summary(idle), "during_verify": _summary(busy)}
+
+
+def main() -> None:
+    """Run both scenarios and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verify-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "list_tools_under_load",
+        "verify_seconds": args.verify_seconds,
+        "dispatcher": asyncio.run(_run(args.verify_seconds, blocking=False)),
+        "blocking_baseline": asyncio.run(_run(args.verify_seconds, blocking=True)),
+    }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark: ``verify_project`` on a project with thousands of failures.
+
+Runs verify against synthetic tools: an ``audit`` reporting N failures
+(naming symbols drawn from a smaller pool, so lookups are shared), an
+``init_check`` and an ``ast_impact`` sleeping a fixed delay per symbol
+to stand in for AST analysis. For each N it times:
+
+- ``verify``: the whole run, audit to enriched result;
+- ``compact``: ``compact_enrichment`` over that result;
+- ``budget``: cutting the result to the response budget
+  (``Paginator.apply``) and encoding it as JSON.
+
+Usage::
+
+    python benchmarks/bench_verify.py [--failures 1000,5000] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from _harness import FakeToolResult, emit, envelope, measure
+
+from axm_mcp.paging import Paginator
+from axm_mcp.verify import compact_enrichment, verify_project
+
+# Never read: the synthetic tools ignore their path.
+_PROJECT = "synthetic-project"
+
+
+class AuditTool:
+    """Audit reporting *failures* failures over *symbols* symbols."""
+
+    def __init__(self, failures: int, symbols: int) -> None:
+        self._failed = [
+            {
+                "rule_id": f"RULE_{i % 7}",
+                "message": f"Function func_{i % symbols} failed check {i}",
+            }
+            for i in range(failures)
+        ]
+
+    def execute(self, *, path: str) -> FakeToolResult:
+        """Return the failures."""
+        return FakeToolResult(data={"score": 10, "failed": list(self._failed)})
+
+
+class InitTool:
+    """Init check that always passes."""
+
+    def execute(self, *, path: str) -> FakeToolResult:
+        """Return a perfect score."""
+        return FakeToolResult(data={"score": 100})
+
+
+class ImpactTool:
+    """ast_impact stand-in sleeping *delay* seconds per lookup."""
+
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return a handful of callers."""
+        time.sleep(self._delay)
+        callers = [
+            {"module": f"pkg.mod_{j}", "function": f"use_{symbol}_{j}"}
+            for j in range(5)
+        ]
+        return FakeToolResult(
+            data={"callers": callers, "score": 3, "affected_modules": ["pkg"]}
+        )
+
+
+def _bench_size(
+    failures: int, symbols: int, delay: float, repeat: int
+) -> dict[str, Any]:
+    tools = {
+        "audit": AuditTool(failures, symbols),
+        "init_check": InitTool(),
+        "ast_impact": ImpactTool(delay),
+    }
+    result = verify_project(_PROJECT, tools)
+    pages = Paginator()
+
+    def budget() -> str:
+        return json.dumps(pages.apply(result))
+
+    return {
+        "symbols": symbols,
+        "response_kb": round(len(json.dumps(result)) / 1024, 1),
+        "verify": measure(lambda: verify_project(_PROJECT, tools), repeat=repeat),
+        "compact": measure(lambda: compact_enrichment(result), repeat=repeat),
+        "budget": measure(budget, repeat=repeat),
+    }
+
+
+def main() -> None:
+    """Run every size and emit the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--failures", default="1000,5000")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--impact-ms", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.failures.split(",")]
+    delay = args.impact_ms / 1000
+    results = {
+        str(n): _bench_size(n, min(n, args.symbols), delay, args.repeat) for n in sizes
+    }
+    params = {
+        "failures": sizes,
+        "symbols": args.symbols,
+        "impact_ms": args.impact_ms,
+        "repeat": args.repeat,
+    }
+    emit(envelope("verify", params, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare two benchmark reports.
+
+Pairs every timing (keys ending in ``_ms`` or ``_us``) present in both
+reports, prints the ratio new/old, and exits with status 1 when any
+median regressed by more than the threshold.
+
+Usage::
+
+    python benchmarks/compare.py BASELINE.json NEW.json [--threshold 1.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+_UNITS = ("_ms", "_us")
+
+
+def flatten(node: Any, prefix: str = "") -> Iterator[tuple[str, float]]:
+    """Yield ``(dotted.path, value)`` for every timing under *node*."""
+    if not isinstance(node, dict):
+        return
+    for key, value in node.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            yield from flatten(value, path)
+        elif isinstance(value, int | float) and str(key).endswith(_UNITS):
+            yield path, float(value)
+
+
+def _load(path: Path) -> dict[str, Any]:
+    report: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return report
+
+
+def main() -> None:
+    """Print the comparison; exit 1 on a regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="new/old median ratio above which a metric has regressed",
+    )
+    args = parser.parse_args()
+
+    old_report, new_report = _load(args.baseline), _load(args.new)
+    old = dict(flatten(old_report["results"]))
+    new = dict(flatten(new_report["results"]))
+    out = sys.stdout
+    out.write(f"{old_report.get('commit')} -> {new_report.get('commit')}\n")
+
+    regressions = []
+    for path in sorted(old.keys() & new.keys()):
+        ratio = new[path] / old[path] if old[path] else float("inf")
+        flag = ""
+        if ".median_" in f".{path}" and ratio > args.threshold:
+            regressions.append(path)
+            flag = "  REGRESSION"
+        out.write(
+            f"{path:<60} {old[path]:>12.3f} {new[path]:>12.3f} {ratio:>7.2f}x{flag}\n"
+        )
+
+    if regressions:
+        out.write(f"{len(regressions)} regression(s) above {args.threshold}x\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Run every benchmark and write one combined report.
+
+Each suite runs in its own interpreter, with its default parameters, so
+that one does not warm caches or thread pools for the next. The
+combined report has the usual envelope, with ``results`` keyed by
+suite name; compare two of them with ``benchmarks/compare.py``.
+
+Usage::
+
+    python benchmarks/run.py [--output .benchmarks/latest.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from _harness import emit, envelope
+
+_HERE = Path(__file__).parent
+SUITES = ("discovery", "dispatch", "verify")
+
+
+def _run_suite(name: str) -> Any:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, str(_HERE / f"bench_{name}.py")],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)["results"]
+
+
+def main() -> None:
+    """Run the selected suites and emit the combined report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suites", default=",".join(SUITES))
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    suites = args.suites.split(",")
+    results = {}
+    for name in suites:
+        sys.stderr.write(f"Running {name}...\n")
+        results[name] = _run_suite(name)
+    emit(envelope("suite", {"suites": suites}, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
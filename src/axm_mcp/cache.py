@@ -0,0 +1,158 @@
+"""Size-bounded on-disk LRU cache for JSON-serializable results.
+
+Each entry is one small JSON file named after a hash of its key. Reads
+refresh the file's mtime, so evicting the oldest mtimes first gives LRU
+order without an index file that concurrent servers would fight over.
+The directory's size is scanned once, on the first write, then kept as
+a running total: writes only walk the directory again when the total
+goes over budget, which also resyncs it with other servers' writes.
+Entries may carry an expiry time and are dropped when read after it.
+Cache I/O errors are logged and treated as misses — a broken cache must
+never break a tool call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+__all__ = ["DiskCache"]
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".json"
+
+
+class DiskCache:
+    """Size-bounded LRU cache of JSON values, one file per key.
+
+    Args:
+        directory: Directory holding the entries (created on first write).
+        max_bytes: Total size budget; least recently used entries are
+            evicted once a write pushes the directory over it.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes on disk; None until the first write scans the directory
+        self._total: int | None = None
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for *key*, or None on a miss."""
+        entry = self.lookup(key)
+        return None if entry is None else entry[0]
+
+    def lookup(self, key: str) -> tuple[Any, float | None] | None:
+        """Return ``(value, expiry timestamp)`` for *key*, or None on a miss."""
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("key") != key:
+            return None
+        expires = payload.get("expires")
+        if not isinstance(expires, (int, float)):
+            return payload.get("value"), None
+        if expires <= time.time():
+            self._remove(path)
+            return None
+        return payload.get("value"), float(expires)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store *value* under *key*, evicting once over the size budget.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value.
+            ttl: Seconds until the entry expires (never when None).
+        """
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        payload: dict[str, Any] = {"key": key, "value": value}
+        if ttl is not None:
+            payload["expires"] = time.time() + ttl
+        try:
+            data = json.dumps(payload).encode()
+        except (TypeError, ValueError):
+            logger.debug("Value for cache key %s is not JSON-serializable", key)
+            return
+        if len(data) > self.max_bytes:
+            return
+        replaced = _size(path)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Could not write cache entry: %s", path)
+            tmp.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._total is not None:
+                self._total += len(data) - replaced
+                if self._total <= self.max_bytes:
+                    return
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._total = 0
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.directory / f"{name}{_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        try:
+            return list(self.directory.glob(f"*{_SUFFIX}"))
+        except OSError:
+            return []
+
+    def _remove(self, path: Path) -> None:
+        size = _size(path)
+        path.unlink(missing_ok=True)
+        with self._lock:
+            if self._total is not None:
+                self._total = max(self._total - size, 0)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under ``max_bytes``.
+
+        Rescans the directory and resets the running total from it.
+        """
+        stats: list[tuple[int, int, Path]] = []
+        for path in self._entries():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            stats.append((st.st_mtime_ns, st.st_size, path))
+
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total = total
+
+
+def _size(path: Path) -> int:
+    """Size of *path* in bytes, 0 if it does not exist."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
@@ -0,0 +1,261 @@
+"""Runtime settings for the MCP server.
+
+Settings are read from ``AXM_MCP_*`` environment variables, which is
+how MCP clients configure the servers they spawn. Every setting has a
+safe default so ``axm-mcp`` works with no configuration at all.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal, cast
+
+__all__ = ["Settings", "as_bool", "as_seconds", "default_cache_dir"]
+
+_PREFIX = "AXM_MCP_"
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_TRANSPORTS = frozenset({"stdio", "sse", "streamable-http"})
+_TRACE_FORMATS = frozenset({"jsonl", "otlp"})
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/axm-mcp`` (``~/.cache/axm-mcp`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "axm-mcp"
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Server settings.
+
+    Attributes:
+        lazy_discovery: Register tools from entry-point metadata only and
+            import each tool on its first call (``AXM_MCP_LAZY``).
+        discovery_cache: Reuse cached entry-point metadata while the
+            installed distributions are unchanged
+            (``AXM_MCP_DISCOVERY_CACHE``).
+        cache_dir: Directory for on-disk caches (``AXM_MCP_CACHE_DIR``).
+        verify_cache: Return cached ``verify`` results while the project
+            content is unchanged (``AXM_MCP_VERIFY_CACHE``).
+        verify_cache_mb: Size budget of the verify cache in MiB
+            (``AXM_MCP_VERIFY_CACHE_MB``).
+        verify_incremental: Default for the ``verify`` tool's
+            ``incremental`` argument (``AXM_MCP_VERIFY_INCREMENTAL``).
+        verify_compact: Default for the ``verify`` tool's ``compact``
+            argument (``AXM_MCP_VERIFY_COMPACT``).
+        max_workers: Size of the tool-call thread pool; 0 keeps the
+            executor default (``AXM_MCP_WORKERS``).
+        process_tools: Tools executed in worker processes instead of
+            threads (``AXM_MCP_PROCESS_TOOLS``, comma-separated).
+        process_workers: Worker processes per process-backed tool; 0
+            uses the CPU count (``AXM_MCP_PROCESS_WORKERS``).
+        timeout: Default time limit of a tool call in seconds; 0 means
+            unbounded (``AXM_MCP_TIMEOUT``).
+        timeouts: Per-tool time limits overriding ``timeout``
+            (``AXM_MCP_TIMEOUTS``, e.g. ``bib_pdf=30,audit=300``).
+        cache_tools: Tools whose results are cached, with a TTL in
+            seconds; 0 never expires (``AXM_MCP_CACHE_TOOLS``, e.g.
+            ``bib_doi=86400,bib_search=3600``).
+        result_cache_mb: Size budget of the on-disk tool result cache in
+            MiB (``AXM_MCP_RESULT_CACHE_MB``).
+        page_items: Items returned per ``callers``/``failed``/``errors``
+            list before the rest is paged; 0 disables
+            (``AXM_MCP_PAGE_ITEMS``).
+        max_response_kb: Approximate size budget of a tool response in
+            KiB; 0 disables (``AXM_MCP_MAX_RESPONSE_KB``).
+        transport: MCP transport — ``stdio``, ``sse`` or
+            ``streamable-http`` (``AXM_MCP_TRANSPORT``). HTTP transports
+            also serve Prometheus metrics at ``/metrics``.
+        trace_file: File receiving tracing spans; unset disables tracing
+            (``AXM_MCP_TRACE_FILE``).
+        trace_format: ``jsonl`` (flat span records) or ``otlp``
+            (OTLP/JSON) for the trace file (``AXM_MCP_TRACE_FORMAT``).
+        batch_parallelism: Entries of a ``batch`` call run at once, and
+            the most a call may ask for (``AXM_MCP_BATCH_PARALLELISM``).
+    """
+
+    lazy_discovery: bool = False
+    discovery_cache: bool = True
+    cache_dir: Path = field(default_factory=default_cache_dir)
+    verify_cache: bool = True
+    verify_cache_mb: int = 64
+    verify_incremental: bool = False
+    verify_compact: bool = False
+    max_workers: int = 0
+    process_tools: frozenset[str] = frozenset()
+    process_workers: int = 0
+    timeout: float = 0.0
+    timeouts: Mapping[str, float] = field(default_factory=dict)
+    cache_tools: Mapping[str, float] = field(default_factory=dict)
+    result_cache_mb: int = 64
+    page_items: int = 200
+    max_response_kb: int = 512
+    transport: Literal["stdio", "sse", "streamable-http"] = "stdio"
+    trace_file: Path | None = None
+    trace_format: Literal["jsonl", "otlp"] = "jsonl"
+    batch_parallelism: int = 8
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> Settings:
+        """Build settings from ``AXM_MCP_*`` environment variables.
+
+        Args:
+            environ: Mapping to read from (defaults to ``os.environ``).
+
+        Returns:
+            Settings with unset variables left at their defaults.
+        """
+        env = os.environ if environ is None else environ
+        defaults = cls()
+        return cls(
+            lazy_discovery=_env_bool(env, "LAZY", defaults.lazy_discovery),
+            discovery_cache=_env_bool(env, "DISCOVERY_CACHE", defaults.discovery_cache),
+            cache_dir=_env_path(env, "CACHE_DIR", defaults.cache_dir),
+            verify_cache=_env_bool(env, "VERIFY_CACHE", defaults.verify_cache),
+            verify_cache_mb=_env_int(env, "VERIFY_CACHE_MB", defaults.verify_cache_mb),
+            verify_incremental=_env_bool(
+                env, "VERIFY_INCREMENTAL", defaults.verify_incremental
+            ),
+            verify_compact=_env_bool(env, "VERIFY_COMPACT", defaults.verify_compact),
+            max_workers=_env_int(env, "WORKERS", defaults.max_workers),
+            process_tools=_env_names(env, "PROCESS_TOOLS", defaults.process_tools),
+            process_workers=_env_int(env, "PROCESS_WORKERS", defaults.process_workers),
+            timeout=_env_float(env, "TIMEOUT", defaults.timeout),
+            timeouts=_env_seconds(env, "TIMEOUTS", defaults.timeouts),
+            cache_tools=_env_seconds(env, "CACHE_TOOLS", defaults.cache_tools),
+            result_cache_mb=_env_int(env, "RESULT_CACHE_MB", defaults.result_cache_mb),
+            page_items=_env_int(env, "PAGE_ITEMS", defaults.page_items),
+            max_response_kb=_env_int(env, "MAX_RESPONSE_KB", defaults.max_response_kb),
+            transport=_env_choice(env, "TRANSPORT", defaults.transport, _TRANSPORTS),
+            trace_file=_env_optional_path(env, "TRACE_FILE"),
+            trace_format=_env_choice(
+                env, "TRACE_FORMAT", defaults.trace_format, _TRACE_FORMATS
+            ),
+            batch_parallelism=_env_int(
+                env, "BATCH_PARALLELISM", defaults.batch_parallelism
+            ),
+        )
+
+    def timeout_for(self, name: str) -> float | None:
+        """Time limit for calls to tool *name*, or None when unbounded."""
+        seconds = self.timeouts.get(name, self.timeout)
+        return seconds if seconds > 0 else None
+
+
+def _env_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    """Read a boolean flag, accepting ``1/true/yes/on`` as true."""
+    raw = env.get(_PREFIX + key)
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in _TRUTHY
+
+
+def as_bool(value: object) -> bool:
+    """Interpret a tool argument as a flag (``"true"``/``"1"`` count)."""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUTHY
+    return bool(value)
+
+
+def as_seconds(value: object) -> float | None:
+    """Interpret a ``timeout`` argument; 0 or less means unbounded.
+
+    Raises:
+        ValueError: If *value* is not a number.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"Invalid timeout: {value!r}")
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError(f"Invalid timeout: {value!r}") from None
+    return seconds if seconds > 0 else None
+
+
+def _env_path(env: Mapping[str, str], key: str, default: Path) -> Path:
+    """Read a filesystem path, expanding ``~``."""
+    raw = env.get(_PREFIX + key)
+    if raw is None or not raw.strip():
+        return default
+    return Path(raw.strip()).expanduser()
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read a non-negative integer, falling back to *default* if invalid."""
+    raw = env.get(_PREFIX + key)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+def _env_names(
+    env: Mapping[str, str],
+    key: str,
+    default: frozenset[str],
+) -> frozenset[str]:
+    """Read a comma-separated list of tool names."""
+    raw = env.get(_PREFIX + key)
+    if raw is None:
+        return default
+    return frozenset(name.strip() for name in raw.split(",") if name.strip())
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read a non-negative number, falling back to *default* if invalid."""
+    raw = env.get(_PREFIX + key)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw.strip())
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+def _env_choice[C: str](
+    env: Mapping[str, str],
+    key: str,
+    default: C,
+    choices: frozenset[str],
+) -> C:
+    """Read one of *choices*, falling back to *default* if unknown."""
+    raw = (env.get(_PREFIX + key) or "").strip().lower()
+    if raw not in choices:
+        return default
+    return cast(C, raw)
+
+
+def _env_optional_path(env: Mapping[str, str], key: str) -> Path | None:
+    """Read a filesystem path, expanding ``~``; unset means None."""
+    raw = env.get(_PREFIX + key)
+    if raw is None or not raw.strip():
+        return None
+    return Path(raw.strip()).expanduser()
+
+
+def _env_seconds(
+    env: Mapping[str, str],
+    key: str,
+    default: Mapping[str, float],
+) -> Mapping[str, float]:
+    """Read ``name=seconds`` pairs, skipping malformed entries."""
+    raw = env.get(_PREFIX + key)
+    if raw is None:
+        return default
+    timeouts: dict[str, float] = {}
+    for item in raw.split(","):
+        name, sep, seconds = item.partition("=")
+        try:
+            value = float(seconds)
+        except ValueError:
+            continue
+        if sep and name.strip() and value >= 0:
+            timeouts[name.strip()] = value
+    return timeouts
@@ -9,16 +9,100 @@ No imports from axm core — uses duck typing via Protocol.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import importlib
 import importlib.metadata
+import inspect
 import logging
-from typing import Any, Protocol, runtime_checkable
+import sys
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Annotated, Any, Protocol, cast, runtime_checkable
 
-__all__ = ["discover_tools", "register_tools"]
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import Field, WithJsonSchema
+from pydantic.json_schema import SkipJsonSchema
+
+from axm_mcp import tracing
+from axm_mcp.config import Settings, as_seconds
+from axm_mcp.discovery_cache import (
+    ToolSpec,
+    describe_params,
+    load_specs,
+    scan_specs,
+)
+from axm_mcp.dispatch import Dispatcher, ToolTimeoutError
+from axm_mcp.metrics import Metrics
+from axm_mcp.paging import Paginator
+from axm_mcp.progress import ProgressReporter, reporter_for
+from axm_mcp.result_cache import ResultCache, canonical_key
+from axm_mcp.schema import input_schema, split_docstring
+from axm_mcp.singleflight import SingleFlight
+from axm_mcp.validation import ArgumentError, Validator, compile_validator
+
+__all__ = [
+    "ToolChanges",
+    "accepts_argument",
+    "catalog_entry",
+    "discover_tools",
+    "register_tools",
+    "reload_tools",
+    "scan_entry_points",
+]
 
 logger = logging.getLogger(__name__)
 
 _EP_GROUP = "axm.tools"
 
+# Call argument bounding a single call, and the event handed to tools
+# that can stop early when that deadline passes.
+_TIMEOUT_ARG = "timeout"
+_CANCEL_ARG = "cancel_event"
+# Callback handed to tools that report progress: progress(done, total, message).
+_PROGRESS_ARG = "progress"
+# Request context parameter of every registered wrapper.
+_CONTEXT_ARG = "ctx"
+# Schema of the ``timeout`` argument every registered tool accepts.
+_TIMEOUT_SCHEMA = {
+    "type": "number",
+    "description": "Time limit in seconds, overriding the configured one.",
+}
+
+# Class attribute opting a tool into the result cache (TTL in seconds).
+_CACHE_TTL_ATTR = "cache_ttl"
+# Class attribute a tool sets to False when identical concurrent calls
+# must each execute (e.g. calls with side effects).
+_COALESCE_ATTR = "coalesce"
+# Class attribute declaring a tool's input schema instead of inferring it.
+_INPUT_SCHEMA_ATTR = "input_schema"
+
+# Shared by registrations that do not bring their own dispatcher.
+_DEFAULT_DISPATCHER = Dispatcher()
+
+# Registered tool wrappers per server, called by the batch meta-tool.
+_ToolCall = Callable[..., Awaitable[dict[str, Any]]]
+_CALLS: weakref.WeakKeyDictionary[Any, dict[str, _ToolCall]] = (
+    weakref.WeakKeyDictionary()
+)
+# list_tools entries per server, built when each tool is registered.
+_CATALOGS: weakref.WeakKeyDictionary[Any, dict[str, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+# What registration derives from each tool, reused by later passes.
+_DESCRIPTIONS: weakref.WeakKeyDictionary[Any, _Description] = (
+    weakref.WeakKeyDictionary()
+)
+# Value FastMCP passes for an optional argument the client left out;
+# dropped before the call so the tool's own default applies.
+_OMITTED: Any = object()
+# Concurrent entries of a batch when no settings are given.
+_BATCH_PARALLELISM = 8
+
 
 @runtime_checkable
 class ToolLike(Protocol):
@@ -34,15 +118,94 @@ class ToolLike(Protocol):
         ...
 
 
-def discover_tools() -> dict[str, Any]:
+class _LazyTool:
+    """Load-on-first-call proxy for an ``axm.tools`` entry point.
+
+    Registration only needs the entry-point metadata; the tool class is
+    imported and instantiated the first time :meth:`execute` runs.
+    """
+
+    def __init__(
+        self,
+        ep: importlib.metadata.EntryPoint,
+        doc: str | None = None,
+        params: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self._ep = ep
+        self._tool: Any = None
+        self._lock = threading.Lock()
+        self.doc = doc
+        self.params = params
+
+    @property
+    def name(self) -> str:
+        """Tool name used for MCP registration."""
+        return str(self._ep.name)
+
+    @property
+    def target(self) -> str:
+        """Entry-point target, e.g. ``package.module:ToolClass``."""
+        return str(self._ep.value)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying tool has been instantiated."""
+        return self._tool is not None
+
+    def load(self) -> Any:
+        """Import and instantiate the tool once, thread-safely."""
+        if self._tool is None:
+            with self._lock:
+                if self._tool is None:
+                    self._tool = self._ep.load()()
+                    logger.debug("Loaded lazy tool: %s", self.name)
+        return self._tool
+
+    def execute(self, **kwargs: Any) -> Any:
+        """Load the tool if needed, then delegate to its ``execute``."""
+        return self.load().execute(**kwargs)
+
+
+def discover_tools(
+    *,
+    lazy: bool = False,
+    cache_dir: Path | None = None,
+    specs: Iterable[ToolSpec] | None = None,
+) -> dict[str, Any]:
     """Discover and instantiate all AXMTool entry points.
 
+    Args:
+        lazy: Build load-on-first-call proxies from entry-point metadata
+            instead of importing every tool up front. Broken entry points
+            then surface on their first call rather than at startup.
+        cache_dir: Read entry points from the persistent discovery cache
+            in this directory instead of scanning distribution metadata.
+        specs: Entry points already scanned by ``scan_entry_points()``
+            (*cache_dir* is then ignored).
+
     Returns:
-        Dict mapping tool name → tool instance.
+        Dict mapping tool name → tool instance (or lazy proxy).
     """
     tools: dict[str, Any] = {}
+    by_name: dict[str, ToolSpec] = {}
 
-    for ep in importlib.metadata.entry_points(group=_EP_GROUP):
+    if specs is None and cache_dir is not None:
+        specs = load_specs(_EP_GROUP, cache_dir)
+    if specs is None:
+        entry_points = list(importlib.metadata.entry_points(group=_EP_GROUP))
+    else:
+        by_name = {spec.name: spec for spec in specs}
+        entry_points = [spec.entry_point(_EP_GROUP) for spec in by_name.values()]
+
+    for ep in entry_points:
+        if lazy:
+            spec = by_name.get(ep.name)
+            tools[ep.name] = (
+                _LazyTool(ep, doc=spec.doc, params=spec.params)
+                if spec is not None
+                else _LazyTool(ep)
+            )
+            continue
         try:
             tool_cls = ep.load()
             tool = tool_cls()
@@ -58,65 +221,738 @@ def discover_tools() -> dict[str, Any]:
     return tools
 
 
+def scan_entry_points(*, cache_dir: Path | None = None) -> list[ToolSpec]:
+    """Describe the installed ``axm.tools`` entry points.
+
+    Args:
+        cache_dir: Go through the persistent discovery cache in this
+            directory (specs then carry docstrings and signatures).
+
+    Returns:
+        One spec per entry point, with its distribution's version.
+    """
+    if cache_dir is not None:
+        return load_specs(_EP_GROUP, cache_dir)
+    return scan_specs(_EP_GROUP)
+
+
+@dataclass
+class ToolChanges:
+    """Outcome of :func:`reload_tools`.
+
+    Attributes:
+        tools: The new tool mapping: previous instances for unchanged
+            tools, fresh ones for added and changed tools.
+        specs: Specs of the tools in the new mapping, by name.
+        added: Tools with a new entry point.
+        changed: Tools whose target or distribution version changed.
+        removed: Tools whose entry point is gone.
+        failed: Added or changed tools that could not be loaded, with the
+            error; a changed tool keeps its previous instance.
+    """
+
+    tools: dict[str, Any]
+    specs: dict[str, ToolSpec]
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready summary (without the tools)."""
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "failed": self.failed,
+            "count": len(self.tools),
+        }
+
+
+def reload_tools(
+    tools: dict[str, Any],
+    specs: dict[str, ToolSpec],
+    *,
+    cache_dir: Path | None = None,
+) -> ToolChanges:
+    """Re-scan entry points and load only the added and changed tools.
+
+    A tool is unchanged when its entry-point target and distribution
+    version match *specs*; a tool missing from *specs* (version unknown)
+    is kept as is. Versions are compared from distribution metadata
+    alone; the modules an upgraded distribution installs (per its
+    ``RECORD``) are then dropped from ``sys.modules`` before anything is
+    imported, so its tools (and the discovery cache, rebuilt from them)
+    see the new code. Modules of other distributions, including those
+    sharing a namespace package with it, are left alone. The previous
+    instances keep running the calls they have in flight.
+
+    Args:
+        tools: Current tool mapping (not modified).
+        specs: Specs *tools* were built from, by name.
+        cache_dir: Scan through the discovery cache in this directory.
+
+    Returns:
+        The new mapping and what changed.
+    """
+    importlib.invalidate_caches()
+    scanned = {spec.name: spec for spec in scan_specs(_EP_GROUP)}
+    upgraded = {
+        name
+        for name, spec in scanned.items()
+        if name in tools and name in specs and specs[name].version != spec.version
+    }
+    if upgraded:
+        _forget_modules(_installed_modules(upgraded))
+    fresh = scanned
+    if cache_dir is not None:
+        fresh = {spec.name: spec for spec in load_specs(_EP_GROUP, cache_dir)}
+    changes = ToolChanges(tools={}, specs={})
+    changes.removed = sorted(tools.keys() - fresh.keys())
+    for name, spec in fresh.items():
+        old = specs.get(name)
+        if name in tools and (old is None or _same_tool(old, spec)):
+            changes.tools[name] = tools[name]
+            changes.specs[name] = spec
+            continue
+        try:
+            tool = spec.entry_point(_EP_GROUP).load()()
+        except Exception as exc:
+            logger.warning("Failed to reload tool: %s", name, exc_info=True)
+            changes.failed[name] = f"{type(exc).__name__}: {exc}"
+            if name in tools:
+                changes.tools[name] = tools[name]
+                changes.specs[name] = old or spec
+            continue
+        (changes.changed if name in tools else changes.added).append(name)
+        changes.tools[name] = tool
+        changes.specs[name] = spec
+    logger.info(
+        "Reloaded tools: %d added, %d changed, %d removed",
+        len(changes.added),
+        len(changes.changed),
+        len(changes.removed),
+    )
+    return changes
+
+
+def _same_tool(old: ToolSpec, new: ToolSpec) -> bool:
+    return old.target == new.target and old.version == new.version
+
+
+def _installed_modules(names: set[str]) -> set[str]:
+    """Modules installed by the distributions declaring entry points *names*.
+
+    Read from each distribution's ``RECORD``; without one, the entry
+    point's own module and its submodules are used instead.
+    """
+    modules: set[str] = set()
+    for ep in importlib.metadata.entry_points(group=_EP_GROUP):
+        if ep.name not in names:
+            continue
+        files = ep.dist.files if ep.dist is not None else None
+        if files:
+            modules.update(_record_modules(files))
+            continue
+        module = ep.value.partition(":")[0].strip()
+        prefix = f"{module}."
+        modules.update(m for m in sys.modules if m == module or m.startswith(prefix))
+    return modules
+
+
+def _record_modules(files: Iterable[importlib.metadata.PackagePath]) -> set[str]:
+    """Importable module names of the files listed in a ``RECORD``."""
+    modules = set()
+    for path in files:
+        name = inspect.getmodulename(path.name)
+        packages = path.parts[:-1]
+        if name is None or not all(p.isidentifier() for p in (*packages, name)):
+            continue  # scripts, data, metadata and __pycache__ files
+        module = ".".join(packages if name == "__init__" else (*packages, name))
+        if module:
+            modules.add(module)
+    return modules
+
+
+def _forget_modules(modules: set[str]) -> None:
+    """Drop *modules* from ``sys.modules`` so they are imported afresh."""
+    for module in modules:
+        sys.modules.pop(module, None)
+    logger.debug("Dropped %d cached modules", len(modules))
+
+
+def accepts_argument(tool: Any, name: str) -> bool:
+    """Whether *tool*'s ``execute`` declares a parameter called *name*.
+
+    Only explicitly named parameters count — a bare ``**kwargs`` accepts
+    anything and says nothing about what the tool understands. Lazy
+    proxies answer from cached metadata without importing the tool.
+    """
+    tool = _unwrap(tool)
+    if isinstance(tool, _LazyTool):
+        return any(
+            param["name"] == name and param["kind"] != "var_keyword"
+            for param in tool.params or ()
+        )
+    try:
+        param = inspect.signature(tool.execute).parameters.get(name)
+    except (TypeError, ValueError):
+        return False
+    return param is not None and param.kind not in (
+        param.VAR_KEYWORD,
+        param.VAR_POSITIONAL,
+    )
+
+
 def register_tools(
     mcp: Any,
     tools: dict[str, Any],
     extra_tools: dict[str, str] | None = None,
+    dispatcher: Dispatcher | None = None,
+    settings: Settings | None = None,
+    result_cache: ResultCache | None = None,
+    pages: Paginator | None = None,
+    metrics: Metrics | None = None,
+    *,
+    update: ToolChanges | None = None,
 ) -> None:
     """Register discovered tools as MCP tool callables.
 
-    Each tool becomes a callable ``tool_name(**kwargs) -> dict``
-    that delegates to ``tool.execute(**kwargs)``.
+    Each tool becomes an async callable ``tool_name(**kwargs) -> dict``
+    that runs ``tool.execute(**kwargs)`` on the dispatcher's thread pool,
+    advertising the input schema inferred from ``execute`` (see
+    :mod:`axm_mcp.schema`). Calls accept an optional ``timeout`` argument
+    (seconds) overriding the configured per-tool limit. The ``batch``
+    meta-tool, registered next to ``list_tools``, runs many such calls in
+    one round trip. ``list_tools`` answers from a catalog of descriptions
+    and schemas built here, once per registration.
 
     Args:
         mcp: FastMCP server instance.
         tools: Dict from discover_tools().
         extra_tools: Optional dict of manually-registered tool names
             to their descriptions (for list_tools inclusion).
+        dispatcher: Runs tool calls off the event loop (a shared
+            default is used when omitted).
+        settings: Source of per-tool time limits and cached tools.
+        result_cache: Cache for tools that opt in through ``cache_ttl``
+            or ``settings.cache_tools`` (nothing is cached if omitted).
+        pages: Response budget applied to every tool result (results
+            are returned whole if omitted).
+        metrics: Registry recording every call; also registers the
+            ``metrics`` meta-tool.
+        update: Apply a :func:`reload_tools` outcome to a server set up
+            by a previous call instead: removed tools are unregistered,
+            added and changed ones (re-)registered and ``list_tools``
+            replaced to list *tools*; the other tools keep their
+            registration. The server must not yield in between, so run
+            this on the event loop for clients to see one consistent
+            listing.
     """
-    for name, tool in tools.items():
-        _register_one(mcp, name, tool)
+    names: Iterable[str] = tools
+    calls = _CALLS.setdefault(mcp, {})
+    catalog = _CATALOGS.setdefault(mcp, {})
+    if update is not None:
+        names = [*update.added, *update.changed]
+        for name in [*update.removed, *names, "list_tools"]:
+            calls.pop(name, None)
+            catalog.pop(name, None)
+            with contextlib.suppress(ToolError):
+                mcp.remove_tool(name)
+    for name in names:
+        tool = tools[name]
+        timeout = settings.timeout_for(name) if settings is not None else None
+        description = _describe(name, tool)
+        catalog[name] = description.entry
+        calls[name] = _register_one(
+            mcp,
+            name,
+            tool,
+            dispatcher,
+            timeout=timeout,
+            cache=result_cache,
+            cache_ttl=_cache_ttl(name, tool, settings),
+            pages=pages,
+            metrics=metrics,
+            description=description,
+        )
         logger.info("Registered MCP tool: %s", name)
 
-    # Register the `list_tools` meta-tool
-    _register_list_tools(mcp, tools, extra_tools or {})
+    # Register the `list_tools`, `batch` and `metrics` meta-tools
+    _register_list_tools(mcp, tools, extra_tools or {}, catalog)
+    if update is not None:
+        return
+    parallelism = settings.batch_parallelism if settings else _BATCH_PARALLELISM
+    _register_batch(mcp, calls, parallelism, pages, metrics)
+    if metrics is not None:
+        _register_metrics(mcp, metrics)
+
+
+def _register_one(
+    mcp: Any,
+    name: str,
+    tool: Any,
+    dispatcher: Dispatcher | None = None,
+    *,
+    timeout: float | None = None,
+    cache: ResultCache | None = None,
+    cache_ttl: float | None = None,
+    pages: Paginator | None = None,
+    metrics: Metrics | None = None,
+    description: _Description | None = None,
+) -> _ToolCall:
+    """Register a single tool, capturing in closure.
+
+    The wrapper advertises the tool's input schema (from *description*,
+    looked up when omitted). Tools whose ``execute``
+    takes ``**kwargs`` advertise a single open ``kwargs`` object instead.
+    Arguments are checked and coerced against the schema, by a validator
+    compiled once per tool, before anything else runs; rejected calls return
+    ``{"success": false, "error": "Invalid arguments ..."}``.
+
+    When a call exceeds its time limit the client gets an error result,
+    tools accepting ``cancel_event`` see it set, and out-of-process
+    proxies exposing ``recycle()`` have their workers replaced.
 
+    In-process tools accepting ``progress`` get a callback forwarding to
+    MCP progress notifications when the client asked for them.
 
-def _register_one(mcp: Any, name: str, tool: Any) -> None:
-    """Register a single tool, capturing in closure."""
+    With a *cache* and a *cache_ttl* (0 never expires), successful
+    results are cached per canonical arguments and responses carry
+    ``_meta.cache`` (``hit`` or ``miss``).
 
-    @mcp.tool(name=name)  # type: ignore[untyped-decorator]
-    def _wrapper(**kwargs: Any) -> dict[str, Any]:
+    Identical concurrent calls are coalesced onto one execution unless
+    the tool sets ``coalesce = False``; the time limit of the call that
+    started the execution applies to all of them.
+
+    With *pages*, large lists in the result are cut to fit the response
+    budget; results are cached and shared whole.
+
+    With *metrics*, every call is timed and counted under *name*; a
+    result with ``success: false`` counts as an error. Each call is
+    traced as an ``mcp.call`` span when tracing is on.
+    """
+    store = cache if cache_ttl is not None else None
+    flights = SingleFlight() if _coalesces(tool) else None
+    runner = dispatcher or _DEFAULT_DISPATCHER
+    recycle = getattr(type(tool), "recycle", None)
+    # Events and callbacks cannot cross a process boundary; recycling
+    # replaces cancellation there.
+    cancellable = recycle is None and accepts_argument(tool, _CANCEL_ARG)
+    reports = recycle is None and accepts_argument(tool, _PROGRESS_ARG)
+    passes_timeout = accepts_argument(tool, _TIMEOUT_ARG)
+    description = description or _describe(name, tool)
+    entry = description.entry
+    closed = description.signature is not None
+    validate = description.validate
+
+    async def _wrapper(
+        ctx: Context | None = None,  # type: ignore[type-arg]
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        if closed:
+            kwargs = {k: v for k, v in kwargs.items() if v is not _OMITTED}
         # MCP may wrap args as kwargs={"key": "val"} — unwrap.
         if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
             kwargs = kwargs["kwargs"]
-        result = tool.execute(**kwargs)
+        with tracing.span("mcp.call", tool=name) as span:
+            if metrics is None:
+                output = await _serve(ctx, kwargs)
+            else:
+                with metrics.observe(name) as call:
+                    output = await _serve(ctx, kwargs)
+                    call.error = output.get("success") is False
+            if span is not None:
+                span.set("success", output.get("success") is not False)
+        return output
+
+    async def _serve(
+        ctx: Context | None,  # type: ignore[type-arg]
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        reporter = None
+        if reports:
+            kwargs.pop(_PROGRESS_ARG, None)
+            reporter = reporter_for(ctx)
+        if validate is not None:
+            try:
+                kwargs = validate(kwargs)
+            except ArgumentError as exc:
+                return {
+                    "success": False,
+                    "error": f"Invalid arguments for '{name}': {exc}",
+                }
+        limit = timeout
+        if _TIMEOUT_ARG in kwargs:
+            raw = kwargs[_TIMEOUT_ARG] if passes_timeout else kwargs.pop(_TIMEOUT_ARG)
+            try:
+                limit = as_seconds(raw)
+            except ValueError as exc:
+                return {"success": False, "error": str(exc)}
+
+        shared = store is not None or flights is not None
+        key = canonical_key(name, kwargs) if shared else None
+        if store is not None and key is not None:
+            hit = store.get(key, memory_only=True)
+            if hit is None:
+                hit = await runner.run_sync(store.get, key)
+            if hit is not None:
+                return _budget({**hit, "_meta": {"cache": "hit"}})
+
+        if key is None:
+            output = await _execute(kwargs, limit, reporter)
+        elif flights is None:
+            output = dict(await _settle(key, kwargs, limit, reporter))
+        else:
+            # Only the call that starts the execution receives progress
+            flight = await flights.run(
+                key, lambda: _settle(key, kwargs, limit, reporter)
+            )
+            output = dict(flight)
+        if store is not None and key is not None:
+            output["_meta"] = {"cache": "miss"}
+        return _budget(output)
+
+    def _budget(output: dict[str, Any]) -> dict[str, Any]:
+        return pages.apply(output) if pages is not None else output
+
+    async def _settle(
+        key: str,
+        kwargs: dict[str, Any],
+        limit: float | None,
+        reporter: ProgressReporter | None,
+    ) -> dict[str, Any]:
+        """Execute once and store a successful result (shared by waiters)."""
+        output = await _execute(kwargs, limit, reporter)
+        if store is not None and output["success"]:
+            await runner.run_sync(store.set, key, output, cache_ttl or None)
+        return output
+
+    async def _execute(
+        kwargs: dict[str, Any],
+        limit: float | None,
+        reporter: ProgressReporter | None,
+    ) -> dict[str, Any]:
+        if reporter is not None:
+            kwargs[_PROGRESS_ARG] = reporter
+        cancel = threading.Event() if cancellable and limit is not None else None
+        if cancel is not None:
+            kwargs[_CANCEL_ARG] = cancel
+        try:
+            result = await runner.run_with_timeout(limit, tool.execute, **kwargs)
+        except ToolTimeoutError as exc:
+            logger.warning("Tool '%s' %s", name, exc)
+            if cancel is not None:
+                cancel.set()
+            if recycle is not None:
+                recycle(tool)
+            return {
+                "success": False,
+                "error": f"Tool '{name}' {exc}",
+                "timeout": exc.seconds,
+            }
         output: dict[str, Any] = {"success": result.success, **result.data}
         if result.error:
             output["error"] = result.error
         return output
 
-    # Give the wrapper a useful docstring from the tool class
-    _wrapper.__doc__ = tool.execute.__doc__ or f"Execute {name} tool."
+    # Give the wrapper a useful docstring and the tool's real arguments
+    _wrapper.__doc__ = entry["description"]
+    if closed:
+        _wrapper.__signature__ = description.signature  # type: ignore[attr-defined]
+    mcp.tool(name=name)(_wrapper)
+    return cast(_ToolCall, _wrapper)
+
+
+@dataclass(frozen=True)
+class _Description:
+    """A tool's catalog entry, validator and wrapper signature.
+
+    Attributes:
+        entry: The tool's :func:`catalog_entry`.
+        validate: Validator compiled from the entry's schema, or None
+            when it accepts any object.
+        signature: Wrapper signature advertising the schema, or None
+            for open schemas.
+    """
+
+    entry: dict[str, Any]
+    validate: Validator | None
+    signature: inspect.Signature | None
+
+
+def _describe(name: str, tool: Any) -> _Description:
+    """Describe *tool* for registration, once per tool object.
+
+    Later ``register_tools`` passes over the same tools (another server,
+    a reload keeping them) reuse the description.
+    """
+    try:
+        description = _DESCRIPTIONS.get(tool)
+    except TypeError:  # not weak-referenceable
+        description = None
+    if description is not None and description.entry["name"] == name:
+        return description
+    entry = catalog_entry(name, tool)
+    schema = entry["input_schema"]
+    description = _Description(
+        entry=entry,
+        validate=compile_validator(schema),
+        signature=_signature(schema) if "properties" in schema else None,
+    )
+    with contextlib.suppress(TypeError):
+        _DESCRIPTIONS[tool] = description
+    return description
+
+
+def catalog_entry(name: str, tool: Any) -> dict[str, Any]:
+    """``list_tools`` entry of *tool*: name, description, input schema.
+
+    The description is the ``execute`` docstring minus its ``Args:``
+    section, which the schema's property descriptions carry instead.
+    A tool class may declare its schema as an ``input_schema`` attribute;
+    otherwise it is inferred from ``execute``. Lazy proxies are described
+    from cached metadata without an import; tools whose arguments are
+    unknown or open (``**kwargs``) get a schema accepting any object.
+    """
+    doc = _execute_doc(tool)
+    params = _tool_params(tool)
+    schema = _declared_schema(tool)
+    if schema is None and params is not None:
+        schema = input_schema(
+            params, doc, skip=(_CANCEL_ARG, _PROGRESS_ARG, _CONTEXT_ARG)
+        )
+    if schema is not None and "properties" in schema:
+        schema["properties"].setdefault(_TIMEOUT_ARG, dict(_TIMEOUT_SCHEMA))
+    return {
+        "name": name,
+        "description": split_docstring(doc)[0] or f"Execute {name} tool.",
+        "input_schema": schema or {"type": "object"},
+    }
+
+
+def _declared_schema(tool: Any) -> dict[str, Any] | None:
+    """Copy of the schema *tool*'s class declares, if any."""
+    tool = _unwrap(tool)
+    if isinstance(tool, _LazyTool):
+        return None
+    declared = getattr(type(tool), _INPUT_SCHEMA_ATTR, None)
+    if not isinstance(declared, dict):
+        return None
+    schema = dict(declared)
+    if isinstance(schema.get("properties"), dict):
+        schema["properties"] = dict(schema["properties"])
+    else:
+        schema.pop("properties", None)
+    return schema
+
+
+def _tool_params(tool: Any) -> list[dict[str, Any]] | None:
+    """Parameters of *tool*'s ``execute``, or None when unknown."""
+    tool = _unwrap(tool)
+    if isinstance(tool, _LazyTool):
+        # Specs scanned without importing carry neither doc nor params
+        return tool.params if tool.params or tool.doc else None
+    return describe_params(tool.execute)
+
+
+def _signature(schema: dict[str, Any]) -> inspect.Signature:
+    """Wrapper signature from which FastMCP derives *schema*.
+
+    Values are not validated here (every annotation is ``Any``); left
+    out optional arguments arrive as ``_OMITTED``. Required arguments
+    stay required so the advertised schema lists them; FastMCP therefore
+    rejects a call missing one, before the compiled validator runs. A
+    hidden ``kwargs`` argument keeps accepting calls wrapped as
+    ``{"kwargs": {...}}``, which is only possible for tools without
+    required arguments.
+    """
+    keyword = inspect.Parameter.KEYWORD_ONLY
+    required = set(schema.get("required", ()))
+    params = [
+        inspect.Parameter(
+            _CONTEXT_ARG,
+            keyword,
+            default=None,
+            annotation=Context | None,
+        )
+    ]
+    for name, prop in schema["properties"].items():
+        if name in required:
+            annotation: Any = Annotated[Any, WithJsonSchema(prop)]
+        else:
+            annotation = Annotated[
+                Any, WithJsonSchema(prop), Field(default_factory=_omitted)
+            ]
+        params.append(inspect.Parameter(name, keyword, annotation=annotation))
+    if "kwargs" not in schema["properties"]:
+        hidden: Any = SkipJsonSchema[  # type: ignore[misc]
+            Annotated[Any, Field(default_factory=_omitted)]
+        ]
+        params.append(inspect.Parameter("kwargs", keyword, annotation=hidden))
+    return inspect.Signature(params, return_annotation=dict[str, Any])
+
+
+def _omitted() -> Any:
+    return _OMITTED
+
+
+def _cache_ttl(name: str, tool: Any, settings: Settings | None) -> float | None:
+    """Result-cache TTL for a tool, or None when it is not cached.
+
+    Configuration wins over the tool's own ``cache_ttl``; lazy proxies
+    are only cached by configuration, to keep them unimported.
+    """
+    if settings is not None and name in settings.cache_tools:
+        return settings.cache_tools[name]
+    tool = _unwrap(tool)
+    if isinstance(tool, _LazyTool):
+        return None
+    ttl = getattr(type(tool), _CACHE_TTL_ATTR, None)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+        return None
+    return float(ttl)
+
+
+def _coalesces(tool: Any) -> bool:
+    """Whether identical concurrent calls of *tool* may share one run."""
+    tool = _unwrap(tool)
+    if isinstance(tool, _LazyTool):
+        return True
+    return getattr(type(tool), _COALESCE_ATTR, True) is not False
+
+
+def _unwrap(tool: Any) -> Any:
+    """Follow ``__wrapped__`` from execution proxies to the real tool."""
+    while (inner := getattr(tool, "__wrapped__", None)) is not None:
+        tool = inner
+    return tool
+
+
+def _execute_doc(tool: Any) -> str:
+    """Return the tool's ``execute`` docstring without forcing a lazy load."""
+    tool = _unwrap(tool)
+    if isinstance(tool, _LazyTool):
+        return tool.doc or ""
+    return tool.execute.__doc__ or ""
+
+
+def _register_metrics(mcp: Any, metrics: Metrics) -> None:
+    """Register the metrics meta-tool."""
+
+    @mcp.tool(name="metrics")  # type: ignore[untyped-decorator]
+    def _metrics(**kwargs: Any) -> dict[str, Any]:
+        """Call counts, errors, in-flight calls and latency per tool.
+
+        Args:
+            format: ``json`` (default) or ``prometheus`` for the text
+                exposition format under ``text``.
+        """
+        if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
+            kwargs = kwargs["kwargs"]
+        if kwargs.get("format") == "prometheus":
+            return {"text": metrics.prometheus()}
+        return metrics.snapshot()
+
+    logger.info("Registered meta-tool: metrics")
+
+
+def _register_batch(
+    mcp: Any,
+    calls: dict[str, _ToolCall],
+    parallelism: int,
+    pages: Paginator | None,
+    metrics: Metrics | None,
+) -> None:
+    """Register the batch meta-tool over the tool wrappers in *calls*."""
+
+    @mcp.tool(name="batch")  # type: ignore[untyped-decorator]
+    async def _batch(**kwargs: Any) -> dict[str, Any]:
+        """Run many tool calls in one round trip.
+
+        Args:
+            calls: List of ``{"tool": name, "args": {...}}`` entries.
+            parallelism: Entries run at once (default and maximum set by
+                ``AXM_MCP_BATCH_PARALLELISM``).
+
+        Returns ``results`` in the order of *calls*, each the tool's own
+        response plus its ``tool`` name; an entry that cannot run gets
+        ``success: false`` and an ``error`` without affecting the others.
+        Time limits, caching and coalescing apply per entry.
+        """
+        if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
+            kwargs = kwargs["kwargs"]
+        entries = kwargs.get("calls")
+        if not isinstance(entries, list):
+            return {"success": False, "error": "calls must be a list"}
+        try:
+            limit = int(kwargs.get("parallelism", parallelism))
+        except (TypeError, ValueError):
+            return {"success": False, "error": "parallelism must be an integer"}
+        slots = asyncio.Semaphore(max(1, min(limit, parallelism)))
+
+        async def run(entry: Any) -> dict[str, Any]:
+            if not isinstance(entry, dict) or not isinstance(entry.get("tool"), str):
+                return {"success": False, "error": "Entry needs a tool name"}
+            name, args = entry["tool"], entry.get("args") or {}
+            call = calls.get(name)
+            if call is None:
+                return {
+                    "tool": name,
+                    "success": False,
+                    "error": f"Unknown tool: {name}",
+                }
+            if not isinstance(args, dict):
+                return {
+                    "tool": name,
+                    "success": False,
+                    "error": "args must be an object",
+                }
+            async with slots:
+                try:
+                    output = await call(**args)
+                except Exception as exc:
+                    logger.warning("Batch entry '%s' failed", name, exc_info=True)
+                    output = {"success": False, "error": f"{type(exc).__name__}: {exc}"}
+            return {"tool": name, **output}
+
+        with tracing.span("mcp.call", tool="batch", entries=len(entries)):
+            if metrics is None:
+                results = await asyncio.gather(*(run(e) for e in entries))
+            else:
+                with metrics.observe("batch"):
+                    results = await asyncio.gather(*(run(e) for e in entries))
+        failed = sum(result.get("success") is False for result in results)
+        output = {"results": results, "count": len(results), "failed": failed}
+        return pages.apply(output) if pages is not None else output
+
+    logger.info("Registered meta-tool: batch")
 
 
 def _register_list_tools(
     mcp: Any,
     tools: dict[str, Any],
     extra_tools: dict[str, str],
+    catalog: dict[str, dict[str, Any]] | None = None,
 ) -> None:
-    """Register the list_tools meta-tool."""
+    """Register the list_tools meta-tool over a listing built now.
+
+    *catalog* holds the tools' :func:`catalog_entry` values, as kept by
+    ``register_tools``; missing entries are built here.
+    """
+    catalog = catalog if catalog is not None else {}
+    tool_list = [
+        catalog.get(name) or _describe(name, tool).entry for name, tool in tools.items()
+    ]
+    tool_list.extend(
+        {"name": name, "description": desc} for name, desc in extra_tools.items()
+    )
+    tool_list.sort(key=lambda t: t["name"])
+    listing = {"tools": tool_list, "count": len(tool_list)}
 
     @mcp.tool(name="list_tools")  # type: ignore[untyped-decorator]
     def _list_tools(**kwargs: Any) -> dict[str, Any]:
-        """List all available AXM tools with their names and descriptions."""
-        tool_list = []
-        for name, tool in sorted(tools.items()):
-            doc = (tool.execute.__doc__ or "").strip().split("\n")[0]
-            tool_list.append({"name": name, "description": doc})
-        for name, desc in sorted(extra_tools.items()):
-            tool_list.append({"name": name, "description": desc})
-        tool_list.sort(key=lambda t: t["name"])
-        return {"tools": tool_list, "count": len(tool_list)}
+        """List all available AXM tools with descriptions and input schemas."""
+        return dict(listing)
 
     logger.info("Registered meta-tool: list_tools")
@@ -0,0 +1,243 @@
+"""Persistent on-disk cache of tool entry-point metadata.
+
+Scanning ``importlib.metadata.entry_points()`` reads every installed
+distribution's metadata, which is slow in large virtualenvs. This module
+stores what registration needs — tool names, entry-point targets,
+``execute`` docstrings and signatures — in a JSON file keyed on a
+fingerprint of the installed distributions. Warm starts compare the
+fingerprint and skip the metadata walk entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "ToolSpec",
+    "describe_params",
+    "distributions_fingerprint",
+    "load_specs",
+    "scan_specs",
+]
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILE = "discovery.json"
+_CACHE_VERSION = 2
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Registration metadata for one ``axm.tools`` entry point.
+
+    Attributes:
+        name: Entry-point name, used as the MCP tool name.
+        target: Entry-point target, e.g. ``package.module:ToolClass``.
+        doc: Docstring of the tool's ``execute`` method.
+        params: ``execute`` parameters as JSON-friendly dicts with
+            ``name``, ``kind``, ``annotation``, ``required`` and, when
+            JSON-serializable, ``default``.
+        version: Version of the distribution providing the entry point
+            (empty when unknown).
+    """
+
+    name: str
+    target: str
+    doc: str = ""
+    params: list[dict[str, Any]] = field(default_factory=list)
+    version: str = ""
+
+    def entry_point(self, group: str) -> importlib.metadata.EntryPoint:
+        """Rebuild the entry point without touching distribution metadata."""
+        return importlib.metadata.EntryPoint(
+            name=self.name, value=self.target, group=group
+        )
+
+
+def distributions_fingerprint(paths: Iterable[str] | None = None) -> str:
+    """Hash the installed distributions visible on *paths*.
+
+    Only directory listings and one ``stat`` per distribution are needed:
+    ``*.dist-info`` names carry the distribution name and version, and the
+    ``RECORD`` mtime changes whenever a package is (re)installed.
+
+    Args:
+        paths: Import paths to scan (defaults to ``sys.path``).
+
+    Returns:
+        Hex digest that changes when any distribution changes.
+    """
+    digest = hashlib.sha256()
+    for entry in sys.path if paths is None else paths:
+        digest.update(f"path:{entry}\n".encode())
+        try:
+            with os.scandir(entry or ".") as it:
+                names = sorted(
+                    e.name for e in it if e.name.endswith(_METADATA_SUFFIXES)
+                )
+        except OSError:
+            continue
+        for name in names:
+            dist_dir = os.path.join(entry or ".", name)
+            record = os.path.join(dist_dir, "RECORD")
+            try:
+                mtime = os.stat(record if os.path.exists(record) else dist_dir)
+            except OSError:
+                continue
+            digest.update(f"{name}:{mtime.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def load_specs(group: str, cache_dir: Path) -> list[ToolSpec]:
+    """Return tool specs for *group*, from cache when still valid.
+
+    On a fingerprint mismatch (or a missing/corrupt cache) the entry
+    points are scanned, each tool class is imported to read its
+    ``execute`` docstring and signature, and the cache is rewritten.
+
+    Args:
+        group: Entry-point group to scan, e.g. ``axm.tools``.
+        cache_dir: Directory holding the cache file.
+
+    Returns:
+        One spec per entry point, in discovery order.
+    """
+    fingerprint = distributions_fingerprint()
+    cache_file = cache_dir / _CACHE_FILE
+
+    cached = _read_cache(cache_file, group, fingerprint)
+    if cached is not None:
+        logger.debug("Discovery cache hit: %d tools", len(cached))
+        return cached
+
+    specs = [_build_spec(ep) for ep in importlib.metadata.entry_points(group=group)]
+    _write_cache(cache_file, group, fingerprint, specs)
+    logger.debug("Discovery cache rebuilt: %d tools", len(specs))
+    return specs
+
+
+def scan_specs(group: str) -> list[ToolSpec]:
+    """Describe the entry points of *group* from distribution metadata.
+
+    Nothing is imported, so specs carry no ``doc`` or ``params``.
+    """
+    return [
+        ToolSpec(name=ep.name, target=ep.value, version=_dist_version(ep))
+        for ep in importlib.metadata.entry_points(group=group)
+    ]
+
+
+def _read_cache(
+    cache_file: Path,
+    group: str,
+    fingerprint: str,
+) -> list[ToolSpec] | None:
+    """Load cached specs, or None if absent, stale or unreadable."""
+    try:
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _CACHE_VERSION
+        or payload.get("fingerprint") != fingerprint
+        or payload.get("group") != group
+    ):
+        return None
+    try:
+        return [ToolSpec(**raw) for raw in payload["tools"]]
+    except (KeyError, TypeError):
+        return None
+
+
+def _write_cache(
+    cache_file: Path,
+    group: str,
+    fingerprint: str,
+    specs: list[ToolSpec],
+) -> None:
+    """Atomically write the cache file; failures are logged, not raised."""
+    payload = {
+        "version": _CACHE_VERSION,
+        "group": group,
+        "fingerprint": fingerprint,
+        "tools": [asdict(spec) for spec in specs],
+    }
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        logger.warning("Could not write discovery cache: %s", cache_file)
+        tmp.unlink(missing_ok=True)
+
+
+def _build_spec(ep: importlib.metadata.EntryPoint) -> ToolSpec:
+    """Import the tool class behind *ep* and describe its ``execute``."""
+    try:
+        tool_cls = ep.load()
+        execute = tool_cls.execute
+    except Exception:
+        logger.warning("Failed to inspect tool entry point: %s", ep.name, exc_info=True)
+        return ToolSpec(name=ep.name, target=ep.value, version=_dist_version(ep))
+    return ToolSpec(
+        name=ep.name,
+        target=ep.value,
+        doc=inspect.getdoc(execute) or "",
+        params=describe_params(execute),
+        version=_dist_version(ep),
+    )
+
+
+def _dist_version(ep: importlib.metadata.EntryPoint) -> str:
+    """Version of the distribution declaring *ep*, or "" if unknown."""
+    dist = getattr(ep, "dist", None)
+    return str(dist.version) if dist is not None else ""
+
+
+def describe_params(func: Any) -> list[dict[str, Any]]:
+    """Describe *func*'s parameters (minus ``self``) as JSON-friendly dicts."""
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return []
+
+    params: list[dict[str, Any]] = []
+    for param in signature.parameters.values():
+        if param.name == "self" or param.kind is param.VAR_POSITIONAL:
+            continue
+        entry: dict[str, Any] = {
+            "name": param.name,
+            "kind": param.kind.name.lower(),
+            "annotation": _annotation_str(param.annotation),
+            "required": param.default is param.empty
+            and param.kind is not param.VAR_KEYWORD,
+        }
+        if param.default is not param.empty and isinstance(
+            param.default, _JSON_SCALARS
+        ):
+            entry["default"] = param.default
+        params.append(entry)
+    return params
+
+
+def _annotation_str(annotation: Any) -> str | None:
+    """Render an annotation as source text (None when absent)."""
+    if annotation is inspect.Parameter.empty:
+        return None
+    if isinstance(annotation, str):
+        return annotation
+    return inspect.formatannotation(annotation)
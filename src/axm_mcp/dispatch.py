@@ -0,0 +1,130 @@
+"""Tool dispatch — run synchronous tool code off the event loop.
+
+AXM tools implement a synchronous ``execute``. Registered MCP handlers
+are async and hand each call to a shared, bounded thread pool, so one
+slow audit or PDF download no longer blocks every other request the
+server is handling.
+
+Calls can be bounded with a timeout. Python cannot kill a thread, so a
+call that overruns is abandoned: the caller gets :class:`ToolTimeoutError`
+and the pool it is stuck in is retired, so later calls get a fresh pool
+at full capacity while the stuck thread finishes (or hangs) on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from axm_mcp import tracing
+
+__all__ = ["Dispatcher", "ToolTimeoutError"]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ToolTimeoutError(TimeoutError):
+    """A dispatched call did not finish within its time limit.
+
+    Args:
+        seconds: The time limit that was exceeded.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        super().__init__(f"timed out after {seconds:g}s")
+        self.seconds = seconds
+
+
+class Dispatcher:
+    """Runs blocking tool calls on a managed thread pool.
+
+    The pool is created on first use, so building a dispatcher is free.
+
+    Args:
+        max_workers: Pool size; ``None`` uses the ``ThreadPoolExecutor``
+            default (``min(32, cpu_count + 4)``).
+        thread_name_prefix: Prefix of the pool's thread names.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, *, thread_name_prefix: str = "axm-tool"
+    ) -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool, created on first access."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+        return self._executor
+
+    async def run_sync(
+        self,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Await ``func(*args, **kwargs)`` executed on the thread pool."""
+        loop = asyncio.get_running_loop()
+        call = tracing.bind(functools.partial(func, *args, **kwargs))
+        return await loop.run_in_executor(self.executor, call)
+
+    async def run_with_timeout(
+        self,
+        timeout: float | None,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Like :meth:`run_sync`, but give up after *timeout* seconds.
+
+        Raises:
+            ToolTimeoutError: If the call is still running at the deadline.
+        """
+        if timeout is None:
+            return await self.run_sync(func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        call = tracing.bind(functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(executor, call), timeout)
+        except TimeoutError:
+            self.retire(executor)
+            raise ToolTimeoutError(timeout) from None
+
+    def retire(self, executor: ThreadPoolExecutor) -> None:
+        """Replace *executor*, leaving its threads to drain in the background.
+
+        Work already queued on it still runs; later calls get a new pool.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+        logger.warning(
+            "Retired pool %r holding a timed-out call", self.thread_name_prefix
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the pool; a later call transparently starts a new one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
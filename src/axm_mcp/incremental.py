@@ -0,0 +1,369 @@
+"""Incremental verify — re-check only what changed since the last run.
+
+Keeps, per project root, the file-hash index of the previous run, its
+raw audit and governance sections and the ``ast_impact`` data of every
+enriched symbol. The next run diffs the index to find changed files,
+then:
+
+- re-runs ``audit`` on just those files when the tool accepts a
+  ``files`` argument, merging per rule with the retained failures
+  (skipped when files were only removed); other audit tools fall back
+  to a full run;
+- re-runs ``init_check`` only when a non-Python file changed or files
+  were added or removed — edits to existing modules keep governance;
+- re-runs ``ast_impact`` only for new symbols and symbols whose
+  failure points at a changed file, reusing retained data otherwise.
+
+Callers of an unchanged symbol can still change when another module
+changes; incremental results trade that precision for speed, and a
+full ``verify`` remains the reference.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from axm_mcp.discovery import accepts_argument
+from axm_mcp.pipeline import Pipeline, Step, run_pipeline
+from axm_mcp.project_index import FileIndex
+from axm_mcp.verify import (
+    FILE_INDEX,
+    enrich_failure,
+    extract_symbols,
+    impact_symbols,
+)
+
+__all__ = ["IncrementalVerifier"]
+
+logger = logging.getLogger(__name__)
+
+# Detail lists whose entries carry a ``file`` key and can be merged.
+_FILE_SCOPED = ("errors", "top_offenders")
+
+
+@dataclass
+class _ProjectState:
+    """What the previous run of one project root left behind."""
+
+    files: dict[str, str]
+    audit: dict[str, Any] | None
+    governance: dict[str, Any] | None
+    impacts: dict[str, dict[str, Any] | None] = field(default_factory=dict)
+
+
+class IncrementalVerifier:
+    """Verify runner that retains results between calls.
+
+    One instance is meant to live for the whole server process; state is
+    kept in memory per resolved project root.
+
+    Args:
+        index: File-hash index used to detect changes (shared with
+            the verify cache by default).
+    """
+
+    def __init__(self, index: FileIndex | None = None) -> None:
+        self._index = index or FILE_INDEX
+        self._states: dict[str, _ProjectState] = {}
+        self._lock = threading.Lock()
+
+    def verify(self, path: str, tools: dict[str, Any]) -> dict[str, Any]:
+        """Verify *path*, re-checking only files changed since last time.
+
+        Args:
+            path: Path to project root.
+            tools: Dict of discovered tools (from ``discover_tools()``).
+
+        Returns:
+            The ``verify_project`` result shape plus an ``incremental``
+            section describing what was re-run.
+        """
+        root = Path(path).resolve()
+        files = self._index.snapshot(root)
+        with self._lock:
+            previous = self._states.get(str(root))
+
+        if previous is None:
+            state, summary = self._full(path, tools, files)
+        else:
+            state, summary = self._update(path, tools, files, previous)
+
+        with self._lock:
+            self._states[str(root)] = state
+        return _render(tools, path, state, summary)
+
+    def forget(self, path: str) -> None:
+        """Drop retained state so the next call runs in full."""
+        with self._lock:
+            self._states.pop(str(Path(path).resolve()), None)
+
+    def _full(
+        self,
+        path: str,
+        tools: dict[str, Any],
+        files: dict[str, str],
+    ) -> tuple[_ProjectState, dict[str, Any]]:
+        audit, governance = _check(tools, path)
+        state = _ProjectState(files=files, audit=audit, governance=governance)
+        state.impacts = impact_symbols(tools, path, _all_symbols(state.audit))
+        summary = {
+            "changed_files": None,
+            "audit": "full",
+            "governance": "full",
+            "symbols_reanalyzed": len(state.impacts),
+        }
+        return state, summary
+
+    def _update(
+        self,
+        path: str,
+        tools: dict[str, Any],
+        files: dict[str, str],
+        previous: _ProjectState,
+    ) -> tuple[_ProjectState, dict[str, Any]]:
+        changed = _changed_files(previous.files, files)
+        if not changed:
+            summary = {
+                "changed_files": [],
+                "audit": "retained",
+                "governance": "retained",
+                "symbols_reanalyzed": 0,
+            }
+            return previous, summary
+
+        subset = _accepts_subset(tools, previous.audit)
+        rerun_governance = _governance_affected(previous.files, files, changed)
+        present = sorted(f for f in changed if f in files)
+
+        audit, governance = _check(
+            tools,
+            path,
+            files=present if subset else None,
+            governance=rerun_governance,
+        )
+        if not rerun_governance:
+            governance = previous.governance
+
+        if subset:
+            # Only deletions: no audit ran, retained entries are trimmed
+            audit = _merge_audit(
+                previous.audit, audit if present else {"failed": []}, changed
+            )
+
+        impacts = _retained_impacts(previous.impacts, audit, changed)
+        missing = [s for s in _all_symbols(audit) if s not in impacts]
+        impacts.update(impact_symbols(tools, path, missing))
+
+        state = _ProjectState(
+            files=files, audit=audit, governance=governance, impacts=impacts
+        )
+        summary = {
+            "changed_files": sorted(changed),
+            "audit": "subset" if subset else "full",
+            "governance": "full" if rerun_governance else "retained",
+            "symbols_reanalyzed": len(set(missing)),
+        }
+        return state, summary
+
+
+def _check(
+    tools: dict[str, Any],
+    path: str,
+    *,
+    files: list[str] | None = None,
+    governance: bool = True,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Run ``audit`` (on *files* only, if given) and ``init_check``.
+
+    Both run side by side as a ``verify`` pipeline; a stage not run, or
+    whose tool is not installed, gives None. An empty *files* list skips
+    the audit.
+    """
+    inputs: dict[str, Any] = {"path": path}
+    audit_args = {"path": "$input.path"}
+    if files is not None:
+        inputs["files"] = files
+        audit_args["files"] = "$input.files"
+    steps: list[Step] = []
+    if files is None or files:
+        steps.append(Step("audit", tool="audit", args=audit_args))
+    if governance:
+        steps.append(
+            Step("init_check", tool="init_check", args={"path": "$input.path"})
+        )
+    if not steps:
+        return None, None
+    run = run_pipeline(Pipeline("verify", tuple(steps)), tools, inputs)
+    return run.outputs.get("audit"), run.outputs.get("init_check")
+
+
+def _render(
+    tools: dict[str, Any],
+    path: str,
+    state: _ProjectState,
+    summary: dict[str, Any],
+) -> dict[str, Any]:
+    """Build a fresh consolidated result from retained state."""
+    audit = copy.deepcopy(state.audit)
+    if audit is not None and "ast_impact" in tools:
+        for failure in audit.get("failed", []):
+            context = enrich_failure(tools, path, failure, state.impacts)
+            if context:
+                failure["context"] = context
+    return {
+        "audit": audit,
+        "governance": copy.deepcopy(state.governance),
+        "incremental": summary,
+    }
+
+
+def _changed_files(before: dict[str, str], after: dict[str, str]) -> set[str]:
+    """Files added, removed or modified between two hash indexes."""
+    return {f for f in before.keys() | after.keys() if before.get(f) != after.get(f)}
+
+
+def _governance_affected(
+    before: dict[str, str],
+    after: dict[str, str],
+    changed: set[str],
+) -> bool:
+    """Whether governance checks need a re-run for this change set."""
+    if before.keys() != after.keys():
+        return True
+    return any(not f.endswith(".py") for f in changed)
+
+
+def _accepts_subset(tools: dict[str, Any], previous: dict[str, Any] | None) -> bool:
+    """Whether audit can re-run on a file subset and be merged."""
+    tool = tools.get("audit")
+    if tool is None or previous is None or "error" in previous:
+        return False
+    return accepts_argument(tool, "files")
+
+
+def _all_symbols(audit: dict[str, Any] | None) -> list[str]:
+    """Every symbol referenced by the audit failures, deduplicated."""
+    if not audit:
+        return []
+    symbols = [s for f in audit.get("failed", []) for s in extract_symbols(f)]
+    return list(dict.fromkeys(symbols))
+
+
+def _failure_files(failure: dict[str, Any]) -> set[str]:
+    """Files referenced by a failure's file-scoped details."""
+    details = failure.get("details")
+    if not isinstance(details, dict):
+        return set()
+    return {
+        entry["file"]
+        for key in _FILE_SCOPED
+        for entry in details.get(key) or ()
+        if isinstance(entry, dict) and entry.get("file")
+    }
+
+
+def _touches(files: set[str], changed: set[str]) -> bool:
+    """Whether any of *files* (possibly root-relative or bare) changed."""
+    for name in files:
+        if name in changed or any(c.endswith("/" + name) for c in changed):
+            return True
+    return False
+
+
+def _retained_impacts(
+    impacts: dict[str, dict[str, Any] | None],
+    audit: dict[str, Any] | None,
+    changed: set[str],
+) -> dict[str, dict[str, Any] | None]:
+    """Keep impact data for symbols whose source did not change."""
+    python_changed = any(f.endswith(".py") for f in changed)
+    stale: set[str] = set()
+    for failure in (audit or {}).get("failed", []):
+        files = _failure_files(failure)
+        if (files and _touches(files, changed)) or (not files and python_changed):
+            stale.update(extract_symbols(failure))
+    return {s: data for s, data in impacts.items() if s not in stale}
+
+
+def _merge_audit(
+    previous: dict[str, Any] | None,
+    subset: dict[str, Any] | None,
+    changed: set[str],
+) -> dict[str, Any] | None:
+    """Merge a file-subset audit into the retained full audit.
+
+    Entries of file-scoped rules that belong to changed files are
+    replaced by the subset's entries; rules without file information are
+    replaced when the subset reports them. Otherwise they are retained
+    but marked ``stale``, as a subset run cannot tell whether they still
+    hold. The retained score and grade are kept.
+    """
+    if previous is None or subset is None or "error" in subset:
+        return subset
+
+    merged = copy.deepcopy(previous)
+    kept: list[dict[str, Any]] = []
+    for failure in merged.get("failed", []):
+        if _trim_failure(failure, changed):
+            kept.append(failure)
+
+    by_rule = {f.get("rule_id"): f for f in kept}
+    for failure in subset.get("failed", []):
+        rule_id = failure.get("rule_id")
+        existing = by_rule.get(rule_id)
+        if existing is None:
+            kept.append(failure)
+            by_rule[rule_id] = failure
+        elif _failure_files(existing):
+            _extend_failure(existing, failure)
+        else:
+            kept[kept.index(existing)] = failure
+            by_rule[rule_id] = failure
+
+    reported = {f.get("rule_id") for f in subset.get("failed", [])}
+    for failure in kept:
+        if failure.get("rule_id") not in reported and not _failure_files(failure):
+            failure["stale"] = True
+
+    merged["failed"] = kept
+    return merged
+
+
+def _trim_failure(failure: dict[str, Any], changed: set[str]) -> bool:
+    """Drop changed files' entries; False if nothing of the failure is left."""
+    details = failure.get("details")
+    if not _failure_files(failure) or not isinstance(details, dict):
+        return True
+    for key in _FILE_SCOPED:
+        entries = details.get(key)
+        if entries:
+            details[key] = [
+                e
+                for e in entries
+                if not (isinstance(e, dict) and _touches({e.get("file", "")}, changed))
+            ]
+    _recount(details)
+    return bool(_failure_files(failure))
+
+
+def _extend_failure(existing: dict[str, Any], update: dict[str, Any]) -> None:
+    """Append the subset's file-scoped entries to a retained failure."""
+    details = existing.setdefault("details", {})
+    new_details = update.get("details")
+    if not isinstance(new_details, dict):
+        return
+    for key in _FILE_SCOPED:
+        if new_details.get(key):
+            details.setdefault(key, []).extend(new_details[key])
+    _recount(details)
+
+
+def _recount(details: dict[str, Any]) -> None:
+    """Keep ``error_count`` consistent with the merged ``errors`` list."""
+    if "error_count" in details and isinstance(details.get("errors"), list):
+        details["error_count"] = len(details["errors"])
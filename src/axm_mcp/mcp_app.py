@@ -3,48 +3,575 @@
 Discovers all AXMTool entry points from installed packages
 (e.g. axm, axm-bib, axm-formal) and exposes them as MCP tools.
 
+Importing this module only declares the server and its meta-tools:
+reading the settings, setting up the caches, tool discovery, tool
+package imports and worker processes wait for ``build_server()``, which
+``main()`` calls while the transport loads.
+
 Zero imports from axm core — fully decoupled.
 """
 
+import asyncio
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from axm_mcp import tracing
+from axm_mcp.cache import DiskCache
+from axm_mcp.config import Settings, as_bool, as_seconds
+from axm_mcp.discovery import (
+    ToolChanges,
+    discover_tools,
+    register_tools,
+    reload_tools,
+    scan_entry_points,
+)
+from axm_mcp.discovery_cache import ToolSpec
+from axm_mcp.dispatch import Dispatcher, ToolTimeoutError
+from axm_mcp.incremental import IncrementalVerifier
+from axm_mcp.metrics import Metrics
+from axm_mcp.paging import Paginator
+from axm_mcp.pipeline import Pipeline, StepCallback, load_pipeline, run_pipeline
+from axm_mcp.progress import ProgressReporter, reporter_for
+from axm_mcp.result_cache import ResultCache
+from axm_mcp.singleflight import SingleFlight
+from axm_mcp.verify import compact_enrichment, verify_project
+from axm_mcp.verify_stream import RUN_URI, VerifyRuns, session_notifier
 
-from axm_mcp.discovery import discover_tools, register_tools
-from axm_mcp.verify import verify_project
+logger = logging.getLogger(__name__)
 
-# FastMCP server instance
+# FastMCP server instance; discovered tools are added by build_server()
 mcp = FastMCP("axm-mcp")
 
-# Auto-discover and register tools from installed packages
-_discovered_tools = discover_tools()
-register_tools(
-    mcp,
-    _discovered_tools,
-    extra_tools={
-        "verify": "One-shot project verification: audit + init check + AST enrichment."
-    },
-)
+# Settings and what is built from them; defaults until _configure()
+# reads the environment
+_settings = Settings()
+_dispatcher = Dispatcher()
+_verify_cache: DiskCache | None = None
+_pages = Paginator()
+_result_cache: ResultCache | None = None
+_configured = False
+_metrics = Metrics()
+
+# Tools from installed packages and their entry-point specs, set by
+# build_server() and swapped whole by reload_tools
+_discovered_tools: dict[str, Any] = {}
+_tool_specs: dict[str, ToolSpec] = {}
+_built = False
+_build_lock = threading.Lock()
+_reload_lock = asyncio.Lock()
+_incremental = IncrementalVerifier()
+_verify_flights = SingleFlight()
+_verify_runs = VerifyRuns()
+_META_TOOLS = {
+    "verify": "One-shot project verification: audit + init check + AST enrichment.",
+    "verify_results": "Fetch enrichment contexts of a streaming verify run.",
+    "next_page": "Fetch the next page of a list cut to fit the response budget.",
+    "metrics": "Call counts, errors, in-flight calls and latency per tool.",
+    "profile_tool": "Run one tool call under a profiler and report hotspots.",
+    "reload_tools": "Register newly installed or upgraded tools without a restart.",
+    "batch": "Run many tool calls in one round trip.",
+    "pipeline": "Run a declarative pipeline of tool calls as a parallel DAG.",
+}
+# Modules each transport imports when the server starts
+_TRANSPORT_MODULES = {
+    "stdio": ("mcp.server.stdio",),
+    "sse": ("uvicorn", "mcp.server.sse"),
+    "streamable-http": ("uvicorn", "mcp.server.streamable_http_manager"),
+}
+
+
+def build_server(
+    discovered: tuple[dict[str, Any], dict[str, ToolSpec]] | None = None,
+) -> FastMCP:
+    """Discover the installed tools and register them on ``mcp``.
+
+    Also starts tracing and the process backend's workers, as
+    configured. Only the first call builds; later ones return the
+    server as is.
+
+    Args:
+        discovered: Result of ``_discover()`` when discovery already ran
+            (e.g. on another thread); discovered here when None.
+
+    Returns:
+        The ``mcp`` server, ready to run.
+    """
+    global _built, _discovered_tools, _tool_specs
+    _configure()
+    with _build_lock:
+        if _built:
+            return mcp
+        from axm_mcp.process_backend import apply_process_backend
+
+        if _settings.trace_file is not None:
+            tracing.configure(
+                tracing.JsonlExporter(_settings.trace_file, _settings.trace_format)
+            )
+        tools, _tool_specs = _discover() if discovered is None else discovered
+        _discovered_tools = apply_process_backend(
+            tools,
+            _settings.process_tools,
+            workers=_settings.process_workers or None,
+            prestart=True,
+        )
+        _register(_discovered_tools)
+        _built = True
+    return mcp
+
+
+def _configure() -> None:
+    """Read the settings and set up the caches and thread pool, once."""
+    global _settings, _dispatcher, _verify_cache, _pages, _result_cache
+    global _configured
+    with _build_lock:
+        if _configured:
+            return
+        settings = Settings.from_env()
+        _dispatcher = Dispatcher(max_workers=settings.max_workers or None)
+        _verify_cache = (
+            DiskCache(
+                settings.cache_dir / "verify",
+                max_bytes=settings.verify_cache_mb * 1024 * 1024,
+            )
+            if settings.verify_cache
+            else None
+        )
+        _pages = Paginator(
+            max_items=settings.page_items,
+            max_bytes=settings.max_response_kb * 1024,
+        )
+        _result_cache = ResultCache(
+            DiskCache(
+                settings.cache_dir / "results",
+                max_bytes=settings.result_cache_mb * 1024 * 1024,
+            )
+        )
+        _settings = settings
+        _configured = True
+
+
+def _discover() -> tuple[dict[str, Any], dict[str, ToolSpec]]:
+    """Discover tools from installed packages, as configured.
+
+    Returns:
+        The tools, and the entry-point specs they were built from.
+    """
+    specs = scan_entry_points(cache_dir=_discovery_cache_dir())
+    tools = discover_tools(lazy=_settings.lazy_discovery, specs=specs)
+    return tools, {spec.name: spec for spec in specs}
+
+
+def _discovery_cache_dir() -> Path | None:
+    return _settings.cache_dir if _settings.discovery_cache else None
+
+
+def _register(tools: dict[str, Any], update: ToolChanges | None = None) -> None:
+    """Register *tools* on ``mcp``, or apply a reload's *update*."""
+    register_tools(
+        mcp,
+        tools,
+        extra_tools=_META_TOOLS,
+        dispatcher=_dispatcher,
+        settings=_settings,
+        result_cache=_result_cache,
+        pages=_pages,
+        metrics=_metrics,
+        update=update,
+    )
 
 
 # Register the verify meta-tool
 @mcp.tool(name="verify")
-def _verify_tool(**kwargs: Any) -> dict[str, Any]:
+async def _verify_tool(
+    ctx: Context | None = None,  # type: ignore[type-arg]
+    **kwargs: Any,
+) -> dict[str, Any]:
     """One-shot project verification: audit + init check + AST enrichment.
 
     Args:
         path: Path to project root to verify.
+        incremental: Re-check only files changed since the previous
+            incremental verify of the same path.
+        timeout: Time limit in seconds. A full verify returns what was
+            done by then; an incremental verify returns an error.
+        stream: Return the audit and governance sections as soon as
+            they are in, with a ``stream`` handle; failure contexts
+            follow through ``verify_results`` or the run's resource.
+        compact: List each distinct caller and module once under
+            ``graph``, with failure contexts referring to them by index
+            (not applied to streamed contexts).
+
+    Concurrent calls for the same project and mode share one run. A full
+    verify sends progress notifications per stage and enriched failure.
+    Long ``failed``/``callers``/``errors`` lists are paged (see
+    ``_pages`` and ``next_page``).
     """
     if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
         kwargs = kwargs["kwargs"]
+    with (
+        tracing.span("mcp.call", tool="verify", path=str(kwargs.get("path", "."))),
+        _metrics.observe("verify") as call,
+    ):
+        result = await _verify(ctx, kwargs)
+        call.error = "error" in result
+    return result
+
+
+async def _verify(
+    ctx: Context | None,  # type: ignore[type-arg]
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Serve one ``verify`` call (see ``_verify_tool``)."""
     path = kwargs.get("path", ".")
-    return verify_project(str(path), _discovered_tools)
+    try:
+        timeout = (
+            as_seconds(kwargs["timeout"])
+            if "timeout" in kwargs
+            else _settings.timeout_for("verify")
+        )
+    except ValueError as exc:
+        return {"error": str(exc)}
+    incremental = as_bool(kwargs.get("incremental", _settings.verify_incremental))
+    if as_bool(kwargs.get("stream", False)) and not incremental:
+        return _pages.apply(await _stream_verify(str(path), timeout, ctx))
+    key = f"verify\n{Path(path).resolve()}\n{incremental}"
+    reporter = reporter_for(ctx)
+    result = await _verify_flights.run(
+        key, lambda: _run_verify(str(path), incremental, timeout, reporter)
+    )
+    if as_bool(kwargs.get("compact", _settings.verify_compact)):
+        result = compact_enrichment(result)
+    return _pages.apply(dict(result))
+
+
+async def _stream_verify(
+    path: str,
+    timeout: float | None,
+    ctx: Context | None,  # type: ignore[type-arg]
+) -> dict[str, Any]:
+    """Start a verify whose failure contexts are delivered as they land."""
+    run = _verify_runs.create(notify=session_notifier(ctx))
+    task = asyncio.ensure_future(
+        _dispatcher.run_sync(
+            verify_project,
+            path,
+            _discovered_tools,
+            cache=_verify_cache,
+            timeout=timeout,
+            progress=reporter_for(ctx),
+            on_sections=run.on_sections,
+            on_context=run.on_context,
+            metrics=_metrics,
+        )
+    )
+    run.attach(task)
+    return await run.first_response()
+
+
+@mcp.tool(name="verify_results")
+async def _verify_results_tool(**kwargs: Any) -> dict[str, Any]:
+    """Fetch enrichment contexts of a streaming verify run.
+
+    Args:
+        run_id: ``stream.run_id`` returned by ``verify(stream=true)``.
+        cursor: Number of contexts already received (default 0).
+        wait: Seconds to wait for new contexts when none are ready yet
+            (default 0, at most 30).
+    """
+    if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
+        kwargs = kwargs["kwargs"]
+    run = _verify_runs.get(str(kwargs.get("run_id", "")))
+    if run is None:
+        return {"error": f"Unknown verify run: {kwargs.get('run_id')!r}"}
+    try:
+        cursor = int(kwargs.get("cursor", 0))
+        wait = as_seconds(kwargs.get("wait", 0))
+    except ValueError as exc:
+        return {"error": str(exc)}
+    if wait is not None:
+        await run.wait(cursor, wait)
+    return _pages.apply(run.snapshot(cursor))
+
+
+@mcp.tool(name="next_page")
+def _next_page_tool(**kwargs: Any) -> dict[str, Any]:
+    """Fetch the next page of a list cut to fit the response budget.
+
+    Args:
+        cursor: A ``cursor`` from a response's ``_pages`` entry, or from
+            the previous page (None once the last page is reached).
+    """
+    if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
+        kwargs = kwargs["kwargs"]
+    cursor = str(kwargs.get("cursor", ""))
+    try:
+        return _pages.page(cursor)
+    except KeyError:
+        return {"error": f"Unknown or expired cursor: {cursor!r}"}
+
+
+@mcp.tool(name="profile_tool")
+async def _profile_tool(**kwargs: Any) -> dict[str, Any]:
+    """Run one tool call under a profiler and report hotspots.
+
+    The call runs in-process (also for process-backed tools), bypassing
+    caches, and its profile is saved under ``<cache_dir>/profiles``.
+
+    Args:
+        tool: Tool to profile: any discovered tool, or ``verify``.
+        arguments: The tool's arguments (default none).
+        mode: ``cprofile`` (default; deterministic, calling thread only,
+            saved as ``.pstats``) or ``sample`` (wall-clock sampling of
+            the calling thread, saved as collapsed stacks for flamegraphs).
+        top: Number of hotspots returned (default 20).
+    """
+    if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
+        kwargs = kwargs["kwargs"]
+    from axm_mcp.profiling import MODES, profile_call
+
+    name = str(kwargs.get("tool", ""))
+    arguments = kwargs.get("arguments") or {}
+    mode = kwargs.get("mode", "cprofile")
+    if name == "verify":
+        target = _profiled_verify
+    elif name in _discovered_tools:
+        target = inspect.unwrap(_discovered_tools[name]).execute
+    else:
+        return {"error": f"Unknown tool: {name!r}"}
+    if mode not in MODES:
+        return {"error": f"Unknown profile mode: {mode!r}"}
+    try:
+        top = int(kwargs.get("top", 20))
+    except (TypeError, ValueError):
+        return {"error": f"Invalid top: {kwargs.get('top')!r}"}
+    if not isinstance(arguments, dict):
+        return {"error": "arguments must be an object"}
+
+    try:
+        result, profile = await _dispatcher.run_sync(
+            profile_call,
+            target,
+            arguments,
+            mode=mode,
+            top=top,
+            output_dir=_settings.cache_dir / "profiles",
+            label=name,
+        )
+    except Exception as exc:
+        return {"tool": name, "error": f"{type(exc).__name__}: {exc}"}
+    report = {"tool": name, **profile.as_dict()}
+    if name != "verify":
+        report["success"] = result.success
+        if result.error:
+            report["error"] = result.error
+    return report
+
+
+def _profiled_verify(path: str = ".", **_: Any) -> dict[str, Any]:
+    """Uncached full verify, as profiled by ``profile_tool``."""
+    return verify_project(path, _discovered_tools)
+
+
+@mcp.tool(name="reload_tools")
+async def _reload_tools_tool(**kwargs: Any) -> dict[str, Any]:
+    """Register newly installed or upgraded tools without a restart.
+
+    Re-scans the ``axm.tools`` entry points. Added tools and tools whose
+    target or distribution version changed are loaded and registered;
+    removed ones are unregistered. Unchanged tools keep their warm
+    instances and caches, and running calls finish on the instance
+    they started on (calls still queued for a replaced process-backed
+    tool are cancelled with its workers). ``list_tools`` switches to the
+    new set at once.
+    """
+    global _discovered_tools, _tool_specs
+    from axm_mcp.process_backend import ProcessTool, apply_process_backend
+
+    async with _reload_lock:
+        changes = await _dispatcher.run_sync(
+            reload_tools,
+            _discovered_tools,
+            _tool_specs,
+            cache_dir=_discovery_cache_dir(),
+        )
+        fresh = [*changes.added, *changes.changed]
+        changes.tools.update(
+            apply_process_backend(
+                {name: changes.tools[name] for name in fresh},
+                _settings.process_tools,
+                workers=_settings.process_workers or None,
+                prestart=True,
+            )
+        )
+        # No await from here on: clients see the old set or the new one.
+        retired = [_discovered_tools[n] for n in [*changes.changed, *changes.removed]]
+        _register(changes.tools, changes)
+        _discovered_tools, _tool_specs = changes.tools, changes.specs
+    for tool in retired:
+        if isinstance(tool, ProcessTool):
+            threading.Thread(
+                target=tool.shutdown, name=f"axm-retire-{tool.name}", daemon=True
+            ).start()
+    return changes.as_dict()
+
+
+@mcp.tool(name="pipeline")
+async def _pipeline_tool(
+    ctx: Context | None = None,  # type: ignore[type-arg]
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Run a declarative pipeline of tool calls as a parallel DAG.
+
+    Each step calls a discovered tool and starts as soon as the steps
+    it refers to (``"$<step>.<key>"`` arguments) have finished, so
+    independent steps run side by side. Steps declaring ``cache`` reuse
+    earlier results for the same arguments.
+
+    Args:
+        spec: Pipeline spec: ``name`` and a ``steps`` list of
+            ``{id, tool, args, needs, cache}`` objects.
+        file: Path of a ``.toml``, ``.json`` or ``.yaml`` spec, instead
+            of ``spec``.
+        inputs: Values of ``"$input.<name>"`` arguments.
+        timeout: Time limit in seconds; tool steps still running then
+            are reported as ``timed_out``.
+
+    Sends a progress notification as each step finishes.
+    """
+    if list(kwargs.keys()) == ["kwargs"] and isinstance(kwargs["kwargs"], dict):
+        kwargs = kwargs["kwargs"]
+    with (
+        tracing.span("mcp.call", tool="pipeline"),
+        _metrics.observe("pipeline") as call,
+    ):
+        result = await _pipeline(ctx, kwargs)
+        call.error = "error" in result or bool(result.get("failed"))
+    return result
+
+
+async def _pipeline(
+    ctx: Context | None,  # type: ignore[type-arg]
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Serve one ``pipeline`` call (see ``_pipeline_tool``)."""
+    inputs = kwargs.get("inputs") or {}
+    if not isinstance(inputs, dict):
+        return {"error": "inputs must be an object"}
+    try:
+        timeout = (
+            as_seconds(kwargs["timeout"])
+            if "timeout" in kwargs
+            else _settings.timeout_for("pipeline")
+        )
+        if "spec" in kwargs:
+            pipeline = Pipeline.from_dict(kwargs["spec"])
+        elif "file" in kwargs:
+            pipeline = await _dispatcher.run_sync(load_pipeline, str(kwargs["file"]))
+        else:
+            return {"error": "Pass a pipeline spec or file"}
+    except ValueError as exc:
+        return {"error": str(exc)}
+    reporter = reporter_for(ctx)
+    run = await _dispatcher.run_sync(
+        run_pipeline,
+        pipeline,
+        _discovered_tools,
+        inputs,
+        timeout=timeout,
+        cache=_result_cache,
+        metrics=_metrics,
+        on_step=None
+        if reporter is None
+        else _step_progress(reporter, len(pipeline.steps)),
+    )
+    return _pages.apply(run.as_dict())
+
+
+def _step_progress(reporter: ProgressReporter, total: int) -> StepCallback:
+    """Report one progress step per pipeline step settled."""
+    done = itertools.count(1)
+
+    def on_step(step: str, status: str, output: Any) -> None:
+        reporter(next(done), total, f"{step} {status}")
+
+    return on_step
+
+
+@mcp.resource(RUN_URI, mime_type="application/json")
+def _verify_run_resource(run_id: str) -> str:
+    """Enrichment contexts delivered so far by a streaming verify run."""
+    run = _verify_runs.get(run_id)
+    if run is None:
+        raise ValueError(f"Unknown verify run: {run_id!r}")
+    return json.dumps(_pages.apply(run.snapshot()))
+
+
+async def _run_verify(
+    path: str,
+    incremental: bool,
+    timeout: float | None,
+    reporter: ProgressReporter | None,
+) -> dict[str, Any]:
+    """Run one full or incremental verify on the dispatcher."""
+    if incremental:
+        try:
+            return await _dispatcher.run_with_timeout(
+                timeout, _incremental.verify, path, _discovered_tools
+            )
+        except ToolTimeoutError as exc:
+            return {"error": f"Tool 'verify' {exc}", "timeout": exc.seconds}
+    return await _dispatcher.run_sync(
+        verify_project,
+        path,
+        _discovered_tools,
+        cache=_verify_cache,
+        timeout=timeout,
+        progress=reporter,
+        metrics=_metrics,
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])  # type: ignore[untyped-decorator]
+async def _metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint (HTTP transports only)."""
+    return PlainTextResponse(
+        _metrics.prometheus(), media_type="text/plain; version=0.0.4"
+    )
 
 
 # Entry point for MCP CLI
 def main() -> None:
-    """Run the MCP server."""
-    mcp.run()
+    """Build and run the MCP server.
+
+    Tool discovery, which imports the tool packages, runs on a
+    background thread while the transport's modules are imported.
+    """
+    _configure()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="axm-discovery") as pool:
+        discovery = pool.submit(_discover)
+        _load_transport(_settings.transport)
+        discovered = discovery.result()
+    build_server(discovered).run(transport=_settings.transport)
+
+
+def _load_transport(transport: str) -> None:
+    """Import the modules *transport* needs; failures surface on run."""
+    for module in _TRANSPORT_MODULES.get(transport, ()):
+        try:
+            importlib.import_module(module)
+        except ImportError as exc:
+            logger.debug("Cannot preload %s: %s", module, exc)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+"""Per-tool latency and throughput metrics.
+
+Every registered tool, the ``verify`` meta-tool and each verify stage
+record into a :class:`Metrics` registry: call and error counts, the
+number of calls in flight, and latency quantiles (p50/p95/p99) over a
+window of recent calls. The registry is read through the ``metrics``
+meta-tool, as JSON or in the Prometheus text format, and is served at
+``/metrics`` when the server runs an HTTP transport.
+
+Recording costs a lock and a clock read per call; quantiles are only
+computed when metrics are read.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+__all__ = ["Call", "Metrics"]
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per series for quantiles.
+_WINDOW = 1024
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Call:
+    """One observed call; set ``error`` to count it as failed."""
+
+    __slots__ = ("error",)
+
+    def __init__(self) -> None:
+        self.error = False
+
+
+class _Series:
+    """Counters and a latency window for one tool or stage."""
+
+    __slots__ = ("calls", "errors", "in_flight", "samples", "total")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total = 0.0
+        self.samples: deque[float] = deque(maxlen=_WINDOW)
+
+    def summary(self) -> dict[str, Any]:
+        samples = sorted(self.samples)
+        latency = {
+            f"p{round(q * 100)}": round(_quantile(samples, q) * 1000, 3)
+            for q in _QUANTILES
+        }
+        if samples:
+            latency["max"] = round(samples[-1] * 1000, 3)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "total_seconds": round(self.total, 6),
+            "latency_ms": latency,
+        }
+
+
+class Metrics:
+    """Thread-safe registry of per-series call metrics.
+
+    Series are named after tools (``bib_doi``) and verify stages
+    (``verify.audit``) and created on first use.
+    """
+
+    def __init__(self) -> None:
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    @contextmanager
+    def observe(self, name: str) -> Iterator[Call]:
+        """Time the enclosed call and count it under *name*.
+
+        An exception escaping the block counts as an error.
+        """
+        call = Call()
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series()
+            series.in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield call
+        except BaseException:
+            call.error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                series.in_flight -= 1
+                series.calls += 1
+                series.errors += call.error
+                series.total += elapsed
+                series.samples.append(elapsed)
+
+    def snapshot(self) -> dict[str, Any]:
+        """All series as JSON-ready data, sorted by name."""
+        with self._lock:
+            series = {name: s.summary() for name, s in sorted(self._series.items())}
+        return {
+            "uptime_seconds": round(time.monotonic() - self._started, 3),
+            "tools": series,
+        }
+
+    def prometheus(self) -> str:
+        """All series in the Prometheus text exposition format."""
+        with self._lock:
+            rows = [
+                (name, s.calls, s.errors, s.in_flight, s.total, sorted(s.samples))
+                for name, s in sorted(self._series.items())
+            ]
+        lines = [
+            "# HELP axm_mcp_calls_total Completed tool calls.",
+            "# TYPE axm_mcp_calls_total counter",
+            *(f'axm_mcp_calls_total{{tool="{r[0]}"}} {r[1]}' for r in rows),
+            "# HELP axm_mcp_errors_total Tool calls that failed.",
+            "# TYPE axm_mcp_errors_total counter",
+            *(f'axm_mcp_errors_total{{tool="{r[0]}"}} {r[2]}' for r in rows),
+            "# HELP axm_mcp_in_flight Tool calls currently running.",
+            "# TYPE axm_mcp_in_flight gauge",
+            *(f'axm_mcp_in_flight{{tool="{r[0]}"}} {r[3]}' for r in rows),
+            "# HELP axm_mcp_latency_seconds Tool call latency.",
+            "# TYPE axm_mcp_latency_seconds summary",
+        ]
+        for name, calls, _, _, total, samples in rows:
+            for q in _QUANTILES:
+                labels = f'tool="{name}",quantile="{q}"'
+                value = _quantile(samples, q)
+                lines.append(f"axm_mcp_latency_seconds{{{labels}}} {value:.6f}")
+            lines.append(f'axm_mcp_latency_seconds_sum{{tool="{name}"}} {total:.6f}')
+            lines.append(f'axm_mcp_latency_seconds_count{{tool="{name}"}} {calls}')
+        return "\n".join(lines) + "\n"
+
+
+def _quantile(samples: list[float], q: float) -> float:
+    """Nearest-rank quantile of sorted *samples* (0 when empty)."""
+    if not samples:
+        return 0.0
+    rank = min(len(samples), max(1, math.ceil(q * len(samples))))
+    return samples[rank - 1]
@@ -0,0 +1,176 @@
+"""Response budget — cursor pagination of large result lists.
+
+On a big repository a single ``verify`` can list thousands of callers,
+failures or errors, which makes the response slow to encode and too
+large for the client's context. A :class:`Paginator` keeps responses
+within an item and a byte budget: every list under one of the
+:data:`PAGED_KEYS` is cut to a page, and the cut is recorded under the
+response's ``_pages`` entry, keyed by the list's path::
+
+    {"audit": {"failed": [...]},
+     "_pages": {"audit.failed": {"cursor": "…", "total": 812, "returned": 50}}}
+
+The rest of a list is fetched page by page with the ``next_page`` tool,
+so nothing is lost. Cut lists are kept in memory for a bounded number
+of responses, oldest dropped first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Any
+
+__all__ = ["PAGED_KEYS", "Paginator"]
+
+logger = logging.getLogger(__name__)
+
+# Keys whose list values may grow with the size of the project.
+PAGED_KEYS = frozenset({"callers", "failed", "errors"})
+
+# Cut lists kept for continuation before the oldest are dropped.
+_MAX_CURSORS = 256
+
+
+class Paginator:
+    """Cuts large lists to pages and serves the remaining pages.
+
+    Args:
+        max_items: Items kept per paged list; 0 disables the item budget.
+        max_bytes: Approximate size budget of an encoded response; 0
+            disables it. Over budget, the page size is halved until the
+            response fits (or pages hold a single item).
+        max_cursors: Number of cut lists kept for ``page()``.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 0,
+        max_bytes: int = 0,
+        max_cursors: int = _MAX_CURSORS,
+    ) -> None:
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_cursors = max_cursors
+        self._lists: OrderedDict[str, tuple[list[Any], int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any budget is configured."""
+        return bool(self.max_items or self.max_bytes)
+
+    def apply(self, response: dict[str, Any]) -> dict[str, Any]:
+        """Return *response* within budget (*response* is not modified).
+
+        Responses already within budget are returned as is. Only
+        responses holding a paged list of more than one item can be cut,
+        so only those are encoded to check the byte budget.
+        """
+        if not self.enabled:
+            return response
+        longest = _longest(response)
+        if longest <= 1:
+            return response
+        limit = self.max_items or longest
+        cuts: list[tuple[str, list[Any]]] = []
+        trimmed = _trim(response, "", limit, cuts)
+        while self.max_bytes and limit > 1 and _size(trimmed) > self.max_bytes:
+            limit //= 2
+            cuts = []
+            trimmed = _trim(response, "", limit, cuts)
+        if not cuts:
+            return response
+        pages = {path: self._cut(items, limit) for path, items in cuts}
+        return {**trimmed, "_pages": {**trimmed.get("_pages", {}), **pages}}
+
+    def page(self, cursor: str) -> dict[str, Any]:
+        """The page of a cut list starting at *cursor*.
+
+        Returns:
+            ``items``, their ``offset`` and the list's ``total``, plus
+            the ``cursor`` of the following page (None on the last one).
+            Large lists nested in the items are paged in turn.
+
+        Raises:
+            KeyError: If the cursor is malformed or has expired.
+        """
+        token, _, raw_offset = cursor.partition(":")
+        with self._lock:
+            entry = self._lists.get(token)
+            if entry is not None:
+                self._lists.move_to_end(token)
+        if entry is None or not raw_offset.isdigit():
+            raise KeyError(cursor)
+        items, size = entry
+        offset = int(raw_offset)
+        end = offset + size
+        page = {
+            "items": items[offset:end],
+            "offset": offset,
+            "total": len(items),
+            "cursor": f"{token}:{end}" if end < len(items) else None,
+        }
+        return self.apply(page)
+
+    def _cut(self, items: list[Any], size: int) -> dict[str, Any]:
+        """Keep *items* for continuation and describe the cut."""
+        token = secrets.token_hex(8)
+        with self._lock:
+            self._lists[token] = (items, size)
+            while len(self._lists) > self.max_cursors:
+                self._lists.popitem(last=False)
+        return {"cursor": f"{token}:{size}", "total": len(items), "returned": size}
+
+
+def _trim(
+    value: Any,
+    path: str,
+    limit: int,
+    cuts: list[tuple[str, list[Any]]],
+) -> Any:
+    """Copy *value* with paged lists cut to *limit*, recording each cut.
+
+    Containers without a cut inside are returned unchanged (not copied).
+    """
+    if isinstance(value, dict):
+        changed = False
+        out: dict[str, Any] = {}
+        for key, item in value.items():
+            child = f"{path}.{key}" if path else str(key)
+            if key in PAGED_KEYS and isinstance(item, list) and len(item) > limit:
+                cuts.append((child, item))
+                item = item[:limit]
+            new = _trim(item, child, limit, cuts)
+            changed = changed or new is not value[key]
+            out[key] = new
+        return out if changed else value
+    if isinstance(value, list):
+        items = [
+            _trim(item, f"{path}[{i}]", limit, cuts) for i, item in enumerate(value)
+        ]
+        if any(new is not old for new, old in zip(items, value, strict=True)):
+            return items
+    return value
+
+
+def _longest(value: Any) -> int:
+    """Length of the longest paged list in *value*."""
+    longest = 0
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in PAGED_KEYS and isinstance(item, list):
+                longest = max(longest, len(item))
+            longest = max(longest, _longest(item))
+    elif isinstance(value, list):
+        for item in value:
+            longest = max(longest, _longest(item))
+    return longest
+
+
+def _size(value: Any) -> int:
+    """Encoded size of a response, in bytes (close enough for a budget)."""
+    return len(json.dumps(value, default=str))
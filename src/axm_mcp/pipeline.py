@@ -0,0 +1,607 @@
+"""Declarative tool pipelines, run as a parallel DAG.
+
+A pipeline is a set of named steps. A tool step calls a discovered tool
+with arguments that may refer to the pipeline's inputs or to other
+steps' outputs; each step starts as soon as the steps it depends on
+have settled, so independent steps run side by side. ``verify`` is
+itself such a pipeline: audit and init check in parallel, then
+enrichment.
+
+Specs are plain objects, passed to the ``pipeline`` meta-tool or read
+from a TOML, JSON or YAML file (YAML needs PyYAML)::
+
+    name = "docs"
+
+    [[steps]]
+    tool = "audit"
+    args = { path = "$input.path" }
+
+    [[steps]]
+    tool = "init_check"
+    args = { path = "$input.path" }
+
+    [[steps]]
+    id = "refs"
+    tool = "bib_check"
+    args = { path = "$input.path", failures = "$audit.failed" }
+    cache = 3600
+
+A string argument ``"$<step>.<key>..."`` is replaced by that part of the
+step's output (list items by index), ``"$input.<name>"`` by a pipeline
+input and ``"$<step>"`` by the whole output; ``"$$"`` escapes a literal
+``$``. Referring to a step makes it a dependency; ``needs`` adds
+dependencies for ordering only. A step whose reference cannot be
+resolved, typically because the step it refers to failed, is skipped.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import tomllib
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from axm_mcp import tracing
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.metrics import Call, Metrics
+from axm_mcp.result_cache import ResultCache, canonical_key
+
+__all__ = [
+    "Pipeline",
+    "PipelineError",
+    "PipelineRun",
+    "Step",
+    "StepCallback",
+    "load_pipeline",
+    "run_pipeline",
+]
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on steps running at once, across all pipeline runs.
+_MAX_WORKERS = 8
+# Shared by every run, created on first use.
+_POOL = Dispatcher(_MAX_WORKERS, thread_name_prefix="axm-pipeline")
+# Root of references to the pipeline's inputs.
+_INPUT = "input"
+_STEP_KEYS = frozenset({"id", "tool", "args", "needs", "cache"})
+# Statuses of steps whose output can be used.
+_SUCCEEDED = frozenset({"ok", "cached"})
+
+# on_step(step_id, status, output)
+StepCallback = Callable[[str, str, Any], None]
+
+
+class PipelineError(ValueError):
+    """Invalid pipeline spec: bad step, unknown reference or cycle."""
+
+
+@dataclass(frozen=True)
+class Step:
+    """One pipeline step.
+
+    Args:
+        id: Name other steps refer to it by.
+        tool: Discovered tool to call.
+        args: Keyword arguments; ``$`` references are resolved first.
+        needs: Steps to wait for besides the referenced ones.
+        cache: Cache successful results for this many seconds (0 never
+            expires), keyed on the tool and its resolved arguments.
+        func: Python callable run instead of a tool (programmatic
+            pipelines only). It is not abandoned at the deadline, so it
+            must honour the deadline itself.
+    """
+
+    id: str
+    tool: str | None = None
+    args: Mapping[str, Any] = field(default_factory=dict)
+    needs: tuple[str, ...] = ()
+    cache: float | None = None
+    func: Callable[..., Any] | None = None
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    """Named set of steps forming a DAG; validated on creation.
+
+    Raises:
+        PipelineError: Duplicate or invalid step ids, an unknown
+            dependency, or a dependency cycle.
+    """
+
+    name: str
+    steps: tuple[Step, ...]
+
+    def __post_init__(self) -> None:
+        _check_order(self.steps, self.dependencies)
+
+    @cached_property
+    def dependencies(self) -> dict[str, tuple[str, ...]]:
+        """Steps each step waits for, referenced ones first."""
+        ids: set[str] = set()
+        for step in self.steps:
+            if not step.id or "." in step.id or step.id in (_INPUT, "$"):
+                raise PipelineError(f"Invalid step id: {step.id!r}")
+            if step.id in ids:
+                raise PipelineError(f"Duplicate step id: {step.id!r}")
+            if (step.tool is None) == (step.func is None):
+                raise PipelineError(f"Step {step.id!r} needs either a tool or a func")
+            ids.add(step.id)
+        deps: dict[str, tuple[str, ...]] = {}
+        for step in self.steps:
+            needed = [*_references(step.args), *step.needs]
+            for name in needed:
+                if name not in ids:
+                    raise PipelineError(
+                        f"Step {step.id!r} depends on unknown step {name!r}"
+                    )
+            deps[step.id] = tuple(dict.fromkeys(needed))
+        return deps
+
+    @classmethod
+    def from_dict(cls, spec: Any) -> Pipeline:
+        """Build a pipeline from a spec object (see the module docstring).
+
+        Raises:
+            PipelineError: The spec is malformed or invalid.
+        """
+        if not isinstance(spec, Mapping):
+            raise PipelineError("A pipeline spec must be an object")
+        entries = spec.get("steps")
+        if not isinstance(entries, list) or not entries:
+            raise PipelineError("A pipeline spec needs a non-empty 'steps' list")
+        steps = tuple(_parse_step(index, entry) for index, entry in enumerate(entries))
+        return cls(name=str(spec.get("name", "pipeline")), steps=steps)
+
+
+@dataclass
+class PipelineRun:
+    """Outcome of a pipeline run.
+
+    ``status`` maps each step to ``ok``, ``cached``, ``error``,
+    ``missing`` (tool not installed), ``skipped`` (unresolved
+    reference) or ``timed_out``.
+    """
+
+    name: str
+    outputs: dict[str, Any] = field(default_factory=dict)
+    status: dict[str, str] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def timed_out(self) -> list[str]:
+        """Steps abandoned at the deadline."""
+        return [step for step, status in self.status.items() if status == "timed_out"]
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready summary, as returned by the ``pipeline`` meta-tool."""
+        result: dict[str, Any] = {
+            "pipeline": self.name,
+            "outputs": self.outputs,
+            "steps": {
+                step: {"status": status, "seconds": round(self.seconds[step], 4)}
+                for step, status in self.status.items()
+            },
+            "failed": sum(s not in _SUCCEEDED for s in self.status.values()),
+        }
+        if self.timed_out:
+            result["timed_out"] = self.timed_out
+        return result
+
+
+def load_pipeline(path: str | Path) -> Pipeline:
+    """Read a pipeline spec from a ``.toml``, ``.json`` or ``.yaml`` file.
+
+    Raises:
+        PipelineError: The file cannot be read or parsed, or the spec
+            is invalid.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in (".toml", ".json", ".yaml", ".yml"):
+        raise PipelineError(f"Unsupported pipeline format: {path.name}")
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise PipelineError(f"Cannot read pipeline {path}: {exc}") from exc
+    try:
+        if suffix == ".toml":
+            spec: Any = tomllib.loads(text)
+        elif suffix == ".json":
+            spec = json.loads(text)
+        else:
+            spec = _load_yaml(text)
+    except (tomllib.TOMLDecodeError, json.JSONDecodeError) as exc:
+        raise PipelineError(f"Cannot parse pipeline {path}: {exc}") from exc
+    if isinstance(spec, dict):
+        spec.setdefault("name", path.stem)
+    return Pipeline.from_dict(spec)
+
+
+def run_pipeline(
+    pipeline: Pipeline,
+    tools: Mapping[str, Any],
+    inputs: Mapping[str, Any] | None = None,
+    *,
+    timeout: float | None = None,
+    cache: ResultCache | None = None,
+    metrics: Metrics | None = None,
+    on_step: StepCallback | None = None,
+    max_workers: int | None = None,
+) -> PipelineRun:
+    """Run *pipeline*, each step as soon as its dependencies settle.
+
+    Args:
+        pipeline: Steps to run.
+        tools: Discovered tools, by name.
+        inputs: Values of ``$input.<name>`` references.
+        timeout: Overall time limit in seconds. Tool steps still running
+            at the deadline are abandoned as ``timed_out`` with an error
+            output; tool steps not started by then are not started.
+        cache: Where steps declaring ``cache`` keep their results.
+        metrics: Records each tool step run as ``<pipeline>.<step>``.
+        on_step: Called as ``on_step(step_id, status, output)`` on the
+            calling thread as each step settles, before any step
+            depending on it starts.
+        max_workers: Steps of this run in flight at once (default: no
+            limit but the pool shared by all runs, 8 threads).
+
+    Returns:
+        The run's outputs and per-step status, in step order.
+
+    Tool steps are traced as ``<pipeline>.run_tool`` spans; function
+    steps trace themselves.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    runner = _Runner(
+        pipeline, tools, inputs or {}, deadline, cache, metrics, on_step, max_workers
+    )
+    pool = _POOL.executor
+    runner.run(pool)
+    if runner.result.timed_out:
+        # Abandoned steps keep their threads; give later runs a fresh pool
+        _POOL.retire(pool)
+    return runner.ordered()
+
+
+class _UnresolvedError(Exception):
+    """A ``$`` reference with no value."""
+
+    def __init__(self, reference: str) -> None:
+        super().__init__(reference)
+        self.reference = reference
+
+
+class _Runner:
+    """Scheduling state of one pipeline run."""
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        tools: Mapping[str, Any],
+        inputs: Mapping[str, Any],
+        deadline: float | None,
+        cache: ResultCache | None,
+        metrics: Metrics | None,
+        on_step: StepCallback | None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._pipeline = pipeline
+        self._tools = tools
+        self._inputs = inputs
+        self._deadline = deadline
+        self._cache = cache
+        self._metrics = metrics
+        self._on_step = on_step
+        self._max_workers = max_workers or None
+        self._steps = {step.id: step for step in pipeline.steps}
+        self._waiting = {
+            step: set(deps) for step, deps in pipeline.dependencies.items()
+        }
+        self._dependents: dict[str, list[str]] = {}
+        for step, deps in pipeline.dependencies.items():
+            for dep in deps:
+                self._dependents.setdefault(dep, []).append(step)
+        self._running: dict[Future[tuple[str, Any, float]], Step] = {}
+        # Steps with resolved arguments, waiting for a max_workers slot
+        self._ready: deque[tuple[Step, dict[str, Any]]] = deque()
+        self._started: dict[str, float] = {}
+        self._pool: ThreadPoolExecutor | None = None
+        self.result = PipelineRun(pipeline.name)
+
+    def run(self, pool: ThreadPoolExecutor) -> None:
+        """Start the steps without dependencies and drive the DAG to the end."""
+        self._pool = pool
+        try:
+            for step in self._pipeline.steps:
+                if not self._waiting[step.id]:
+                    self._start(step)
+            while self._running:
+                self._wait()
+                self._submit_ready()
+        finally:
+            for future in self._running:
+                future.cancel()
+
+    def _wait(self) -> None:
+        """Settle the steps finishing next, or abandon them at the deadline."""
+        abandonable = any(step.tool is not None for step in self._running.values())
+        done, _ = wait(
+            self._running,
+            timeout=_remaining(self._deadline) if abandonable else None,
+            return_when=FIRST_COMPLETED,
+        )
+        if not done:
+            self._abandon()
+            return
+        for future in done:
+            step = self._running.pop(future)
+            status, output, seconds = future.result()
+            self._settle(step, status, output, seconds)
+
+    def ordered(self) -> PipelineRun:
+        """The run, with steps listed in declaration order."""
+        run = self.result
+        order = [step.id for step in self._pipeline.steps if step.id in run.status]
+        return PipelineRun(
+            run.name,
+            outputs={step: run.outputs[step] for step in order},
+            status={step: run.status[step] for step in order},
+            seconds={step: run.seconds[step] for step in order},
+        )
+
+    def _start(self, step: Step) -> None:
+        try:
+            args = _resolve(step.args, self.result.outputs, self._inputs)
+        except _UnresolvedError as exc:
+            self._settle(step, "skipped", {"error": self._unresolved(exc)}, 0.0)
+            return
+        self._ready.append((step, dict(args)))
+        self._submit_ready()
+
+    def _submit_ready(self) -> None:
+        """Hand ready steps to the pool while the run has slots left."""
+        assert self._pool is not None
+        while self._ready and (
+            self._max_workers is None or len(self._running) < self._max_workers
+        ):
+            step, args = self._ready.popleft()
+            if step.tool is not None and _remaining(self._deadline) == 0.0:
+                self._settle(step, "timed_out", _late(step), 0.0)
+                continue
+            self._started[step.id] = time.perf_counter()
+            future = self._pool.submit(tracing.bind(self._run_step), step, args)
+            self._running[future] = step
+
+    def _abandon(self) -> None:
+        """Give up on the tool steps still running at the deadline."""
+        for future, step in list(self._running.items()):
+            if step.tool is None:
+                continue
+            logger.warning(
+                "Tool '%s' missed the %s deadline", step.tool, self._pipeline.name
+            )
+            del self._running[future]
+            seconds = time.perf_counter() - self._started[step.id]
+            self._settle(step, "timed_out", _late(step), seconds)
+
+    def _settle(self, step: Step, status: str, output: Any, seconds: float) -> None:
+        run = self.result
+        run.outputs[step.id] = output
+        run.status[step.id] = status
+        run.seconds[step.id] = seconds
+        if self._on_step is not None:
+            self._on_step(step.id, status, output)
+        for dependent in self._dependents.get(step.id, ()):
+            waiting = self._waiting[dependent]
+            waiting.discard(step.id)
+            if not waiting:
+                self._start(self._steps[dependent])
+
+    def _unresolved(self, exc: _UnresolvedError) -> str:
+        source = exc.reference.split(".", 1)[0]
+        status = self.result.status.get(source)
+        if status is not None and status not in _SUCCEEDED:
+            return f"Step {source!r} did not succeed ({status})"
+        return f"Unresolved reference: ${exc.reference}"
+
+    def _run_step(self, step: Step, args: dict[str, Any]) -> tuple[str, Any, float]:
+        """Run one step on a worker: (status, output, seconds)."""
+        start = time.perf_counter()
+        if step.func is not None:
+            status, output = _call_func(step, args)
+        else:
+            status, output = self._run_tool_step(step, args)
+        return status, output, time.perf_counter() - start
+
+    def _run_tool_step(self, step: Step, args: dict[str, Any]) -> tuple[str, Any]:
+        assert step.tool is not None
+        key = None
+        if self._cache is not None and step.cache is not None:
+            key = canonical_key(f"pipeline:{step.tool}", args)
+        if key is not None:
+            assert self._cache is not None
+            hit = self._cache.get(key)
+            if hit is not None:
+                return "cached", hit
+        with (
+            tracing.span(
+                f"{self._pipeline.name}.run_tool", tool=step.tool, step=step.id
+            ) as span,
+            self._observe(step) as call,
+        ):
+            status, output = _call_tool(self._tools, step.tool, args)
+            call.error = status == "error"
+            if span is not None:
+                span.set("success", status != "error")
+        if key is not None and status == "ok" and output is not None:
+            assert self._cache is not None
+            self._cache.set(key, output, step.cache or None)
+        return status, output
+
+    def _observe(self, step: Step) -> Any:
+        if self._metrics is None or step.tool not in self._tools:
+            return nullcontext(Call())
+        return self._metrics.observe(f"{self._pipeline.name}.{step.id}")
+
+
+def _call_tool(
+    tools: Mapping[str, Any], tool_name: str, kwargs: dict[str, Any]
+) -> tuple[str, dict[str, Any] | None]:
+    """Run a discovered tool: (status, data), never raising.
+
+    A missing tool gives ``("missing", None)``; a failure or exception
+    gives ``("error", {"error": ...})``.
+    """
+    tool = tools.get(tool_name)
+    if tool is None:
+        logger.info("Tool '%s' not installed, skipping.", tool_name)
+        return "missing", None
+
+    try:
+        result = tool.execute(**kwargs)
+        if result.success:
+            data: dict[str, Any] = result.data
+            return "ok", data
+        logger.warning("Tool '%s' failed: %s", tool_name, result.error)
+        return "error", {"error": result.error}
+    except Exception as exc:
+        logger.warning("Tool '%s' raised: %s", tool_name, exc, exc_info=True)
+        return "error", {"error": str(exc)}
+
+
+def _call_func(step: Step, args: dict[str, Any]) -> tuple[str, Any]:
+    assert step.func is not None
+    try:
+        return "ok", step.func(**args)
+    except Exception as exc:
+        logger.warning("Step '%s' raised: %s", step.id, exc, exc_info=True)
+        return "error", {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def _late(step: Step) -> dict[str, Any]:
+    return {"error": f"Tool '{step.tool}' did not finish before the deadline"}
+
+
+def _parse_step(index: int, entry: Any) -> Step:
+    """Validate one ``steps`` entry of a spec."""
+    if not isinstance(entry, Mapping):
+        raise PipelineError(f"Step {index} must be an object")
+    unknown = sorted(set(entry) - _STEP_KEYS)
+    if unknown:
+        raise PipelineError(f"Step {index} has unknown keys: {', '.join(unknown)}")
+    tool = entry.get("tool")
+    if not isinstance(tool, str) or not tool:
+        raise PipelineError(f"Step {index} needs a 'tool' name")
+    step_id = entry.get("id", tool)
+    args = entry.get("args", {})
+    if not isinstance(args, Mapping):
+        raise PipelineError(f"Step {step_id!r}: 'args' must be an object")
+    needs = entry.get("needs", [])
+    if isinstance(needs, str):
+        needs = [needs]
+    if not isinstance(needs, list) or not all(isinstance(n, str) for n in needs):
+        raise PipelineError(f"Step {step_id!r}: 'needs' must list step ids")
+    cache = entry.get("cache")
+    if cache is not None and (
+        isinstance(cache, bool) or not isinstance(cache, (int, float)) or cache < 0
+    ):
+        raise PipelineError(f"Step {step_id!r}: 'cache' must be seconds (>= 0)")
+    return Step(
+        id=str(step_id),
+        tool=tool,
+        args=dict(args),
+        needs=tuple(needs),
+        cache=None if cache is None else float(cache),
+    )
+
+
+def _check_order(
+    steps: tuple[Step, ...], dependencies: Mapping[str, tuple[str, ...]]
+) -> None:
+    """Raise if the dependencies contain a cycle."""
+    waiting = {step.id: set(dependencies[step.id]) for step in steps}
+    ready = [step for step, deps in waiting.items() if not deps]
+    while ready:
+        done = ready.pop()
+        del waiting[done]
+        for step, deps in waiting.items():
+            if done in deps:
+                deps.discard(done)
+                if not deps:
+                    ready.append(step)
+    if waiting:
+        raise PipelineError(
+            f"Dependency cycle between steps: {', '.join(sorted(waiting))}"
+        )
+
+
+def _references(value: Any) -> Iterator[str]:
+    """Steps referred to by ``$`` references in *value*."""
+    if isinstance(value, str):
+        if value.startswith("$") and not value.startswith("$$"):
+            source = value[1:].split(".", 1)[0]
+            if source != _INPUT:
+                yield source
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from _references(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _references(item)
+
+
+def _resolve(value: Any, outputs: Mapping[str, Any], inputs: Mapping[str, Any]) -> Any:
+    """*value* with every ``$`` reference replaced by what it names."""
+    if isinstance(value, str):
+        if value.startswith("$$"):
+            return value[1:]
+        if value.startswith("$"):
+            return _lookup(value[1:], outputs, inputs)
+        return value
+    if isinstance(value, Mapping):
+        return {key: _resolve(item, outputs, inputs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve(item, outputs, inputs) for item in value]
+    return value
+
+
+def _lookup(
+    reference: str, outputs: Mapping[str, Any], inputs: Mapping[str, Any]
+) -> Any:
+    source, *keys = reference.split(".")
+    current: Any = inputs if source == _INPUT else outputs.get(source)
+    for key in keys:
+        if isinstance(current, Mapping) and key in current:
+            current = current[key]
+        elif isinstance(current, list) and key.isdigit() and int(key) < len(current):
+            current = current[int(key)]
+        else:
+            raise _UnresolvedError(reference)
+    return current
+
+
+def _load_yaml(text: str) -> Any:
+    try:
+        import yaml
+    except ImportError as exc:
+        raise PipelineError("YAML pipelines need PyYAML (pip install pyyaml)") from exc
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as exc:
+        raise PipelineError(f"Cannot parse pipeline: {exc}") from exc
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Seconds left until *deadline* (None when unbounded)."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
@@ -0,0 +1,244 @@
+"""Process-pool execution backend for CPU-bound tools.
+
+``audit`` and the AST tools are pure-Python and hold the GIL, so the
+thread pool alone cannot spread concurrent verifies across cores. A
+tool switched to this backend is replaced by a :class:`ProcessTool`
+proxy that runs ``execute`` in a pool of worker processes. Each worker
+imports and instantiates the tool from its entry-point target once, in
+the pool initializer; calls then only ship keyword arguments in and the
+``success``/``data``/``error`` triple of the ``ToolResult`` back.
+
+Tools opt in through the ``AXM_MCP_PROCESS_TOOLS`` setting or by
+declaring ``execution_backend = "process"`` on the tool class (lazy
+proxies are only switched by configuration, to keep them unimported).
+
+Unlike threads, worker processes can be killed: when a call times out,
+:meth:`ProcessTool.recycle` terminates the pool and the next call forks
+a fresh one. Calls caught in a terminated pool return an error result.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.metadata
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from collections.abc import Iterable
+from concurrent.futures import CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+from axm_mcp.discovery import _LazyTool
+
+__all__ = ["ProcessTool", "RemoteResult", "apply_process_backend"]
+
+logger = logging.getLogger(__name__)
+
+_EP_GROUP = "axm.tools"
+_BACKEND_ATTR = "execution_backend"
+
+# Tool instance owned by a worker process (set by the pool initializer).
+_worker_tool: Any = None
+
+
+@dataclass
+class RemoteResult:
+    """``ToolResult``-shaped value rebuilt from a worker's reply."""
+
+    success: bool
+    data: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+def _init_worker(name: str, target: str, pids: Any) -> None:
+    """Pool initializer: import and instantiate the tool once per worker.
+
+    The worker's PID is reported on *pids* first, so that even a worker
+    stuck importing the tool can be terminated.
+    """
+    global _worker_tool
+    pids.put(os.getpid())
+    ep = importlib.metadata.EntryPoint(name=name, value=target, group=_EP_GROUP)
+    _worker_tool = ep.load()()
+
+
+def _execute_in_worker(
+    kwargs: dict[str, Any],
+) -> tuple[bool, dict[str, Any], str | None]:
+    """Run the worker's tool and return a picklable result triple."""
+    result = _worker_tool.execute(**kwargs)
+    return bool(result.success), dict(result.data or {}), result.error
+
+
+def _ready() -> int:
+    """No-op task used to force workers to start."""
+    return os.getpid()
+
+
+def _mp_context() -> Any:
+    """Prefer ``forkserver``: forking a threaded server is unsafe."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+class ProcessTool:
+    """ToolLike proxy that executes a tool in a pool of worker processes.
+
+    Args:
+        name: Tool name.
+        target: Entry-point target (``package.module:ToolClass``)
+            each worker imports.
+        workers: Number of worker processes.
+        wrapped: The in-process tool (or lazy proxy) being replaced,
+            kept for its metadata.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        target: str,
+        workers: int,
+        wrapped: Any = None,
+    ) -> None:
+        self._name = name
+        self.target = target
+        self.workers = workers
+        self.__wrapped__ = wrapped
+        self._executor: ProcessPoolExecutor | None = None
+        # PIDs reported by the current pool's workers
+        self._pid_queue: Any = None
+        self._pids: set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Tool name used for MCP registration."""
+        return self._name
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The worker pool, created on first access."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    context = _mp_context()
+                    self._pid_queue = context.SimpleQueue()
+                    self._pids = set()
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=context,
+                        initializer=_init_worker,
+                        initargs=(self._name, self.target, self._pid_queue),
+                    )
+        return self._executor
+
+    def start(self) -> None:
+        """Pre-fork all workers so the first calls pay no import cost."""
+        pool = self.executor
+        wait([pool.submit(_ready) for _ in range(self.workers)])
+
+    def execute(self, **kwargs: Any) -> RemoteResult:
+        """Run ``execute`` in a worker process and wait for its result.
+
+        A call whose pool is recycled or whose worker dies returns an
+        error result instead of raising.
+        """
+        try:
+            future = self.executor.submit(_execute_in_worker, kwargs)
+            success, data, error = future.result()
+        except (BrokenProcessPool, CancelledError) as exc:
+            logger.warning("Tool '%s' lost its worker process: %r", self._name, exc)
+            return RemoteResult(
+                success=False,
+                error=f"Tool '{self._name}' worker process was terminated",
+            )
+        return RemoteResult(success=success, data=data, error=error)
+
+    def recycle(self) -> None:
+        """Terminate the workers, e.g. after a call timed out.
+
+        Other calls still running in this pool return an error result;
+        the next call starts a fresh pool.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pids = self._worker_pids()
+            self._pid_queue = None
+        if executor is None:
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
+        for pid in pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        logger.warning("Recycled worker processes of tool '%s'", self._name)
+
+    def _worker_pids(self) -> set[int]:
+        """PIDs of the current pool's workers started so far."""
+        queue = self._pid_queue
+        while queue is not None and not queue.empty():
+            self._pids.add(queue.get())
+        return set(self._pids)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the workers; the next call starts a fresh pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def apply_process_backend(
+    tools: dict[str, Any],
+    names: Iterable[str] = (),
+    workers: int | None = None,
+    *,
+    prestart: bool = False,
+) -> dict[str, Any]:
+    """Swap process-backed tools for :class:`ProcessTool` proxies.
+
+    Args:
+        tools: Dict from ``discover_tools()``.
+        names: Tools configured for the process backend.
+        workers: Worker processes per tool (defaults to the CPU count).
+        prestart: Fork each pool's workers in a background thread now,
+            instead of on the tool's first call.
+
+    Returns:
+        A new dict; tools not selected are passed through unchanged.
+    """
+    selected = set(names)
+    size = workers or os.cpu_count() or 1
+    result: dict[str, Any] = {}
+    for name, tool in tools.items():
+        if name in selected or _declares_process(tool):
+            proxy = ProcessTool(name, _target_of(tool), size, wrapped=tool)
+            result[name] = proxy
+            logger.info("Tool '%s' uses the process backend (%d workers)", name, size)
+            if prestart:
+                threading.Thread(
+                    target=proxy.start, name=f"axm-prefork-{name}", daemon=True
+                ).start()
+        else:
+            result[name] = tool
+    return result
+
+
+def _declares_process(tool: Any) -> bool:
+    """Whether an already-imported tool asks for the process backend."""
+    if isinstance(tool, _LazyTool):  # do not import just to ask
+        return False
+    return getattr(type(tool), _BACKEND_ATTR, None) == "process"
+
+
+def _target_of(tool: Any) -> str:
+    """Entry-point style target a worker can import the tool from."""
+    if isinstance(tool, _LazyTool):
+        return tool.target
+    cls = type(tool)
+    return f"{cls.__module__}:{cls.__qualname__}"
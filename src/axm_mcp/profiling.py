@@ -0,0 +1,205 @@
+"""On-demand profiling of a single tool call.
+
+The ``profile_tool`` meta-tool runs one call under a profiler, without
+restarting the server, and reports its top hotspots:
+
+- ``cprofile`` — deterministic profile of the calling thread, saved as
+  a ``.pstats`` file (``snakeviz``, ``gprof2dot``, ``pstats``);
+- ``sample`` — wall-clock stack sampling of the calling thread, saved
+  as collapsed stacks (``flamegraph.pl``, speedscope).
+
+Both only see the thread running the call: work it hands to shared
+pools (verify's stages) shows up as waiting, and concurrent calls on
+other threads never leak into the profile.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Literal
+
+__all__ = ["MODES", "Profile", "profile_call"]
+
+logger = logging.getLogger(__name__)
+
+MODES = ("cprofile", "sample")
+
+# Seconds between two stack samples.
+_SAMPLE_INTERVAL = 0.005
+
+
+@dataclass
+class Profile:
+    """Outcome of one profiled call.
+
+    Attributes:
+        mode: Profiler used (``cprofile`` or ``sample``).
+        seconds: Wall-clock duration of the call.
+        hotspots: Top functions, costliest first.
+        path: Saved ``.pstats`` or ``.collapsed`` file, if any.
+    """
+
+    mode: str
+    seconds: float
+    hotspots: list[dict[str, Any]] = field(default_factory=list)
+    path: Path | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready report."""
+        return {
+            "mode": self.mode,
+            "seconds": round(self.seconds, 6),
+            "hotspots": self.hotspots,
+            "file": str(self.path) if self.path else None,
+        }
+
+
+def profile_call(
+    func: Callable[..., Any],
+    kwargs: dict[str, Any],
+    *,
+    mode: Literal["cprofile", "sample"] = "cprofile",
+    top: int = 20,
+    output_dir: Path | None = None,
+    label: str = "call",
+) -> tuple[Any, Profile]:
+    """Run ``func(**kwargs)`` under a profiler.
+
+    Args:
+        func: The call to profile; runs on the current thread.
+        kwargs: Its keyword arguments.
+        mode: ``cprofile`` or ``sample``.
+        top: Number of hotspots reported.
+        output_dir: Where the profile file is saved (not saved if None).
+        label: File name prefix, e.g. the tool name.
+
+    Returns:
+        The call's return value and its profile. An exception raised by
+        *func* propagates; nothing is reported for it.
+    """
+    path = _output_path(output_dir, label, mode)
+    if mode == "sample":
+        return _sampled(func, kwargs, top, path)
+    return _deterministic(func, kwargs, top, path)
+
+
+def _deterministic(
+    func: Callable[..., Any],
+    kwargs: dict[str, Any],
+    top: int,
+    path: Path | None,
+) -> tuple[Any, Profile]:
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    result = profiler.runcall(func, **kwargs)
+    seconds = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    hotspots = []
+    for function in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        _, calls, own, cumulative, _ = stats.stats[function]  # type: ignore[attr-defined]
+        hotspots.append(
+            {
+                "function": _describe(*function),
+                "calls": calls,
+                "own_seconds": round(own, 6),
+                "cumulative_seconds": round(cumulative, 6),
+            }
+        )
+    if path is not None:
+        stats.dump_stats(path)
+    return result, Profile("cprofile", seconds, hotspots, path)
+
+
+def _sampled(
+    func: Callable[..., Any],
+    kwargs: dict[str, Any],
+    top: int,
+    path: Path | None,
+) -> tuple[Any, Profile]:
+    sampler = _Sampler(_SAMPLE_INTERVAL, threading.get_ident())
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        result = func(**kwargs)
+    finally:
+        sampler.stop()
+    seconds = time.perf_counter() - start
+
+    total = sum(sampler.stacks.values()) or 1
+    own: Counter[str] = Counter()
+    for stack, count in sampler.stacks.items():
+        own[stack.rsplit(";", 1)[-1]] += count
+    hotspots = [
+        {"function": frame, "samples": count, "percent": round(100 * count / total, 1)}
+        for frame, count in own.most_common(top)
+    ]
+    if path is not None:
+        lines = (f"{stack} {count}" for stack, count in sampler.stacks.items())
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return result, Profile("sample", seconds, hotspots, path)
+
+
+class _Sampler(threading.Thread):
+    """Background thread counting the stacks of the *target* thread."""
+
+    def __init__(self, interval: float, target: int) -> None:
+        super().__init__(name="axm-profile-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._target = target
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            self._sample()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to end."""
+        self._done.set()
+        self.join()
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self._target)
+        if frame is not None:
+            self.stacks[";".join(reversed(list(_frames(frame))))] += 1
+
+
+def _frames(frame: FrameType | None) -> Iterator[str]:
+    while frame is not None:
+        code = frame.f_code
+        yield _describe(code.co_filename, code.co_firstlineno, code.co_qualname)
+        frame = frame.f_back
+
+
+def _describe(filename: str, line: int, name: str) -> str:
+    """``name (file.py:line)``, or just the name for built-ins."""
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def _output_path(output_dir: Path | None, label: str, mode: str) -> Path | None:
+    if output_dir is None:
+        return None
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        logger.warning("Cannot save profiles to %s: %s", output_dir, exc)
+        return None
+    suffix = ".pstats" if mode == "cprofile" else ".collapsed"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return output_dir / f"{label}-{stamp}-{secrets.token_hex(2)}{suffix}"
@@ -0,0 +1,76 @@
+"""MCP progress notifications from synchronous tool code.
+
+Tool code runs on worker threads, while ``Context.report_progress`` is
+a coroutine bound to the server's event loop. :class:`ProgressReporter`
+bridges the two: it is a plain callable that schedules each report on
+the loop and returns immediately, so reporting never blocks the work.
+
+Reporters are only created when the client asked for progress (the
+request carries a ``progressToken``); otherwise tools get no callback
+and pay nothing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+__all__ = ["ProgressCallback", "ProgressReporter", "reporter_for"]
+
+logger = logging.getLogger(__name__)
+
+# progress(done, total=None, message=None)
+ProgressCallback = Callable[..., None]
+
+
+class ProgressReporter:
+    """Thread-safe callable forwarding to ``ctx.report_progress``.
+
+    Args:
+        ctx: FastMCP request context.
+        loop: Event loop serving the request.
+    """
+
+    def __init__(self, ctx: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self._ctx = ctx
+        self._loop = loop
+
+    def __call__(
+        self,
+        progress: float,
+        total: float | None = None,
+        message: str | None = None,
+    ) -> None:
+        """Schedule one progress notification; never raises."""
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self._ctx.report_progress(progress, total, message), self._loop
+            )
+        except RuntimeError:  # loop closed: the request is gone
+            return
+        future.add_done_callback(_log_failure)
+
+
+def reporter_for(ctx: Any) -> ProgressReporter | None:
+    """Reporter for the current request, or None if progress is not wanted.
+
+    Must be called on the event loop serving the request.
+    """
+    if ctx is None:
+        return None
+    try:
+        meta = ctx.request_context.meta
+    except ValueError:  # not inside a request
+        return None
+    if meta is None or getattr(meta, "progressToken", None) is None:
+        return None
+    return ProgressReporter(ctx, asyncio.get_running_loop())
+
+
+def _log_failure(future: Future[Any]) -> None:
+    """Progress is best-effort: log delivery failures and move on."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.debug("Progress notification failed: %s", future.exception())
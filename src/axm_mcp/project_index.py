@@ -0,0 +1,144 @@
+"""Content fingerprints of a project tree.
+
+Lists the project's files (``git ls-files`` when available, a filtered
+directory walk otherwise) and hashes their contents. Hashes are memoized
+on ``(mtime_ns, size)``, so fingerprinting an unchanged tree costs one
+``stat`` per file rather than a full read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+__all__ = ["FileIndex", "list_files"]
+
+logger = logging.getLogger(__name__)
+
+# Configuration that shapes audit/init results even when untracked.
+_CONFIG_FILES = (
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "mypy.ini",
+    "ruff.toml",
+    ".ruff.toml",
+    "uv.lock",
+    ".pre-commit-config.yaml",
+)
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        ".tox",
+        ".nox",
+        "node_modules",
+        "build",
+        "dist",
+        "site",
+    }
+)
+_GIT_TIMEOUT = 10.0
+
+
+def list_files(root: Path) -> list[str]:
+    """List project files as sorted POSIX paths relative to *root*.
+
+    Uses ``git ls-files`` (tracked plus untracked, non-ignored files) when
+    *root* is inside a git work tree, otherwise walks the tree skipping
+    caches and virtualenvs. Known config files are always included.
+    """
+    files = _git_files(root)
+    if files is None:
+        files = _walk_files(root)
+    files.update(name for name in _CONFIG_FILES if (root / name).is_file())
+    return sorted(files)
+
+
+def _git_files(root: Path) -> set[str] | None:
+    """Return git-visible files, or None when git is unavailable."""
+    git = shutil.which("git")
+    if git is None:
+        return None
+    try:
+        proc = subprocess.run(  # noqa: S603
+            [git, "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            check=True,
+            timeout=_GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return {name for name in proc.stdout.decode().split("\0") if name}
+
+
+def _walk_files(root: Path) -> set[str]:
+    """Walk *root*, skipping hidden, cache and virtualenv directories."""
+    files: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames if d not in _SKIP_DIRS and not d.endswith(".egg-info")
+        ]
+        rel_dir = Path(dirpath).relative_to(root)
+        files.update((rel_dir / name).as_posix() for name in filenames)
+    return files
+
+
+class FileIndex:
+    """Per-file content hashes, memoized on ``(mtime_ns, size)``.
+
+    One instance is meant to live for the whole server process so that
+    repeated fingerprints of the same tree only re-read changed files.
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def hashes(self, root: Path, files: Iterable[str]) -> dict[str, str]:
+        """Return ``{relative path: content hash}`` for existing *files*."""
+        result: dict[str, str] = {}
+        for rel in files:
+            full = root / rel
+            try:
+                st = full.stat()
+            except OSError:
+                continue  # deleted in the work tree
+            key = str(full)
+            with self._lock:
+                memo = self._memo.get(key)
+            if memo is not None and memo[:2] == (st.st_mtime_ns, st.st_size):
+                result[rel] = memo[2]
+                continue
+            try:
+                digest = hashlib.blake2b(full.read_bytes(), digest_size=16)
+            except OSError:
+                continue
+            result[rel] = digest.hexdigest()
+            with self._lock:
+                self._memo[key] = (st.st_mtime_ns, st.st_size, result[rel])
+        return result
+
+    def snapshot(self, root: Path) -> dict[str, str]:
+        """Hash every project file under *root* (see :func:`list_files`)."""
+        return self.hashes(root, list_files(root))
+
+    def fingerprint(self, root: Path) -> str:
+        """Return one digest covering every project file's path and content."""
+        digest = hashlib.sha256()
+        for rel, file_hash in sorted(self.snapshot(root).items()):
+            digest.update(f"{rel}\0{file_hash}\n".encode())
+        return digest.hexdigest()
@@ -0,0 +1,110 @@
+"""Result cache for idempotent tools.
+
+Tools such as ``bib_doi`` and ``bib_search`` answer the same arguments
+with the same result, so repeating the outbound work is wasted. A tool
+opts in with a ``cache_ttl`` class attribute (seconds) or through the
+``AXM_MCP_CACHE_TOOLS`` setting; successful results are then cached
+under the tool name and its canonicalized arguments.
+
+Lookups go through a small in-memory LRU first and fall back to a
+persistent :class:`~axm_mcp.cache.DiskCache`, so results survive server
+restarts without paying disk I/O on hot keys.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from axm_mcp.cache import DiskCache
+
+__all__ = ["ResultCache", "canonical_key"]
+
+logger = logging.getLogger(__name__)
+
+# Entries kept in memory in front of the disk tier.
+_MEMORY_ENTRIES = 256
+
+
+def canonical_key(tool_name: str, kwargs: dict[str, Any]) -> str | None:
+    """Cache key for a call, or None when the arguments are not JSON.
+
+    Argument order and JSON formatting do not matter: ``{"a": 1, "b": 2}``
+    and ``{"b": 2, "a": 1}`` map to the same key.
+    """
+    try:
+        args = json.dumps(kwargs, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return f"tool\n{tool_name}\n{args}"
+
+
+class ResultCache:
+    """Two-tier (memory, then disk) cache with per-entry expiry.
+
+    Args:
+        disk: Persistent tier; None keeps results in memory only.
+        max_entries: Size of the in-memory LRU.
+    """
+
+    def __init__(
+        self,
+        disk: DiskCache | None = None,
+        max_entries: int = _MEMORY_ENTRIES,
+    ) -> None:
+        self.disk = disk
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, *, memory_only: bool = False) -> Any | None:
+        """Return the cached value for *key*, or None on a miss.
+
+        Args:
+            key: Key from :func:`canonical_key`.
+            memory_only: Skip the disk tier (safe to call on the event
+                loop).
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > now:
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+        if memory_only or self.disk is None:
+            return None
+        found = self.disk.lookup(key)
+        if found is None or found[0] is None:
+            return None
+        value, expires = found
+        # Promote without extending the entry's lifetime
+        self._remember(key, value, expires)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Cache *value* for *ttl* seconds (forever when None)."""
+        expires = None if ttl is None else time.time() + ttl
+        self._remember(key, value, expires)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl=ttl)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def _remember(self, key: str, value: Any, expires: float | None) -> None:
+        with self._lock:
+            self._memory[key] = (expires, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
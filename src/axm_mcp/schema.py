@@ -0,0 +1,226 @@
+"""JSON schemas of tool arguments, inferred from ``execute`` signatures.
+
+Works on the JSON-friendly parameter descriptions of
+:func:`~axm_mcp.discovery_cache.describe_params`, whose annotations are
+source text: nothing is evaluated or imported, so lazy tools get a
+schema from cached metadata alone. Annotations map as follows:
+
+- ``str``, ``Path`` → string; ``int`` → integer; ``float`` → number;
+  ``bool`` → boolean; ``None`` → null;
+- ``list[X]``, ``tuple[X, ...]``, ``set[X]``, ``Sequence[X]`` → array
+  of X; ``dict[str, X]``, ``Mapping[str, X]`` → object of X;
+- ``X | Y``, ``Optional[X]``, ``Union[X, Y]`` → either;
+  ``Literal["a", "b"]`` → enum; ``Annotated[X, ...]`` → X;
+- anything else → any value.
+
+Argument descriptions come from the docstring's ``Args:`` section.
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import re
+from collections.abc import Collection
+from typing import Any
+
+__all__ = ["annotation_schema", "input_schema", "split_docstring"]
+
+_SCALARS: dict[str, dict[str, Any]] = {
+    "str": {"type": "string"},
+    "Path": {"type": "string"},
+    "PurePath": {"type": "string"},
+    "int": {"type": "integer"},
+    "float": {"type": "number"},
+    "bool": {"type": "boolean"},
+    "None": {"type": "null"},
+    "NoneType": {"type": "null"},
+    "list": {"type": "array"},
+    "tuple": {"type": "array"},
+    "dict": {"type": "object"},
+}
+_ARRAYS = frozenset(
+    {
+        "list",
+        "List",
+        "tuple",
+        "Tuple",
+        "set",
+        "Set",
+        "frozenset",
+        "FrozenSet",
+        "Sequence",
+        "MutableSequence",
+        "Collection",
+        "Iterable",
+    }
+)
+_OBJECTS = frozenset({"dict", "Dict", "Mapping", "MutableMapping"})
+# Docstring sections listing the arguments
+_ARGS_SECTION = re.compile(r"^(Args|Arguments|Parameters|Keyword Args):\s*$")
+_ARG_LINE = re.compile(r"^\*{0,2}(\w+)(?:\s*\([^)]*\))?:\s*(.*)$")
+
+
+def input_schema(
+    params: list[dict[str, Any]],
+    doc: str = "",
+    *,
+    skip: Collection[str] = (),
+) -> dict[str, Any] | None:
+    """JSON schema of the keyword arguments described by *params*.
+
+    Args:
+        params: Parameters from ``describe_params`` (or a cached spec).
+        doc: Docstring holding per-argument descriptions.
+        skip: Parameters not supplied by the caller (e.g. injected).
+
+    Returns:
+        An object schema with ``additionalProperties: false``, or None
+        when the signature takes ``**kwargs`` and so accepts anything.
+    """
+    arg_docs = split_docstring(doc)[1]
+    properties: dict[str, Any] = {}
+    required: list[str] = []
+    for param in params:
+        name = param["name"]
+        if param["kind"] == "var_keyword":
+            return None
+        if param["kind"] == "positional_only" or name in skip or name.startswith("_"):
+            continue
+        prop = annotation_schema(param.get("annotation"))
+        if "default" in param:
+            prop["default"] = param["default"]
+        if name in arg_docs:
+            prop["description"] = arg_docs[name]
+        properties[name] = prop
+        if param.get("required"):
+            required.append(name)
+    schema: dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = required
+    schema["additionalProperties"] = False
+    return schema
+
+
+def annotation_schema(annotation: str | None) -> dict[str, Any]:
+    """JSON schema of an annotation given as source text ({} for any)."""
+    if not annotation:
+        return {}
+    text = annotation.strip().strip("'\"")
+    members = _split(text, "|")
+    if len(members) > 1:
+        return _either([annotation_schema(member) for member in members])
+
+    head, args = _generic(text)
+    head = head.rsplit(".", 1)[-1]
+    if head == "Optional" and args:
+        return _either([annotation_schema(args[0]), {"type": "null"}])
+    if head == "Union":
+        return _either([annotation_schema(arg) for arg in args])
+    if head == "Annotated" and args:
+        return annotation_schema(args[0])
+    if head == "Literal":
+        return _literal(args)
+    if head in _ARRAYS:
+        schema: dict[str, Any] = {"type": "array"}
+        if args and not (
+            head in ("tuple", "Tuple") and len(args) > 1 and args[1] != "..."
+        ):
+            items = annotation_schema(args[0])
+            if items:
+                schema["items"] = items
+        return schema
+    if head in _OBJECTS:
+        schema = {"type": "object"}
+        if len(args) == 2:
+            values = annotation_schema(args[1])
+            if values:
+                schema["additionalProperties"] = values
+        return schema
+    return dict(_SCALARS.get(head, {}))
+
+
+def split_docstring(doc: str) -> tuple[str, dict[str, str]]:
+    """Split a Google-style docstring into its description and ``Args``.
+
+    Returns:
+        The docstring without its ``Args:`` section, and each argument's
+        description (continuation lines joined).
+    """
+    lines = inspect.cleandoc(doc or "").splitlines()
+    kept: list[str] = []
+    args: dict[str, str] = {}
+    section_indent: int | None = None
+    current: str | None = None
+    for line in lines:
+        indent = len(line) - len(line.lstrip())
+        if section_indent is not None:
+            if line.strip() and indent <= section_indent:
+                section_indent = current = None
+            else:
+                match = _ARG_LINE.match(line.strip())
+                if match and indent <= section_indent + 4:
+                    current = match.group(1)
+                    args[current] = match.group(2)
+                elif current is not None and line.strip():
+                    args[current] = f"{args[current]} {line.strip()}".strip()
+                continue
+        if _ARGS_SECTION.match(line.strip()):
+            section_indent = indent
+            continue
+        kept.append(line)
+    return "\n".join(kept).strip(), args
+
+
+def _either(schemas: list[dict[str, Any]]) -> dict[str, Any]:
+    """Schema accepting any of *schemas* (plain types merge into one list)."""
+    if any(not schema for schema in schemas):
+        return {}
+    if all(set(schema) == {"type"} for schema in schemas):
+        types: list[str] = []
+        for schema in schemas:
+            kind = schema["type"]
+            for name in kind if isinstance(kind, list) else [kind]:
+                if name not in types:
+                    types.append(name)
+        return {"type": types[0] if len(types) == 1 else types}
+    return {"anyOf": schemas}
+
+
+def _literal(args: list[str]) -> dict[str, Any]:
+    try:
+        values = [ast.literal_eval(arg) for arg in args]
+    except (ValueError, SyntaxError):
+        return {}
+    return {"enum": values}
+
+
+def _generic(text: str) -> tuple[str, list[str]]:
+    """``"dict[str, int]"`` → ``("dict", ["str", "int"])``."""
+    if not text.endswith("]") or "[" not in text:
+        return text, []
+    head, _, rest = text.partition("[")
+    return head.strip(), [arg.strip() for arg in _split(rest[:-1], ",")]
+
+
+def _split(text: str, separator: str) -> list[str]:
+    """Split *text* on *separator* outside brackets and quotes."""
+    parts: list[str] = []
+    depth = 0
+    quote = ""
+    start = 0
+    for index, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:index].strip())
+            start = index + 1
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
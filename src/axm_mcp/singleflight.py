@@ -0,0 +1,70 @@
+"""Single-flight coalescing of identical concurrent calls.
+
+Several agents in one session often issue the same ``verify`` or
+``bib_doi`` call at the same time. While a call is in flight, identical
+calls (same key) wait for it instead of starting their own execution,
+and every waiter receives the shared result — or the shared exception.
+
+Coalescing only spans the lifetime of one execution; it is not a cache.
+Flights are kept per event loop, as a future cannot be awaited from
+another loop: the same key running on two loops executes twice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+__all__ = ["SingleFlight"]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one execution per key at a time on each event loop.
+
+    The shared execution is shielded: a waiter that is cancelled stops
+    waiting without cancelling the work the other waiters depend on.
+    """
+
+    def __init__(self) -> None:
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Future[Any]]
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently executing, across event loops."""
+        return sum(len(flights) for flights in list(self._loops.values()))
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``factory()``, or join the in-flight execution for *key*.
+
+        Args:
+            key: Identity of the call (e.g. from ``canonical_key``).
+            factory: Starts the execution; only called by the first
+                caller of a flight.
+        """
+        inflight = self._loops.setdefault(asyncio.get_running_loop(), {})
+        future = inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            inflight[key] = future
+            future.add_done_callback(lambda done: _land(inflight, key, done))
+        else:
+            logger.debug("Coalesced call onto in-flight %r", key.split("\n", 2)[:2])
+        result: T = await asyncio.shield(future)
+        return result
+
+
+def _land(
+    inflight: dict[str, asyncio.Future[Any]], key: str, future: asyncio.Future[Any]
+) -> None:
+    """Forget a finished flight so the next call executes afresh."""
+    if inflight.get(key) is future:
+        del inflight[key]
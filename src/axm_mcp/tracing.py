@@ -0,0 +1,232 @@
+"""Span-based tracing of tool calls and verify stages.
+
+When a verify is slow, its trace shows where the time went: a root span
+per MCP call, with child spans for each tool run, each enriched failure
+and each ``ast_impact`` symbol lookup. Finished spans are appended to a
+local file, one JSON object per line, either as flat span records
+(``jsonl``) or as OTLP/JSON ``resourceSpans`` batches (``otlp``), which
+the OpenTelemetry Collector's file receiver and most trace viewers load.
+
+Tracing is off unless :func:`configure` installs an exporter. Off, a
+span costs one global lookup and yields None, and :func:`bind` returns
+functions unchanged.
+
+The current span lives in a context variable, so it follows asyncio
+tasks; work handed to a thread pool must be wrapped with :func:`bind`
+to stay in the same trace.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Literal
+
+__all__ = ["JsonlExporter", "Span", "bind", "configure", "span"]
+
+logger = logging.getLogger(__name__)
+
+_SERVICE = "axm-mcp"
+# OTLP status codes
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "axm_mcp_span", default=None
+)
+_exporter: JsonlExporter | None = None
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+
+class Span:
+    """One timed operation within a trace.
+
+    Args:
+        name: Operation name, e.g. ``verify.ast_impact``.
+        parent: Enclosing span (None starts a new trace).
+        attributes: Initial attributes.
+    """
+
+    __slots__ = (
+        "attributes",
+        "end_ns",
+        "error",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "trace_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Span | None,
+        attributes: dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.trace_id: str = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id: str = secrets.token_hex(8)
+        self.parent_id: str | None = parent.span_id if parent else None
+        self.attributes = attributes
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+
+    def set(self, key: str, value: Any) -> None:
+        """Set an attribute (str, bool, int or float)."""
+        self.attributes[key] = value
+
+    def as_record(self) -> dict[str, Any]:
+        """Flat JSON record of a finished span."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def as_otlp(self) -> dict[str, Any]:
+        """OTLP/JSON representation of a finished span."""
+        status: dict[str, Any] = {"code": _STATUS_ERROR if self.error else _STATUS_OK}
+        if self.error:
+            status["message"] = self.error
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": status,
+        }
+        if self.parent_id:
+            otlp["parentSpanId"] = self.parent_id
+        return otlp
+
+
+class JsonlExporter:
+    """Appends finished spans to a file, one JSON document per line.
+
+    Args:
+        path: Output file (parent directories are created).
+        fmt: ``jsonl`` for flat span records, ``otlp`` for OTLP/JSON.
+    """
+
+    def __init__(self, path: Path, fmt: Literal["jsonl", "otlp"] = "jsonl") -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.fmt = fmt
+        self._file = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Write one finished span; I/O errors are logged, not raised."""
+        if self.fmt == "otlp":
+            document = _otlp_batch(span.as_otlp())
+        else:
+            document = span.as_record()
+        line = json.dumps(document, default=str, separators=(",", ":"))
+        try:
+            with self._lock:
+                self._file.write(line + "\n")
+                self._file.flush()
+        except (OSError, ValueError) as exc:
+            logger.debug("Trace export failed: %s", exc)
+
+    def close(self) -> None:
+        """Close the output file."""
+        with self._lock:
+            self._file.close()
+
+
+def configure(exporter: JsonlExporter | None) -> None:
+    """Install *exporter* for all spans (None turns tracing off)."""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.close()
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Span | None]:
+    """Time the enclosed block as a child of the current span.
+
+    Yields the span, or None when tracing is off. An exception escaping
+    the block marks the span as failed.
+    """
+    if _exporter is None:
+        return _NOOP
+    return _traced(_exporter, name, attributes)
+
+
+def bind[T](func: Callable[..., T]) -> Callable[..., T]:
+    """Carry the current span into *func* when it runs on another thread.
+
+    Bind once per submitted call: a bound function must not run on two
+    threads at the same time.
+    """
+    if _exporter is None:
+        return func
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        return context.run(func, *args, **kwargs)
+
+    return run
+
+
+@contextmanager
+def _traced(
+    exporter: JsonlExporter,
+    name: str,
+    attributes: dict[str, Any],
+) -> Iterator[Span]:
+    current = Span(name, _current.get(), attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current.reset(token)
+        current.end_ns = time.time_ns()
+        exporter.export(current)
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        typed: dict[str, Any] = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _otlp_batch(otlp_span: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_otlp_attribute("service.name", _SERVICE)]},
+                "scopeSpans": [
+                    {"scope": {"name": "axm_mcp"}, "spans": [otlp_span]},
+                ],
+            }
+        ]
+    }
@@ -0,0 +1,296 @@
+"""Argument validators compiled from JSON schemas.
+
+A tool's input schema (see :mod:`axm_mcp.schema`) is compiled once, at
+registration, into nested closures: checking a call is then a handful of
+``type()`` comparisons per argument, with no schema walking. Values of
+the wrong type are coerced where the intent is unambiguous, as clients
+sending JSON through text often produce them:
+
+- ``"5"`` → ``5`` for integers, ``"0.5"`` → ``0.5`` for numbers and
+  ``5.0`` → ``5`` for integers;
+- ``"true"`` / ``"false"`` → booleans;
+- tuples → lists, path objects → strings.
+
+Everything else that does not match is reported, all problems at once,
+in an :class:`ArgumentError`. Supported keywords are ``type`` (one or a
+list), ``enum``, ``anyOf`` / ``oneOf``, ``items``, ``properties``,
+``required`` and ``additionalProperties``; other keywords are ignored.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ["ArgumentError", "Validator", "compile_validator"]
+
+# Checks (and possibly coerces) one value, raising _MismatchError.
+_Check = Callable[[Any], Any]
+Validator = Callable[[dict[str, Any]], dict[str, Any]]
+
+_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+    "array": (list,),
+    "object": (dict,),
+}
+_BOOLEANS = {"true": True, "false": False}
+
+
+class ArgumentError(ValueError):
+    """Arguments rejected by a validator.
+
+    Attributes:
+        problems: One message per offending argument.
+    """
+
+    def __init__(self, problems: list[str]) -> None:
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+class _MismatchError(Exception):
+    """A value not matching its schema, at *path* below the argument."""
+
+    def __init__(self, expected: str, value: Any, path: str = "") -> None:
+        super().__init__(expected)
+        self.expected = expected
+        self.value = value
+        self.path = path
+
+    def at(self, step: str) -> _MismatchError:
+        self.path = f"{step}{self.path}"
+        return self
+
+    def describe(self, name: str) -> str:
+        got = repr(self.value)
+        if len(got) > 40:
+            got = f"{got[:37]}..."
+        return f"'{name}{self.path}': expected {self.expected}, got {got}"
+
+
+def compile_validator(schema: dict[str, Any]) -> Validator | None:
+    """Compile the object *schema* of a tool's arguments.
+
+    Returns:
+        A function taking the call's keyword arguments and returning
+        them checked and coerced (a new dict), raising
+        :class:`ArgumentError`; None when the schema accepts any object.
+    """
+    properties = schema.get("properties") or {}
+    required = tuple(schema.get("required") or ())
+    extra = schema.get("additionalProperties", True)
+    if not properties and not required and extra is True:
+        return None
+
+    checks = {name: _compile(prop) for name, prop in properties.items()}
+    extra_check = _compile(extra) if isinstance(extra, dict) else None
+    closed = extra is False
+
+    def validate(kwargs: dict[str, Any]) -> dict[str, Any]:
+        problems: list[str] = []
+        checked: dict[str, Any] = {}
+        for name, value in kwargs.items():
+            check = checks.get(name, extra_check)
+            if check is None:
+                if closed and name not in checks:
+                    problems.append(f"unexpected argument '{name}'")
+                    continue
+                checked[name] = value
+                continue
+            try:
+                checked[name] = check(value)
+            except _MismatchError as exc:
+                problems.append(exc.describe(name))
+        problems.extend(
+            f"missing required argument '{name}'"
+            for name in required
+            if name not in kwargs
+        )
+        if problems:
+            raise ArgumentError(problems)
+        return checked
+
+    return validate
+
+
+def _compile(schema: Any) -> _Check | None:
+    """Checker for *schema*, or None when any value is accepted."""
+    if not isinstance(schema, dict):
+        return None
+    checks: list[_Check] = []
+    alternatives = schema.get("anyOf") or schema.get("oneOf")
+    if alternatives:
+        checks.append(_either([_compile(alt) for alt in alternatives]))
+    kinds = schema.get("type")
+    if kinds is not None:
+        checks.append(_types([kinds] if isinstance(kinds, str) else list(kinds)))
+    if "items" in schema and (items := _compile(schema["items"])) is not None:
+        checks.append(_items(items))
+    if "properties" in schema or "required" in schema:
+        nested = compile_validator(schema)
+        if nested is not None:
+            checks.append(_fields(nested))
+    elif (values := _compile(schema.get("additionalProperties"))) is not None:
+        checks.append(_values(values))
+    if "enum" in schema:
+        checks.append(_enum(list(schema["enum"])))
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any) -> Any:
+        for check in checks:
+            value = check(value)
+        return value
+
+    return check_all
+
+
+def _types(kinds: list[str]) -> _Check:
+    """Check against JSON types, trying exact matches before coercion."""
+    exact = frozenset(t for kind in kinds for t in _TYPES.get(kind, (object,)))
+    coercers = [_COERCERS[kind] for kind in kinds if kind in _COERCERS]
+    expected = " or ".join(kinds)
+
+    def check(value: Any) -> Any:
+        if type(value) in exact:
+            return value
+        for coerce in coercers:
+            try:
+                return coerce(value)
+            except (TypeError, ValueError):
+                continue
+        raise _MismatchError(expected, value)
+
+    return check
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)  # type: ignore[no-any-return]
+    raise TypeError
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, bool):
+        raise TypeError
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value.strip())
+    raise TypeError
+
+
+def _to_number(value: Any) -> float | int:
+    if isinstance(value, bool):
+        raise TypeError
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        return float(value.strip())
+    raise TypeError
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, str) and value.strip().lower() in _BOOLEANS:
+        return _BOOLEANS[value.strip().lower()]
+    raise TypeError
+
+
+def _to_array(value: Any) -> list[Any]:
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    raise TypeError
+
+
+def _to_object(value: Any) -> dict[str, Any]:
+    if isinstance(value, dict):
+        return dict(value)
+    raise TypeError
+
+
+_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "string": _to_string,
+    "integer": _to_integer,
+    "number": _to_number,
+    "boolean": _to_boolean,
+    "array": _to_array,
+    "object": _to_object,
+}
+
+
+def _either(checks: list[_Check | None]) -> _Check:
+    def check(value: Any) -> Any:
+        for alternative in checks:
+            if alternative is None:
+                return value
+            try:
+                return alternative(value)
+            except _MismatchError:
+                continue
+        raise _MismatchError("a value matching one of the allowed schemas", value)
+
+    return check
+
+
+def _items(item: _Check) -> _Check:
+    def check(value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        checked = []
+        for index, element in enumerate(value):
+            try:
+                checked.append(item(element))
+            except _MismatchError as exc:
+                raise exc.at(f"[{index}]") from None
+        return checked
+
+    return check
+
+
+def _values(item: _Check) -> _Check:
+    def check(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        checked = {}
+        for key, element in value.items():
+            try:
+                checked[key] = item(element)
+            except _MismatchError as exc:
+                raise exc.at(f".{key}") from None
+        return checked
+
+    return check
+
+
+def _fields(validate: Validator) -> _Check:
+    def check(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        try:
+            return validate(value)
+        except ArgumentError as exc:
+            raise _MismatchError(f"an object ({exc})", value) from None
+
+    return check
+
+
+def _enum(values: list[Any]) -> _Check:
+    expected = "one of " + ", ".join(repr(v) for v in values)
+
+    def check(value: Any) -> Any:
+        if value in values:
+            return value
+        raise _MismatchError(expected, value)
+
+    return check
@@ -2,6 +2,8 @@
 
 Orchestrates axm-audit + axm-init check in one shot, then enriches
 failures with AST context from axm-ast (callers, impact, test files).
+The three stages run as a :mod:`~axm_mcp.pipeline`: audit and init
+check side by side, enrichment once both are in.
 
 This module is decoupled: it receives discovered tools as a dict
 and calls them via Python. No subprocess nesting.
@@ -9,119 +11,583 @@ and calls them via Python. No subprocess nesting.
 
 from __future__ import annotations
 
+import copy
+import json
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures import as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
-__all__ = ["verify_project"]
+from axm_mcp import tracing
+from axm_mcp.cache import DiskCache
+from axm_mcp.discovery_cache import distributions_fingerprint
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.metrics import Call, Metrics
+from axm_mcp.pipeline import Pipeline, Step, run_pipeline
+from axm_mcp.progress import ProgressCallback
+from axm_mcp.project_index import FileIndex
+
+__all__ = [
+    "FILE_INDEX",
+    "compact_enrichment",
+    "enrich_failure",
+    "extract_symbols",
+    "impact_symbols",
+    "verify_project",
+]
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent ast_impact lookups during enrichment.
+_ENRICH_WORKERS = 8
+# Shared by every verify, so concurrent runs stay within the bound.
+_ENRICH_POOL = Dispatcher(_ENRICH_WORKERS, thread_name_prefix="axm-enrich")
+
+# Process-wide content hashes, so repeat fingerprints only stat files.
+FILE_INDEX = FileIndex()
+
 
 def verify_project(
     path: str,
     tools: dict[str, Any],
+    *,
+    cache: DiskCache | None = None,
+    timeout: float | None = None,
+    progress: ProgressCallback | None = None,
+    on_sections: Callable[[dict[str, Any]], None] | None = None,
+    on_context: Callable[[int, dict[str, Any]], None] | None = None,
+    metrics: Metrics | None = None,
 ) -> dict[str, Any]:
     """One-shot project verification: audit + init check + AST enrichment.
 
     Args:
         path: Path to project root.
         tools: Dict of discovered tools (from ``discover_tools()``).
+        cache: Optional result cache. Results are keyed on the content of
+            every project file plus the installed tool distributions, so a
+            hit is only possible when nothing relevant has changed.
+        timeout: Overall time limit in seconds. Stages still running at
+            the deadline are abandoned: a late audit or init check is
+            reported as an error section, and enrichment keeps only the
+            symbols analyzed in time. The stages cut short are listed
+            under ``timed_out``.
+        progress: Called as ``progress(done, total, message)`` when the
+            audit and init check finish and as each failure is enriched.
+            Steps are the two stages plus one per audit failure; the
+            total is unknown (None) until the audit is in.
+        on_sections: Called once with a copy of the ``audit`` and
+            ``governance`` sections as soon as both are in, before any
+            enrichment (not called on a cache hit).
+        on_context: Called as ``on_context(index, context)`` each time
+            the failure at *index* of ``audit.failed`` gets its context.
+        metrics: Records each stage as ``verify.audit``,
+            ``verify.init_check`` and ``verify.enrichment``, and each
+            symbol lookup as ``verify.ast_impact``.
 
     Returns:
         Consolidated result with 'audit' and 'governance' sections.
         Each section is None if the corresponding tool is not installed.
     """
-    audit_data = _run_tool(tools, "audit", path=path)
-    governance_data = _run_tool(tools, "init_check", path=path)
-
-    # Enrich audit failures with AST context
-    if audit_data is not None:
-        failed = audit_data.get("failed", [])
-        if failed and "ast_impact" in tools:
-            for failure in failed:
-                context = _enrich_failure(tools, path, failure)
-                if context:
-                    failure["context"] = context
+    deadline = None if timeout is None else time.monotonic() + timeout
+    hooks = _Hooks(progress, on_sections, on_context, metrics)
+    if cache is None:
+        return _verify_uncached(path, tools, deadline, hooks)
+
+    key = _cache_key(path, tools)
+    cached = cache.get(key)
+    if isinstance(cached, dict):
+        logger.debug("Verify cache hit for %s", path)
+        if progress is not None:
+            progress(1, 1, "Cached result")
+        return cached
+
+    result = _verify_uncached(path, tools, deadline, hooks)
+    if not _has_errors(result) and "timed_out" not in result:
+        cache.set(key, result)
+    return result
+
+
+def _cache_key(path: str, tools: dict[str, Any]) -> str:
+    """Key a verify result on project content and installed tools."""
+    root = Path(path).resolve()
+    return "\n".join(
+        [
+            "verify",
+            str(root),
+            FILE_INDEX.fingerprint(root),
+            distributions_fingerprint(),
+            ",".join(sorted(tools)),
+        ]
+    )
+
+
+def _has_errors(result: dict[str, Any]) -> bool:
+    """Whether any section reports a tool error (never cached)."""
+    return any(
+        isinstance(section, dict) and "error" in section for section in result.values()
+    )
+
+
+def _verify_uncached(
+    path: str,
+    tools: dict[str, Any],
+    deadline: float | None = None,
+    hooks: _Hooks | None = None,
+) -> dict[str, Any]:
+    """Run audit, init check and enrichment without consulting a cache."""
+    hooks = hooks or _Hooks()
+    if hooks.metrics is not None:
+        tools = _metered(tools, hooks.metrics)
+    stages = _VerifyStages(tools, path, deadline, hooks)
+    run = run_pipeline(
+        Pipeline(
+            "verify",
+            (
+                Step("audit", tool="audit", args={"path": "$input.path"}),
+                Step("init_check", tool="init_check", args={"path": "$input.path"}),
+                # After init_check too, so on_sections sees both sections
+                # before enrichment adds context to them
+                Step(
+                    "enrichment",
+                    func=stages.enrich,
+                    args={"audit": "$audit"},
+                    needs=("init_check",),
+                ),
+            ),
+        ),
+        tools,
+        {"path": path},
+        timeout=_remaining(deadline),
+        on_step=stages.on_step,
+    )
+
+    timed_out = run.timed_out
+    if stages.cut_short:
+        timed_out.append("enrichment")
+    result: dict[str, Any] = {
+        "audit": run.outputs["audit"],
+        "governance": run.outputs["init_check"],
+    }
+    if timed_out:
+        result["timed_out"] = timed_out
+    return result
+
+
+@dataclass(frozen=True)
+class _Hooks:
+    """Optional observers of a verify run."""
+
+    progress: ProgressCallback | None = None
+    on_sections: Callable[[dict[str, Any]], None] | None = None
+    on_context: Callable[[int, dict[str, Any]], None] | None = None
+    metrics: Metrics | None = None
+
+
+class _VerifyStages:
+    """Progress, section and enrichment hooks of one verify pipeline run."""
+
+    def __init__(
+        self,
+        tools: dict[str, Any],
+        path: str,
+        deadline: float | None,
+        hooks: _Hooks,
+    ) -> None:
+        self._tools = tools
+        self._path = path
+        self._deadline = deadline
+        self._hooks = hooks
+        self._report = hooks.progress or _no_progress
+        self._sections: dict[str, Any] = {}
+        self.cut_short = False
+
+    def on_step(self, step: str, status: str, output: Any) -> None:
+        """Report the audit, then the init check, as each settles."""
+        if step not in ("audit", "init_check"):
+            return
+        self._sections[step] = output
+        if "audit" not in self._sections:
+            return  # reported once the audit (and the total) is known
+        total = 2 + len(_failures(self._sections["audit"]))
+        if step == "audit":
+            self._report(1, total, "audit finished")
+        if "init_check" in self._sections:
+            self._report(2, total, "init_check finished")
+            if self._hooks.on_sections is not None:
+                # A copy: enrichment keeps adding context to the live sections
+                self._hooks.on_sections(
+                    copy.deepcopy(
+                        {
+                            "audit": self._sections["audit"],
+                            "governance": self._sections["init_check"],
+                        }
+                    )
+                )
+
+    def enrich(self, audit: dict[str, Any] | None) -> None:
+        """Add AST context to each audit failure once its symbols are analyzed."""
+        failed = _failures(audit)
+        if not failed or "ast_impact" not in self._tools:
+            return
+        with (
+            tracing.span("verify.enrichment", failures=len(failed)),
+            _observe(self._hooks.metrics, "verify.enrichment"),
+        ):
+            tracker = _FailureTracker(
+                self._tools,
+                self._path,
+                failed,
+                self._report,
+                done=2,
+                on_context=self._hooks.on_context,
+            )
+            impacts = impact_symbols(
+                self._tools,
+                self._path,
+                tracker.symbols,
+                self._deadline,
+                on_done=tracker.resolve,
+            )
+            if len(impacts) < len(set(tracker.symbols)):
+                self.cut_short = True
+            tracker.finish()
+
+
+def _failures(audit: dict[str, Any] | None) -> list[dict[str, Any]]:
+    """The audit's ``failed`` list (empty when absent or errored)."""
+    failed: list[dict[str, Any]] = (audit or {}).get("failed", [])
+    return failed
+
+
+class _MeteredTool:
+    """Tool proxy recording each ``execute`` as a verify stage."""
+
+    def __init__(self, tool: Any, metrics: Metrics, series: str) -> None:
+        self._tool = tool
+        self._metrics = metrics
+        self._series = series
+
+    def execute(self, **kwargs: Any) -> Any:
+        """Run the tool, counting an unsuccessful result as an error."""
+        with self._metrics.observe(self._series) as call:
+            result = self._tool.execute(**kwargs)
+            call.error = not result.success
+        return result
 
+
+def _metered(tools: dict[str, Any], metrics: Metrics) -> dict[str, Any]:
+    """Wrap the tools verify calls so each call is recorded."""
     return {
-        "audit": audit_data,
-        "governance": governance_data,
+        name: _MeteredTool(tool, metrics, f"verify.{name}")
+        if name in ("audit", "init_check", "ast_impact")
+        else tool
+        for name, tool in tools.items()
     }
 
 
-def _run_tool(
-    tools: dict[str, Any],
-    tool_name: str,
-    **kwargs: Any,
-) -> dict[str, Any] | None:
-    """Run a discovered tool, returning its data or None if unavailable."""
-    tool = tools.get(tool_name)
-    if tool is None:
-        logger.info("Tool '%s' not installed, skipping.", tool_name)
+def _observe(metrics: Metrics | None, name: str) -> Any:
+    """``metrics.observe(name)``, or a no-op without metrics."""
+    return metrics.observe(name) if metrics is not None else nullcontext(Call())
+
+
+def _no_progress(*args: Any) -> None:
+    """Progress sink used when the caller did not ask for progress."""
+
+
+class _FailureTracker:
+    """Enrich each failure as soon as all of its symbols are analyzed."""
+
+    def __init__(
+        self,
+        tools: dict[str, Any],
+        path: str,
+        failed: list[dict[str, Any]],
+        report: ProgressCallback,
+        done: int,
+        on_context: Callable[[int, dict[str, Any]], None] | None = None,
+    ) -> None:
+        self._tools = tools
+        self._on_context = on_context
+        self._path = path
+        self._failed = failed
+        self._report = report
+        self._done = done
+        self._total = done + len(failed)
+        self._impacts: dict[str, dict[str, Any] | None] = {}
+        self._pending: list[set[str]] = []
+        self._waiting: dict[str, list[int]] = {}
+        for index, failure in enumerate(failed):
+            symbols = set(extract_symbols(failure))
+            self._pending.append(symbols)
+            for symbol in symbols:
+                self._waiting.setdefault(symbol, []).append(index)
+        self.symbols = list(self._waiting)
+        for index, symbols in enumerate(self._pending):
+            if not symbols:
+                self._complete(index)
+
+    def resolve(self, symbol: str, data: dict[str, Any] | None) -> None:
+        """Record one symbol's impact and enrich failures now complete."""
+        self._impacts[symbol] = data
+        for index in self._waiting.get(symbol, ()):
+            pending = self._pending[index]
+            pending.discard(symbol)
+            if not pending:
+                self._complete(index)
+
+    def finish(self) -> None:
+        """Fold whatever is known into failures left incomplete."""
+        for index, pending in enumerate(self._pending):
+            if pending:
+                pending.clear()
+                self._complete(index)
+
+    def _complete(self, index: int) -> None:
+        failure = self._failed[index]
+        context = enrich_failure(self._tools, self._path, failure, self._impacts)
+        if context:
+            failure["context"] = context
+            if self._on_context is not None:
+                self._on_context(index, context)
+        self._done += 1
+        self._report(
+            self._done, self._total, f"enriched {failure.get('rule_id', 'failure')}"
+        )
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Seconds left until *deadline* (None when unbounded)."""
+    if deadline is None:
         return None
+    return max(0.0, deadline - time.monotonic())
+
 
+def impact_symbols(
+    tools: dict[str, Any],
+    path: str,
+    symbols: list[str],
+    deadline: float | None = None,
+    on_done: Callable[[str, dict[str, Any] | None], None] | None = None,
+) -> dict[str, dict[str, Any] | None]:
+    """Run ast_impact once per distinct symbol, on the shared enrichment pool.
+
+    Returns a mapping of symbol → impact data (None when the lookup
+    failed or returned nothing). With a *deadline*, symbols not analyzed
+    in time are left out of the mapping. *on_done* is called on the
+    calling thread as each symbol completes.
+    """
+    ast_tool = tools.get("ast_impact")
+    unique = list(dict.fromkeys(symbols))
+    if ast_tool is None or not unique:
+        return {}
+
+    if len(unique) == 1 and deadline is None:
+        data = _impact_one(ast_tool, path, unique[0])
+        if on_done is not None:
+            on_done(unique[0], data)
+        return {unique[0]: data}
+
+    pool = _ENRICH_POOL.executor
+    futures = {
+        pool.submit(tracing.bind(_impact_one), ast_tool, path, sym): sym
+        for sym in unique
+    }
+    impacts: dict[str, dict[str, Any] | None] = {}
     try:
-        result = tool.execute(**kwargs)
-        if result.success:
-            data: dict[str, Any] = result.data
-            return data
-        logger.warning("Tool '%s' failed: %s", tool_name, result.error)
-        return {"error": result.error}
-    except Exception as exc:
-        logger.warning("Tool '%s' raised: %s", tool_name, exc, exc_info=True)
-        return {"error": str(exc)}
-
-
-def _enrich_failure(
+        for future in as_completed(futures, timeout=_remaining(deadline)):
+            symbol = futures[future]
+            impacts[symbol] = future.result()
+            if on_done is not None:
+                on_done(symbol, impacts[symbol])
+    except FutureTimeout:
+        logger.warning(
+            "Verify deadline hit: %d of %d symbols not enriched",
+            len(unique) - len(impacts),
+            len(unique),
+        )
+        # Calls still running keep their threads; give others a fresh pool
+        _ENRICH_POOL.retire(pool)
+    finally:
+        for future in futures:
+            future.cancel()
+    return {sym: impacts[sym] for sym in unique if sym in impacts}
+
+
+def _impact_one(ast_tool: Any, path: str, symbol: str) -> dict[str, Any] | None:
+    """Run ast_impact for one symbol, returning its data or None."""
+    with tracing.span("verify.ast_impact", symbol=symbol) as span:
+        try:
+            result = ast_tool.execute(path=path, symbol=symbol)
+        except Exception as exc:
+            logger.debug("AST enrichment failed for %s: %s", symbol, exc)
+            result = None
+        data: dict[str, Any] | None = None
+        if result is not None and result.success and result.data:
+            data = result.data
+        if span is not None:
+            span.set("success", data is not None)
+        return data
+
+
+def enrich_failure(
     tools: dict[str, Any],
     path: str,
     failure: dict[str, Any],
+    impacts: dict[str, dict[str, Any] | None] | None = None,
 ) -> dict[str, Any] | None:
     """Enrich a failure with aggregated AST context.
 
-    Calls _extract_symbols, then ast_impact on each.
+    Calls extract_symbols, then folds the ast_impact data of each
+    symbol from *impacts* (computed on demand when not provided).
     Returns aggregated context or None if no enrichment possible.
     """
-    ast_tool = tools.get("ast_impact")
-    if ast_tool is None:
+    if tools.get("ast_impact") is None:
         return None
 
-    symbols = _extract_symbols(failure)
+    symbols = extract_symbols(failure)
     if not symbols:
         return None
 
-    # Aggregate results from all symbols
-    all_callers: list[dict[str, Any]] = []
+    with tracing.span(
+        "verify.enrich_failure",
+        rule_id=str(failure.get("rule_id", "")),
+        symbols=len(symbols),
+    ) as span:
+        context = _aggregate_impacts(tools, path, symbols, impacts)
+        if span is not None:
+            span.set("callers", len(context["callers"]) if context else 0)
+        return context
+
+
+def _aggregate_impacts(
+    tools: dict[str, Any],
+    path: str,
+    symbols: list[str],
+    impacts: dict[str, dict[str, Any] | None] | None,
+) -> dict[str, Any] | None:
+    """Fold the impact data of *symbols* into one failure context."""
+    if impacts is None:
+        impacts = impact_symbols(tools, path, symbols)
+
+    # Aggregate results from all symbols; symbols of one failure often
+    # share callers, so each caller is listed once
+    all_callers: dict[str, Any] = {}
     all_test_files: list[str] = []
     max_score: float = 0.0
     success_count = 0
 
     for symbol in symbols:
-        try:
-            result = ast_tool.execute(path=path, symbol=symbol)
-            if result.success and result.data:
-                success_count += 1
-                all_callers.extend(result.data.get("callers", []))
-                all_test_files.extend(result.data.get("test_files", []))
-                score = result.data.get("score", 0)
-                if score > max_score:
-                    max_score = score
-        except Exception as exc:
-            logger.debug("AST enrichment failed for %s: %s", symbol, exc)
+        data = impacts.get(symbol)
+        if not data:
+            continue
+        success_count += 1
+        for caller in data.get("callers", []):
+            all_callers.setdefault(_caller_key(caller), caller)
+        all_test_files.extend(data.get("test_files", []))
+        score = data.get("score", 0)
+        if score > max_score:
+            max_score = score
 
     if success_count == 0:
         return None
 
     return {
         "affected_modules": list(dict.fromkeys(symbols)),
-        "callers": all_callers,
+        "callers": list(all_callers.values()),
         "test_files": list(dict.fromkeys(all_test_files)),
         "impact_score": max_score,
         "symbols_analyzed": success_count,
     }
 
 
-def _extract_symbols(failure: dict[str, Any]) -> list[str]:
+def _caller_key(caller: Any) -> str:
+    """Identity of a caller entry (a string or a location dict)."""
+    if isinstance(caller, str):
+        return caller
+    return json.dumps(caller, sort_keys=True, default=str)
+
+
+def compact_enrichment(result: dict[str, Any]) -> dict[str, Any]:
+    """Move enrichment callers and modules to tables shared by all failures.
+
+    Failures of one project keep pointing at the same few callers and
+    modules. In the compact form each distinct caller and module is
+    listed once under ``graph``, and each failure's ``context`` refers
+    to them by index::
+
+        {"audit": {"failed": [{"context": {"callers": [0, 2],
+                                           "affected_modules": [1]}}]},
+         "graph": {"callers": [...], "modules": [...],
+                   "counts": {"callers": 3, "modules": 2,
+                              "caller_refs": 7, "failures": 4}}}
+
+    *result* is not modified; results without enriched failures are
+    returned as is.
+    """
+    audit = result.get("audit")
+    if not isinstance(audit, dict):
+        return result
+    failed = audit.get("failed")
+    if not failed or not any("context" in failure for failure in failed):
+        return result
+
+    callers: dict[str, int] = {}
+    caller_table: list[Any] = []
+    modules: dict[str, int] = {}
+    refs = 0
+    enriched = 0
+    compact_failed: list[dict[str, Any]] = []
+    for failure in failed:
+        context = failure.get("context")
+        if not isinstance(context, dict):
+            compact_failed.append(failure)
+            continue
+        enriched += 1
+        caller_ids = []
+        for caller in context.get("callers", []):
+            key = _caller_key(caller)
+            if key not in callers:
+                callers[key] = len(caller_table)
+                caller_table.append(caller)
+            caller_ids.append(callers[key])
+        refs += len(caller_ids)
+        module_ids = [
+            modules.setdefault(module, len(modules))
+            for module in context.get("affected_modules", [])
+        ]
+        compact_failed.append(
+            {
+                **failure,
+                "context": {
+                    **context,
+                    "callers": caller_ids,
+                    "affected_modules": module_ids,
+                },
+            }
+        )
+
+    return {
+        **result,
+        "audit": {**audit, "failed": compact_failed},
+        "graph": {
+            "callers": caller_table,
+            "modules": list(modules),
+            "counts": {
+                "callers": len(caller_table),
+                "modules": len(modules),
+                "caller_refs": refs,
+                "failures": enriched,
+            },
+        },
+    }
+
+
+def extract_symbols(failure: dict[str, Any]) -> list[str]:
     """Extract unique AST-queryable symbols from a failure dict.
 
     Strategy per rule_id:
@@ -0,0 +1,216 @@
+"""Streaming verify — deliver sections first, enrichment as it lands.
+
+A full ``verify`` only returns once every failure is enriched, although
+the ``audit`` and ``governance`` sections are ready much earlier. In
+streaming mode the tool call returns as soon as those sections are in,
+with a ``stream`` handle; enrichment keeps running in the background and
+each failure's ``context`` is appended to a :class:`VerifyRun` the
+moment it completes.
+
+Clients follow a run in either of two ways:
+
+- read the ``axm://verify/{run_id}`` resource, re-reading it on each
+  ``notifications/resources/updated`` the server sends for it;
+- call the ``verify_results`` tool with the last ``cursor`` they saw,
+  optionally long-polling with ``wait``.
+
+Run state is only mutated on the event loop; verify's worker thread
+hands its updates over with ``call_soon_threadsafe``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import AnyUrl
+
+__all__ = ["RUN_URI", "VerifyRun", "VerifyRuns", "session_notifier"]
+
+logger = logging.getLogger(__name__)
+
+RUN_URI = "axm://verify/{run_id}"
+
+# Finished runs kept for late readers before the oldest are dropped.
+_MAX_RUNS = 16
+# Upper bound on a single ``verify_results`` long-poll, in seconds.
+_MAX_WAIT = 30.0
+
+
+class VerifyRun:
+    """Incrementally delivered result of one streaming verify.
+
+    Args:
+        run_id: Identifier used in the resource URI.
+        notify: Called on the loop with the run's URI after each change.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        notify: Callable[[str], None] | None = None,
+    ) -> None:
+        self.run_id = run_id
+        self.sections: dict[str, Any] | None = None
+        self.contexts: list[dict[str, Any]] = []
+        self.complete = False
+        self.timed_out: list[str] | None = None
+        self.error: str | None = None
+        self._notify = notify
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._task: asyncio.Future[dict[str, Any]] | None = None
+
+    @property
+    def uri(self) -> str:
+        """Resource URI of this run."""
+        return RUN_URI.format(run_id=self.run_id)
+
+    def on_sections(self, sections: dict[str, Any]) -> None:
+        """``verify_project`` hook; safe to call from any thread."""
+        self._loop.call_soon_threadsafe(self._set_sections, sections)
+
+    def on_context(self, index: int, context: dict[str, Any]) -> None:
+        """``verify_project`` hook; safe to call from any thread."""
+        self._loop.call_soon_threadsafe(self._add_context, index, context)
+
+    def attach(self, task: asyncio.Future[dict[str, Any]]) -> None:
+        """Track the verify task that feeds this run."""
+        self._task = task
+        task.add_done_callback(self._finish)
+
+    async def first_response(self) -> dict[str, Any]:
+        """The tool call's reply: sections plus a ``stream`` handle.
+
+        If verify finishes before streaming starts (a cache hit, or no
+        failures to enrich), its full result is returned instead.
+        """
+        assert self._task is not None, "attach() a task first"
+        while self.sections is None and not self._task.done():
+            await self._wait_change()
+        if self.complete or self.sections is None:
+            return await self._task
+        return {**self.sections, "stream": self._handle()}
+
+    def snapshot(self, cursor: int = 0) -> dict[str, Any]:
+        """Contexts delivered after *cursor*, and the next cursor."""
+        cursor = max(0, cursor)
+        snapshot: dict[str, Any] = {
+            "run_id": self.run_id,
+            "complete": self.complete,
+            "contexts": self.contexts[cursor:],
+            "cursor": len(self.contexts),
+        }
+        if self.timed_out:
+            snapshot["timed_out"] = self.timed_out
+        if self.error:
+            snapshot["error"] = self.error
+        return snapshot
+
+    async def wait(self, cursor: int, timeout: float) -> None:
+        """Wait until contexts beyond *cursor* exist or the run ends."""
+        deadline = self._loop.time() + min(timeout, _MAX_WAIT)
+        while not self.complete and len(self.contexts) <= cursor:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._wait_change(), remaining)
+            except TimeoutError:
+                return
+
+    def _handle(self) -> dict[str, Any]:
+        failed = ((self.sections or {}).get("audit") or {}).get("failed") or []
+        return {
+            "run_id": self.run_id,
+            "uri": self.uri,
+            "failures": len(failed),
+            "cursor": 0,
+            "complete": self.complete,
+        }
+
+    async def _wait_change(self) -> None:
+        await self._changed.wait()
+
+    def _changed_now(self) -> None:
+        # Pulse: wake current waiters, then re-arm for the next change
+        self._changed.set()
+        self._changed = asyncio.Event()
+        if self._notify is not None:
+            self._notify(self.uri)
+
+    def _set_sections(self, sections: dict[str, Any]) -> None:
+        self.sections = sections
+        self._changed_now()
+
+    def _add_context(self, index: int, context: dict[str, Any]) -> None:
+        failed = ((self.sections or {}).get("audit") or {}).get("failed") or []
+        rule_id = failed[index].get("rule_id") if index < len(failed) else None
+        self.contexts.append({"index": index, "rule_id": rule_id, "context": context})
+        self._changed_now()
+
+    def _finish(self, task: asyncio.Future[dict[str, Any]]) -> None:
+        self.complete = True
+        if task.cancelled():
+            self.error = "verify was cancelled"
+        elif (exc := task.exception()) is not None:
+            self.error = str(exc)
+        else:
+            self.timed_out = task.result().get("timed_out")
+        self._changed_now()
+
+
+class VerifyRuns:
+    """Registry of recent streaming runs, oldest dropped first.
+
+    Args:
+        max_runs: Number of runs kept.
+    """
+
+    def __init__(self, max_runs: int = _MAX_RUNS) -> None:
+        self.max_runs = max_runs
+        self._runs: OrderedDict[str, VerifyRun] = OrderedDict()
+
+    def create(self, notify: Callable[[str], None] | None = None) -> VerifyRun:
+        """Register a new run (on the event loop)."""
+        run = VerifyRun(secrets.token_hex(8), notify)
+        self._runs[run.run_id] = run
+        while len(self._runs) > self.max_runs:
+            self._runs.popitem(last=False)
+        return run
+
+    def get(self, run_id: str) -> VerifyRun | None:
+        """Return the run, or None if unknown or already dropped."""
+        return self._runs.get(run_id)
+
+
+def session_notifier(ctx: Any) -> Callable[[str], None] | None:
+    """Send ``resources/updated`` for a URI on the caller's session.
+
+    Returns None outside a request (no session to notify).
+    """
+    try:
+        session = ctx.session
+    except (AttributeError, ValueError):
+        return None
+    pending: set[asyncio.Task[None]] = set()
+
+    def notify(uri: str) -> None:
+        task = asyncio.ensure_future(session.send_resource_updated(AnyUrl(uri)))
+        pending.add(task)
+        task.add_done_callback(_sent(pending))
+
+    return notify
+
+
+def _sent(pending: set[asyncio.Task[None]]) -> Callable[[asyncio.Task[None]], None]:
+    def done(task: asyncio.Task[None]) -> None:
+        pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Resource update failed: %s", task.exception())
+
+    return done
@@ -0,0 +1,39 @@
+"""Shared fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from axm_mcp import mcp_app
+
+# Module state mcp_app._configure() replaces, restored after each test.
+_CONFIGURED_STATE = (
+    "_settings",
+    "_dispatcher",
+    "_verify_cache",
+    "_pages",
+    "_result_cache",
+    "_configured",
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    """Keep every on-disk cache out of the developer's ``~/.cache``.
+
+    ``mcp_app`` is configured afresh from the redirected
+    ``AXM_MCP_CACHE_DIR``, as ``build_server()`` would.
+    """
+    cache_dir = tmp_path_factory.mktemp("axm-cache")
+    monkeypatch.setenv("AXM_MCP_CACHE_DIR", str(cache_dir))
+    for name in _CONFIGURED_STATE:
+        monkeypatch.setattr(mcp_app, name, getattr(mcp_app, name))
+    mcp_app._configured = False
+    mcp_app._configure()
+    yield cache_dir
+    mcp_app._dispatcher.shutdown(wait=False)
@@ -0,0 +1,43 @@
+"""Stand-ins for the AXM tool result and the FastMCP server."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp.server.fastmcp.exceptions import ToolError
+
+
+@dataclass
+class FakeToolResult:
+    """Minimal ToolResult stand-in."""
+
+    success: bool = True
+    data: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+class FakeMCP:
+    """Minimal FastMCP stand-in that captures registered tools.
+
+    Like FastMCP, registering a name twice keeps the first tool; it has
+    to be removed first.
+    """
+
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+
+    def tool(self, *, name: str) -> Any:
+        """Decorator that captures the wrapped function."""
+
+        def decorator(fn: Any) -> Any:
+            self.tools.setdefault(name, fn)
+            return fn
+
+        return decorator
+
+    def remove_tool(self, name: str) -> None:
+        """Unregister *name*, raising ToolError if it is unknown."""
+        if name not in self.tools:
+            raise ToolError(f"Unknown tool: {name}")
+        del self.tools[name]
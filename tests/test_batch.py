@@ -0,0 +1,158 @@
+"""Tests for the batch meta-tool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+from axm_mcp.config import Settings
+from axm_mcp.discovery import ToolChanges, register_tools
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.metrics import Metrics
+from tests.fakes import FakeMCP, FakeToolResult
+
+
+class SleepTool:
+    """Tool sleeping *delay* seconds and tracking concurrency."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def execute(self, *, n: int, delay: float = 0.0) -> FakeToolResult:
+        """Return *n* after *delay* seconds."""
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(delay)
+        with self._lock:
+            self.running -= 1
+        return FakeToolResult(data={"n": n})
+
+
+class FailingTool:
+    """Tool reporting a failure."""
+
+    def execute(self) -> FakeToolResult:
+        """Always fail."""
+        return FakeToolResult(success=False, error="nope")
+
+
+def _server(
+    tools: dict[str, Any], settings: Settings | None = None
+) -> tuple[FakeMCP, Dispatcher]:
+    server = FakeMCP()
+    dispatcher = Dispatcher(max_workers=8)
+    register_tools(server, tools, dispatcher=dispatcher, settings=settings)
+    return server, dispatcher
+
+
+class TestBatch:
+    """batch runs entries concurrently and answers in order."""
+
+    def test_order_and_parallelism(self) -> None:
+        """Results follow the entries; at most *parallelism* run at once."""
+        tool = SleepTool()
+        server, dispatcher = _server({"sleep": tool})
+        calls = [
+            {"tool": "sleep", "args": {"n": i, "delay": 0.05 * (i % 3)}}
+            for i in range(6)
+        ]
+
+        out = asyncio.run(server.tools["batch"](calls=calls, parallelism=2))
+        dispatcher.shutdown()
+
+        assert [r["n"] for r in out["results"]] == list(range(6))
+        assert all(r["tool"] == "sleep" and r["success"] for r in out["results"])
+        assert out["count"] == 6 and out["failed"] == 0
+        assert tool.peak == 2
+
+    def test_errors_are_isolated(self) -> None:
+        """Bad entries fail alone; the others still run."""
+        server, dispatcher = _server({"sleep": SleepTool(), "fail": FailingTool()})
+        calls = [
+            {"tool": "sleep", "args": {"n": 1}},
+            {"tool": "missing"},
+            {"tool": "fail"},
+            {"tool": "sleep", "args": {"unexpected": 1}},
+            {"tool": "sleep", "args": [1]},
+            "not an entry",
+            {"tool": "sleep", "args": {"n": 2}},
+        ]
+
+        out = asyncio.run(server.tools["batch"](kwargs={"calls": calls}))
+        dispatcher.shutdown()
+
+        results = out["results"]
+        assert results[0] == {"tool": "sleep", "success": True, "n": 1}
+        assert results[1]["error"] == "Unknown tool: missing"
+        assert results[2] == {"tool": "fail", "success": False, "error": "nope"}
+        assert results[3]["error"] == (
+            "Invalid arguments for 'sleep': unexpected argument 'unexpected'; "
+            "missing required argument 'n'"
+        )
+        assert results[4]["error"] == "args must be an object"
+        assert results[5]["success"] is False
+        assert results[6]["n"] == 2
+        assert out["failed"] == 5
+
+    def test_invalid_request(self) -> None:
+        """calls must be a list; parallelism an integer."""
+        server, dispatcher = _server({})
+        batch = server.tools["batch"]
+        assert asyncio.run(batch(calls="x"))["error"] == "calls must be a list"
+        bad = asyncio.run(batch(calls=[], parallelism="many"))
+        assert bad["error"] == "parallelism must be an integer"
+        dispatcher.shutdown()
+
+    def test_parallelism_capped_by_settings(self) -> None:
+        """A call cannot ask for more than the configured parallelism."""
+        tool = SleepTool()
+        server, dispatcher = _server({"sleep": tool}, Settings(batch_parallelism=2))
+        calls = [{"tool": "sleep", "args": {"n": i, "delay": 0.02}} for i in range(6)]
+
+        asyncio.run(server.tools["batch"](calls=calls, parallelism=50))
+        dispatcher.shutdown()
+
+        assert tool.peak <= 2
+
+    def test_metrics(self) -> None:
+        """The batch and each entry are recorded."""
+        server = FakeMCP()
+        metrics = Metrics()
+        register_tools(server, {"sleep": SleepTool()}, metrics=metrics)
+
+        calls = [{"tool": "sleep", "args": {"n": i}} for i in range(3)]
+        asyncio.run(server.tools["batch"](calls=calls))
+
+        snapshot = metrics.snapshot()["tools"]
+        assert snapshot["batch"]["calls"] == 1
+        assert snapshot["sleep"]["calls"] == 3
+
+    def test_follows_reload(self) -> None:
+        """Entries reach tools added by a reload, not removed ones."""
+        server, dispatcher = _server({"old": FailingTool()})
+        update = ToolChanges(
+            tools={"new": SleepTool()}, specs={}, added=["new"], removed=["old"]
+        )
+        register_tools(server, update.tools, dispatcher=dispatcher, update=update)
+
+        calls = [{"tool": "new", "args": {"n": 1}}, {"tool": "old"}]
+        out = asyncio.run(server.tools["batch"](calls=calls))
+        dispatcher.shutdown()
+
+        assert out["results"][0]["n"] == 1
+        assert out["results"][1]["error"] == "Unknown tool: old"
+
+
+class TestSettings:
+    """Batch parallelism comes from the environment."""
+
+    def test_from_env(self) -> None:
+        """AXM_MCP_BATCH_PARALLELISM sets the limit."""
+        env = {"AXM_MCP_BATCH_PARALLELISM": "3"}
+        assert Settings.from_env(env).batch_parallelism == 3
+        assert Settings.from_env({}).batch_parallelism == 8
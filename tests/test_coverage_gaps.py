@@ -4,30 +4,21 @@ Covers:
 - mcp_app.py: _verify_tool kwargs unwrap, main()
 - discovery.py: _register_one wrapper execution/error, _register_list_tools
 - __init__.py: main() entry point
-- verify.py: _run_tool failure and exception paths
+- pipeline.py: tool step failure and exception paths
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from typing import Any
 from unittest.mock import patch
 
 from axm_mcp.discovery import _register_list_tools, _register_one
-from axm_mcp.verify import _run_tool
+from axm_mcp.pipeline import Pipeline, Step, run_pipeline
+from tests.fakes import FakeMCP, FakeToolResult
 
 # ────────────────────────────── Helpers ──────────────────────────────
 
 
-@dataclass
-class FakeToolResult:
-    """Minimal ToolResult stand-in."""
-
-    success: bool = True
-    data: dict[str, Any] = field(default_factory=dict)
-    error: str | None = None
-
-
 class FakeTool:
     """Minimal ToolLike stand-in for testing registration."""
 
@@ -53,45 +44,29 @@ class FakeTool:
         return self._result
 
 
-class FakeMCP:
-    """Minimal FastMCP stand-in that captures registered tools."""
-
-    def __init__(self) -> None:
-        self.tools: dict[str, Any] = {}
-
-    def tool(self, *, name: str) -> Any:
-        """Decorator that captures the wrapped function."""
-
-        def decorator(fn: Any) -> Any:
-            self.tools[name] = fn
-            return fn
-
-        return decorator
-
-
 # ──────────────────────── mcp_app.py tests ───────────────────────────
 
 
 class TestVerifyToolKwargs:
     """Cover _verify_tool kwargs unwrapping (mcp_app.py:38-41)."""
 
-    def test_nested_kwargs_unwrap(self) -> None:
+    async def test_nested_kwargs_unwrap(self) -> None:
         """Nested kwargs={...} is unwrapped before delegation."""
         with patch("axm_mcp.mcp_app.verify_project") as mock_vp:
             mock_vp.return_value = {"audit": None, "governance": None}
             from axm_mcp.mcp_app import _verify_tool
 
-            _verify_tool(kwargs={"path": "/tmp/proj"})
+            await _verify_tool(kwargs={"path": "/tmp/proj"})
             # First positional arg should be the unwrapped path
             assert mock_vp.call_args[0][0] == "/tmp/proj"
 
-    def test_flat_kwargs(self) -> None:
+    async def test_flat_kwargs(self) -> None:
         """Flat kwargs are passed directly."""
         with patch("axm_mcp.mcp_app.verify_project") as mock_vp:
             mock_vp.return_value = {"audit": None, "governance": None}
             from axm_mcp.mcp_app import _verify_tool
 
-            _verify_tool(path="/tmp/proj")
+            await _verify_tool(path="/tmp/proj")
             assert mock_vp.call_args[0][0] == "/tmp/proj"
 
 
@@ -128,16 +103,16 @@ class TestInitMain:
 class TestRegisterOne:
     """Cover _register_one wrapper (discovery.py:91-97)."""
 
-    def test_wrapper_returns_success(self) -> None:
+    async def test_wrapper_returns_success(self) -> None:
         """Registered wrapper returns tool result as dict."""
         fake_mcp = FakeMCP()
         tool = FakeTool(result=FakeToolResult(success=True, data={"answer": 42}))
         _register_one(fake_mcp, "my_tool", tool)
 
-        result = fake_mcp.tools["my_tool"]()
+        result = await fake_mcp.tools["my_tool"]()
         assert result == {"success": True, "answer": 42}
 
-    def test_wrapper_includes_error(self) -> None:
+    async def test_wrapper_includes_error(self) -> None:
         """Wrapper includes error field when tool reports one."""
         fake_mcp = FakeMCP()
         tool = FakeTool(
@@ -145,17 +120,17 @@ class TestRegisterOne:
         )
         _register_one(fake_mcp, "err_tool", tool)
 
-        result = fake_mcp.tools["err_tool"]()
+        result = await fake_mcp.tools["err_tool"]()
         assert result["success"] is False
         assert result["error"] == "something broke"
 
-    def test_wrapper_unwraps_nested_kwargs(self) -> None:
+    async def test_wrapper_unwraps_nested_kwargs(self) -> None:
         """Wrapper unwraps kwargs={...} pattern from MCP."""
         fake_mcp = FakeMCP()
         tool = FakeTool(result=FakeToolResult(success=True, data={"ok": True}))
         _register_one(fake_mcp, "unwrap_tool", tool)
 
-        result = fake_mcp.tools["unwrap_tool"](kwargs={"path": "/tmp"})
+        result = await fake_mcp.tools["unwrap_tool"](kwargs={"path": "/tmp"})
         assert result["success"] is True
 
 
@@ -178,11 +153,17 @@ class TestRegisterListTools:
         assert names == ["alpha_tool", "beta_tool", "verify"]
 
 
-# ──────────────────────── verify.py tests ────────────────────────────
+# ─────────────────────── pipeline.py tests ───────────────────────────
+
+
+def _run_tool(tools: dict[str, Any], name: str, **kwargs: Any) -> Any:
+    """Output of a one-step pipeline calling *name*."""
+    pipeline = Pipeline("verify", (Step(name, tool=name, args=kwargs),))
+    return run_pipeline(pipeline, tools).outputs[name]
 
 
 class TestRunToolErrorPaths:
-    """Cover _run_tool failure/exception (verify.py:68-72)."""
+    """Cover tool step failure/exception paths."""
 
     def test_tool_failure_returns_error(self) -> None:
         """When tool.execute returns success=False, return error dict."""
@@ -0,0 +1,200 @@
+"""Tests for the persistent entry-point discovery cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from axm_mcp.config import Settings
+from axm_mcp.discovery import _LazyTool, discover_tools
+from axm_mcp.discovery_cache import (
+    describe_params,
+    distributions_fingerprint,
+    load_specs,
+)
+
+_EPS = "axm_mcp.discovery_cache.importlib.metadata.entry_points"
+_FINGERPRINT = "axm_mcp.discovery_cache.distributions_fingerprint"
+
+
+class FakeTool:
+    """Tool class with a documented, typed execute."""
+
+    name = "fake_tool"
+
+    def execute(self, *, path: str = ".", limit: int = 5, **kwargs: Any) -> Any:
+        """Run the fake tool.
+
+        Args:
+            path: Where to run.
+        """
+        return None
+
+
+def _make_ep(name: str) -> MagicMock:
+    ep = MagicMock()
+    ep.name = name
+    ep.value = "tests.test_discovery_cache:FakeTool"
+    ep.load.return_value = FakeTool
+    return ep
+
+
+class TestFingerprint:
+    """distributions_fingerprint tracks dist-info names and RECORD mtimes."""
+
+    def _install(self, site: Path, dist: str) -> Path:
+        dist_info = site / f"{dist}.dist-info"
+        dist_info.mkdir()
+        record = dist_info / "RECORD"
+        record.write_text("")
+        return record
+
+    def test_stable_when_unchanged(self, tmp_path: Path) -> None:
+        """Same tree → same fingerprint."""
+        self._install(tmp_path, "axm_audit-1.0.0")
+        paths = [str(tmp_path)]
+        assert distributions_fingerprint(paths) == distributions_fingerprint(paths)
+
+    def test_changes_on_install(self, tmp_path: Path) -> None:
+        """A new distribution changes the fingerprint."""
+        self._install(tmp_path, "axm_audit-1.0.0")
+        before = distributions_fingerprint([str(tmp_path)])
+        self._install(tmp_path, "axm_bib-0.3.0")
+        assert distributions_fingerprint([str(tmp_path)]) != before
+
+    def test_changes_on_reinstall(self, tmp_path: Path) -> None:
+        """A rewritten RECORD (same version) changes the fingerprint."""
+        record = self._install(tmp_path, "axm_audit-1.0.0")
+        before = distributions_fingerprint([str(tmp_path)])
+        stat = record.stat()
+        os.utime(record, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert distributions_fingerprint([str(tmp_path)]) != before
+
+    def test_missing_path_ignored(self, tmp_path: Path) -> None:
+        """Nonexistent sys.path entries do not raise."""
+        assert distributions_fingerprint([str(tmp_path / "nope")])
+
+
+class TestLoadSpecs:
+    """load_specs rebuilds only when the fingerprint changes."""
+
+    @patch(_FINGERPRINT, return_value="fp-1")
+    @patch(_EPS)
+    def test_cold_then_warm(
+        self, mock_eps: MagicMock, _fp: MagicMock, tmp_path: Path
+    ) -> None:
+        """Second load with an unchanged fingerprint skips the scan."""
+        mock_eps.return_value = [_make_ep("fake_tool")]
+
+        cold = load_specs("axm.tools", tmp_path)
+        warm = load_specs("axm.tools", tmp_path)
+
+        assert mock_eps.call_count == 1
+        assert cold == warm
+        assert warm[0].name == "fake_tool"
+        assert warm[0].target == "tests.test_discovery_cache:FakeTool"
+        assert warm[0].doc.startswith("Run the fake tool.")
+        assert [p["name"] for p in warm[0].params] == ["path", "limit", "kwargs"]
+
+    @patch(_FINGERPRINT)
+    @patch(_EPS)
+    def test_rebuild_on_fingerprint_change(
+        self, mock_eps: MagicMock, mock_fp: MagicMock, tmp_path: Path
+    ) -> None:
+        """A changed fingerprint invalidates the cache."""
+        mock_eps.return_value = [_make_ep("fake_tool")]
+        mock_fp.return_value = "fp-1"
+        load_specs("axm.tools", tmp_path)
+        mock_fp.return_value = "fp-2"
+        load_specs("axm.tools", tmp_path)
+
+        assert mock_eps.call_count == 2
+
+    @patch(_FINGERPRINT, return_value="fp-1")
+    @patch(_EPS)
+    def test_corrupt_cache_rebuilt(
+        self, mock_eps: MagicMock, _fp: MagicMock, tmp_path: Path
+    ) -> None:
+        """An unreadable cache file is treated as a miss."""
+        (tmp_path / "discovery.json").write_text("{not json")
+        mock_eps.return_value = [_make_ep("fake_tool")]
+
+        specs = load_specs("axm.tools", tmp_path)
+
+        assert [s.name for s in specs] == ["fake_tool"]
+        payload = json.loads((tmp_path / "discovery.json").read_text())
+        assert payload["fingerprint"] == "fp-1"
+
+    @patch(_FINGERPRINT, return_value="fp-1")
+    @patch(_EPS)
+    def test_broken_entry_point_cached_without_doc(
+        self, mock_eps: MagicMock, _fp: MagicMock, tmp_path: Path
+    ) -> None:
+        """A tool that fails to import is still recorded by name."""
+        ep = _make_ep("broken")
+        ep.load.side_effect = ImportError("missing dep")
+        mock_eps.return_value = [ep]
+
+        specs = load_specs("axm.tools", tmp_path)
+
+        assert specs[0].name == "broken"
+        assert specs[0].doc == ""
+
+
+class TestDiscoverFromCache:
+    """discover_tools(cache_dir=...) builds tools from cached specs."""
+
+    @patch(_FINGERPRINT, return_value="fp-1")
+    @patch(_EPS)
+    def test_lazy_uses_cached_doc(
+        self, mock_eps: MagicMock, _fp: MagicMock, tmp_path: Path
+    ) -> None:
+        """Lazy proxies get their docstring from the cache."""
+        mock_eps.return_value = [_make_ep("fake_tool")]
+
+        tools = discover_tools(lazy=True, cache_dir=tmp_path)
+
+        proxy = tools["fake_tool"]
+        assert isinstance(proxy, _LazyTool)
+        assert proxy.doc is not None
+        assert proxy.doc.startswith("Run the fake tool.")
+        assert not proxy.loaded
+
+    @patch(_FINGERPRINT, return_value="fp-1")
+    @patch(_EPS)
+    def test_eager_loads_from_target(
+        self, mock_eps: MagicMock, _fp: MagicMock, tmp_path: Path
+    ) -> None:
+        """Eager discovery imports the cached target directly."""
+        mock_eps.return_value = [_make_ep("fake_tool")]
+        load_specs("axm.tools", tmp_path)
+
+        tools = discover_tools(cache_dir=tmp_path)
+
+        assert type(tools["fake_tool"]).__name__ == "FakeTool"
+
+
+def test_describe_params() -> None:
+    """Parameters are described without self, with JSON-able defaults."""
+    params = describe_params(FakeTool.execute)
+    assert params[0] == {
+        "name": "path",
+        "kind": "keyword_only",
+        "annotation": "str",
+        "required": False,
+        "default": ".",
+    }
+    assert params[2]["kind"] == "var_keyword"
+    assert params[2]["required"] is False
+
+
+def test_settings_cache_env(tmp_path: Path) -> None:
+    """AXM_MCP_DISCOVERY_CACHE and AXM_MCP_CACHE_DIR are honoured."""
+    settings = Settings.from_env(
+        {"AXM_MCP_DISCOVERY_CACHE": "0", "AXM_MCP_CACHE_DIR": str(tmp_path)}
+    )
+    assert not settings.discovery_cache
+    assert settings.cache_dir == tmp_path
@@ -0,0 +1,137 @@
+"""Tests for lazy tool discovery via load-on-first-call proxies."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from axm_mcp.config import Settings
+from axm_mcp.discovery import (
+    _LazyTool,
+    _register_list_tools,
+    _register_one,
+    discover_tools,
+)
+from tests.fakes import FakeMCP, FakeToolResult
+
+_DISCOVER = "axm_mcp.discovery.importlib.metadata.entry_points"
+
+
+class FakeTool:
+    """Minimal ToolLike stand-in."""
+
+    name = "fake_tool"
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Echo the received arguments."""
+        return FakeToolResult(data={"echo": kwargs})
+
+
+def _make_ep(name: str, tool_cls: Any = FakeTool) -> MagicMock:
+    ep = MagicMock()
+    ep.name = name
+    ep.value = f"fake_pkg.tools:{name}"
+    ep.load.return_value = tool_cls
+    return ep
+
+
+class TestLazyDiscovery:
+    """discover_tools(lazy=True) defers imports to the first call."""
+
+    @patch(_DISCOVER)
+    def test_no_load_at_discovery(self, mock_eps: MagicMock) -> None:
+        """Entry points are not loaded while discovering."""
+        ep = _make_ep("fake_tool")
+        mock_eps.return_value = [ep]
+
+        tools = discover_tools(lazy=True)
+
+        assert isinstance(tools["fake_tool"], _LazyTool)
+        assert tools["fake_tool"].name == "fake_tool"
+        assert tools["fake_tool"].target == "fake_pkg.tools:fake_tool"
+        ep.load.assert_not_called()
+
+    @patch(_DISCOVER)
+    def test_loads_once_on_first_call(self, mock_eps: MagicMock) -> None:
+        """The tool is imported on first execute and then reused."""
+        ep = _make_ep("fake_tool")
+        mock_eps.return_value = [ep]
+        proxy = discover_tools(lazy=True)["fake_tool"]
+
+        first = proxy.execute(path="a")
+        second = proxy.execute(path="b")
+
+        assert first.data == {"echo": {"path": "a"}}
+        assert second.data == {"echo": {"path": "b"}}
+        assert proxy.loaded
+        ep.load.assert_called_once()
+
+    @patch(_DISCOVER)
+    def test_broken_entry_point_fails_on_call(self, mock_eps: MagicMock) -> None:
+        """A broken entry point is registered, then raises when called."""
+        ep = _make_ep("broken")
+        ep.load.side_effect = ImportError("missing dep")
+        mock_eps.return_value = [ep]
+
+        tools = discover_tools(lazy=True)
+
+        assert "broken" in tools
+        with pytest.raises(ImportError, match="missing dep"):
+            tools["broken"].execute()
+
+    def test_registration_does_not_load(self) -> None:
+        """Registering and listing lazy tools never triggers an import."""
+        ep = _make_ep("fake_tool")
+        proxy = _LazyTool(ep, doc="Cached description.\n\nMore.")
+        fake_mcp = FakeMCP()
+
+        _register_one(fake_mcp, "fake_tool", proxy)
+        _register_list_tools(fake_mcp, {"fake_tool": proxy}, {})
+        listing = fake_mcp.tools["list_tools"]()
+
+        assert listing["tools"] == [
+            {
+                "name": "fake_tool",
+                "description": "Cached description.\n\nMore.",
+                "input_schema": {"type": "object"},
+            }
+        ]
+        ep.load.assert_not_called()
+
+    async def test_wrapper_loads_on_call(self) -> None:
+        """The registered wrapper loads the proxied tool on first call."""
+        ep = _make_ep("fake_tool")
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "fake_tool", _LazyTool(ep))
+
+        result = await fake_mcp.tools["fake_tool"](path="/tmp")
+
+        assert result == {"success": True, "echo": {"path": "/tmp"}}
+        ep.load.assert_called_once()
+
+
+class TestSettings:
+    """Settings.from_env reads AXM_MCP_* variables."""
+
+    def test_defaults(self) -> None:
+        """Unset variables keep the defaults."""
+        assert Settings.from_env({}) == Settings()
+
+    @pytest.mark.parametrize("raw", ["1", "true", "YES", "on"])
+    def test_lazy_truthy(self, raw: str) -> None:
+        """Truthy values enable lazy discovery."""
+        assert Settings.from_env({"AXM_MCP_LAZY": raw}).lazy_discovery
+
+    def test_lazy_falsy(self) -> None:
+        """Other values leave it disabled."""
+        assert not Settings.from_env({"AXM_MCP_LAZY": "0"}).lazy_discovery
+
+    def test_incremental_and_workers(self) -> None:
+        """Verify and dispatch settings are read from the environment."""
+        settings = Settings.from_env(
+            {"AXM_MCP_VERIFY_INCREMENTAL": "1", "AXM_MCP_WORKERS": "6"}
+        )
+        assert settings.verify_incremental
+        assert settings.max_workers == 6
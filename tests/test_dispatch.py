@@ -0,0 +1,82 @@
+"""Tests for non-blocking tool dispatch on the managed thread pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, cast
+
+from mcp.server.fastmcp import FastMCP
+
+from axm_mcp.discovery import register_tools
+from axm_mcp.dispatch import Dispatcher
+from tests.fakes import FakeToolResult
+
+
+class SlowTool:
+    """Tool that blocks its thread for a while."""
+
+    name = "slow"
+
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Sleep, then report the executing thread."""
+        time.sleep(self._delay)
+        return FakeToolResult(data={"thread": threading.current_thread().name})
+
+
+class TestDispatcher:
+    """Dispatcher runs callables on its own pool."""
+
+    async def test_run_sync_uses_pool(self) -> None:
+        """Calls execute on an axm-tool worker thread."""
+        dispatcher = Dispatcher(max_workers=2)
+        name = await dispatcher.run_sync(lambda: threading.current_thread().name)
+        assert name.startswith("axm-tool")
+        dispatcher.shutdown()
+
+    async def test_shutdown_then_reuse(self) -> None:
+        """A shut-down dispatcher starts a fresh pool on the next call."""
+        dispatcher = Dispatcher(max_workers=1)
+        await dispatcher.run_sync(int)
+        dispatcher.shutdown()
+        assert await dispatcher.run_sync(int, "3") == 3
+        dispatcher.shutdown()
+
+
+class TestNonBlockingServer:
+    """A slow tool call does not block other requests."""
+
+    async def test_list_tools_while_slow_call_runs(self) -> None:
+        """list_tools answers promptly while a slow tool is executing."""
+        server = FastMCP("test")
+        dispatcher = Dispatcher(max_workers=4)
+        register_tools(server, {"slow": SlowTool(0.5)}, dispatcher=dispatcher)
+
+        slow = asyncio.create_task(server.call_tool("slow", {"kwargs": "{}"}))
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await server.call_tool("list_tools", {"kwargs": "{}"})
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.1
+        assert not slow.done()
+        _, structured = cast(tuple[Any, dict[str, Any]], await slow)
+        assert structured["thread"].startswith("axm-tool")
+        dispatcher.shutdown()
+
+    async def test_slow_calls_overlap(self) -> None:
+        """Concurrent slow calls run in parallel on the pool."""
+        server = FastMCP("test")
+        dispatcher = Dispatcher(max_workers=4)
+        register_tools(server, {"slow": SlowTool(0.2)}, dispatcher=dispatcher)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(server.call_tool("slow", {"kwargs": "{}"}) for _ in range(4))
+        )
+        assert time.perf_counter() - start < 0.4
+        dispatcher.shutdown()
@@ -12,6 +12,7 @@ class TestMCPServer:
 
     def test_discovery_ran(self) -> None:
         """Tool discovery ran (may be empty if no axm-* packages installed)."""
+        mcp_app.build_server()
         assert isinstance(mcp_app._discovered_tools, dict)
 
     def test_main_function_exists(self) -> None:
@@ -0,0 +1,175 @@
+"""Tests for per-tool latency and throughput metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from axm_mcp.config import Settings
+from axm_mcp.discovery import register_tools
+from axm_mcp.metrics import Metrics
+from axm_mcp.verify import verify_project
+from tests.fakes import FakeMCP, FakeToolResult
+
+
+class FlakyTool:
+    """Tool failing when asked to."""
+
+    name = "flaky"
+
+    def execute(self, *, fail: bool = False) -> FakeToolResult:
+        """Fail or succeed on demand."""
+        if fail:
+            return FakeToolResult(success=False, error="nope")
+        return FakeToolResult(data={"ok": True})
+
+
+class FixedTool:
+    """Tool returning fixed data."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return the configured data."""
+        return FakeToolResult(data=dict(self._data))
+
+
+class ImpactTool:
+    """ast_impact stand-in."""
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return one caller per symbol."""
+        return FakeToolResult(data={"callers": [symbol]})
+
+
+class TestMetrics:
+    """Metrics counts calls, errors and in-flight calls."""
+
+    def test_counts_and_quantiles(self) -> None:
+        """Completed calls feed the counters and latency window."""
+        metrics = Metrics()
+        for i in range(10):
+            with metrics.observe("t") as call:
+                call.error = i < 3
+
+        series = metrics.snapshot()["tools"]["t"]
+        assert series["calls"] == 10
+        assert series["errors"] == 3
+        assert series["in_flight"] == 0
+        assert set(series["latency_ms"]) == {"p50", "p95", "p99", "max"}
+        assert series["latency_ms"]["p50"] <= series["latency_ms"]["p99"]
+
+    def test_in_flight_and_exceptions(self) -> None:
+        """Running calls are gauged; exceptions count as errors."""
+        metrics = Metrics()
+        inside = threading.Event()
+        release = threading.Event()
+
+        def slow() -> None:
+            with metrics.observe("t"):
+                inside.set()
+                release.wait(5)
+
+        worker = threading.Thread(target=slow)
+        worker.start()
+        inside.wait(5)
+        assert metrics.snapshot()["tools"]["t"]["in_flight"] == 1
+        release.set()
+        worker.join()
+
+        with pytest.raises(RuntimeError), metrics.observe("t"):
+            raise RuntimeError("boom")
+        series = metrics.snapshot()["tools"]["t"]
+        assert (series["calls"], series["errors"], series["in_flight"]) == (2, 1, 0)
+
+    def test_prometheus_format(self) -> None:
+        """Counters, gauge and summary lines per series."""
+        metrics = Metrics()
+        with metrics.observe("bib_doi"):
+            pass
+
+        text = metrics.prometheus()
+
+        assert "# TYPE axm_mcp_calls_total counter" in text
+        assert 'axm_mcp_calls_total{tool="bib_doi"} 1' in text
+        assert 'axm_mcp_in_flight{tool="bib_doi"} 0' in text
+        assert 'axm_mcp_latency_seconds{tool="bib_doi",quantile="0.99"}' in text
+        assert 'axm_mcp_latency_seconds_count{tool="bib_doi"} 1' in text
+        assert text.endswith("\n")
+
+
+class TestWrapperMetrics:
+    """Registered tools record into the registry."""
+
+    def test_calls_and_meta_tool(self) -> None:
+        """Failed results count as errors; ``metrics`` reports them."""
+        metrics = Metrics()
+        fake_mcp = FakeMCP()
+        register_tools(fake_mcp, {"flaky": FlakyTool()}, metrics=metrics)
+
+        async def calls() -> None:
+            await fake_mcp.tools["flaky"]()
+            await fake_mcp.tools["flaky"](fail=True)
+
+        asyncio.run(calls())
+
+        report = fake_mcp.tools["metrics"]()
+        assert report["tools"]["flaky"]["calls"] == 2
+        assert report["tools"]["flaky"]["errors"] == 1
+        text = fake_mcp.tools["metrics"](kwargs={"format": "prometheus"})["text"]
+        assert 'axm_mcp_errors_total{tool="flaky"} 1' in text
+
+    def test_no_meta_tool_without_registry(self) -> None:
+        """Without metrics, no ``metrics`` tool is registered."""
+        fake_mcp = FakeMCP()
+        register_tools(fake_mcp, {"flaky": FlakyTool()})
+        assert "metrics" not in fake_mcp.tools
+
+
+class TestVerifyStageMetrics:
+    """verify_project records each stage and symbol lookup."""
+
+    def test_stages(self) -> None:
+        """Audit, init check, enrichment and lookups are recorded."""
+        metrics = Metrics()
+        failed = [
+            {"rule_id": "A", "message": "Function one failed"},
+            {"rule_id": "B", "message": "Function two failed"},
+        ]
+        tools = {
+            "audit": FixedTool({"failed": failed}),
+            "init_check": FixedTool({"score": 100}),
+            "ast_impact": ImpactTool(),
+        }
+
+        verify_project("/tmp", tools, metrics=metrics)
+
+        series = metrics.snapshot()["tools"]
+        assert series["verify.audit"]["calls"] == 1
+        assert series["verify.init_check"]["calls"] == 1
+        assert series["verify.enrichment"]["calls"] == 1
+        assert series["verify.ast_impact"]["calls"] == 2
+
+
+class TestServer:
+    """Server-level metrics wiring."""
+
+    def test_transport_setting(self) -> None:
+        """Known transports are accepted, others fall back to stdio."""
+        env = {"AXM_MCP_TRANSPORT": "streamable-http"}
+        assert Settings.from_env(env).transport == "streamable-http"
+        assert Settings.from_env({"AXM_MCP_TRANSPORT": "ftp"}).transport == "stdio"
+
+    def test_prometheus_endpoint(self) -> None:
+        """``/metrics`` serves the registry in text format."""
+        from axm_mcp.mcp_app import _metrics_endpoint
+
+        response = asyncio.run(_metrics_endpoint(MagicMock()))
+
+        assert response.media_type.startswith("text/plain")
+        assert b"# TYPE axm_mcp_calls_total counter" in response.body
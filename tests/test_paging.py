@@ -0,0 +1,183 @@
+"""Tests for the response budget (paged result lists)."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from axm_mcp.config import Settings
+from axm_mcp.discovery import _register_one
+from axm_mcp.paging import Paginator
+from tests.fakes import FakeMCP, FakeToolResult
+
+
+class ManyErrorsTool:
+    """Tool returning a long ``errors`` list."""
+
+    name = "lint"
+
+    def execute(self, *, count: int = 25) -> FakeToolResult:
+        """Return *count* errors."""
+        return FakeToolResult(data={"errors": [f"e{i}" for i in range(count)]})
+
+
+def _verify_result(failures: int, callers: int) -> dict[str, Any]:
+    return {
+        "audit": {
+            "score": 50,
+            "failed": [
+                {
+                    "rule_id": f"R{i}",
+                    "context": {"callers": [f"c{i}.{j}" for j in range(callers)]},
+                }
+                for i in range(failures)
+            ],
+        },
+        "governance": None,
+    }
+
+
+def _drain(pages: Paginator, cursor: str | None) -> list[Any]:
+    items: list[Any] = []
+    while cursor is not None:
+        page = pages.page(cursor)
+        items += page["items"]
+        cursor = page["cursor"]
+    return items
+
+
+class TestPaginator:
+    """Paginator cuts paged lists and serves the rest."""
+
+    def test_small_response_untouched(self) -> None:
+        """A response within budget is returned as is."""
+        response = _verify_result(2, 2)
+        assert Paginator(max_items=10).apply(response) is response
+
+    def test_cut_and_continue(self) -> None:
+        """Cut lists are recorded in ``_pages`` and fully recoverable."""
+        pages = Paginator(max_items=4)
+        response = _verify_result(10, 1)
+
+        out = pages.apply(response)
+
+        assert len(out["audit"]["failed"]) == 4
+        cut = out["_pages"]["audit.failed"]
+        assert cut["total"] == 10
+        assert cut["returned"] == 4
+        rest = _drain(pages, cut["cursor"])
+        assert out["audit"]["failed"] + rest == response["audit"]["failed"]
+
+    def test_nested_lists_paged(self) -> None:
+        """Callers inside kept failures are cut under their own path."""
+        pages = Paginator(max_items=3)
+
+        out = pages.apply(_verify_result(2, 7))
+
+        path = "audit.failed[1].context.callers"
+        assert len(out["audit"]["failed"][1]["context"]["callers"]) == 3
+        rest = _drain(pages, out["_pages"][path]["cursor"])
+        assert rest == [f"c1.{j}" for j in range(3, 7)]
+
+    def test_input_not_modified(self) -> None:
+        """Shared (cached, coalesced) results are never mutated."""
+        response = _verify_result(5, 5)
+        before = copy.deepcopy(response)
+
+        Paginator(max_items=2).apply(response)
+
+        assert response == before
+
+    def test_byte_budget(self) -> None:
+        """The page size shrinks until the response fits in bytes."""
+        pages = Paginator(max_bytes=2000)
+        response = _verify_result(1, 500)
+
+        out = pages.apply(response)
+
+        assert len(json.dumps(out)) <= 2000
+        cut = out["_pages"]["audit.failed[0].context.callers"]
+        kept = out["audit"]["failed"][0]["context"]["callers"]
+        assert kept + _drain(pages, cut["cursor"]) == [f"c0.{j}" for j in range(500)]
+
+    def test_unpageable_response_not_encoded(self) -> None:
+        """Responses without a paged list skip the byte-budget check."""
+        pages = Paginator(max_items=10, max_bytes=100)
+        response = {"report": "x" * 1000, "errors": ["only one"]}
+
+        with patch("axm_mcp.paging._size") as size:
+            assert pages.apply(response) is response
+
+        size.assert_not_called()
+
+    def test_expired_cursor(self) -> None:
+        """Cursors of dropped lists are rejected."""
+        pages = Paginator(max_items=1, max_cursors=1)
+        first = pages.apply({"errors": [1, 2]})["_pages"]["errors"]["cursor"]
+        pages.apply({"errors": [3, 4]})
+
+        with pytest.raises(KeyError):
+            pages.page(first)
+        with pytest.raises(KeyError):
+            pages.page("garbage")
+
+    def test_disabled(self) -> None:
+        """Without a budget, nothing is cut."""
+        response = _verify_result(500, 1)
+        assert Paginator().apply(response) is response
+
+
+class TestSettings:
+    """Budget settings are read from the environment."""
+
+    def test_from_env(self) -> None:
+        """Both budgets are configurable, 0 disabling them."""
+        settings = Settings.from_env(
+            {"AXM_MCP_PAGE_ITEMS": "50", "AXM_MCP_MAX_RESPONSE_KB": "0"}
+        )
+        assert settings.page_items == 50
+        assert settings.max_response_kb == 0
+
+
+class TestWrapperBudget:
+    """Registered tools return results within the response budget."""
+
+    def test_tool_result_paged(self) -> None:
+        """A long list is cut and the rest served by cursor."""
+        pages = Paginator(max_items=10)
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "lint", ManyErrorsTool(), pages=pages)
+
+        out = asyncio.run(fake_mcp.tools["lint"](count=25))
+
+        assert out["success"] is True
+        assert out["errors"] == [f"e{i}" for i in range(10)]
+        rest = _drain(pages, out["_pages"]["errors"]["cursor"])
+        assert rest == [f"e{i}" for i in range(10, 25)]
+
+
+class TestNextPageTool:
+    """The next_page meta-tool serves continuation pages."""
+
+    def test_unknown_cursor(self) -> None:
+        """An unknown cursor is reported as an error."""
+        from axm_mcp.mcp_app import _next_page_tool
+
+        result = _next_page_tool(cursor="nope:1")
+        assert "Unknown or expired cursor" in result["error"]
+
+    def test_pages_through_server(self) -> None:
+        """next_page walks a list cut by the server's paginator."""
+        from axm_mcp import mcp_app
+
+        out = mcp_app._pages.apply({"errors": list(range(450))})
+        page = mcp_app._next_page_tool(
+            kwargs={"cursor": out["_pages"]["errors"]["cursor"]}
+        )
+        assert page["offset"] == len(out["errors"])
+        assert page["total"] == 450
@@ -0,0 +1,245 @@
+"""Tests for declarative tool pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from axm_mcp.pipeline import (
+    Pipeline,
+    PipelineError,
+    Step,
+    load_pipeline,
+    run_pipeline,
+)
+from axm_mcp.result_cache import ResultCache
+from tests.fakes import FakeToolResult
+
+
+class EchoTool:
+    """Tool returning its arguments, after *delay* seconds."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Echo *kwargs*."""
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return FakeToolResult(data={"args": kwargs, "items": ["a", "b"]})
+
+
+class FailingTool:
+    """Tool reporting a failure."""
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Always fail."""
+        return FakeToolResult(success=False, error="nope")
+
+
+def _spec(*steps: dict[str, Any]) -> dict[str, Any]:
+    return {"name": "test", "steps": list(steps)}
+
+
+class TestSpec:
+    """Specs are parsed and validated up front."""
+
+    def test_from_dict(self) -> None:
+        """Ids default to the tool; references imply dependencies."""
+        pipeline = Pipeline.from_dict(
+            _spec(
+                {"tool": "audit", "args": {"path": "$input.path"}},
+                {"id": "b", "tool": "echo", "args": {"x": "$audit.failed"}},
+                {"id": "c", "tool": "echo", "needs": "b", "args": {"y": "$$lit"}},
+            )
+        )
+        assert [step.id for step in pipeline.steps] == ["audit", "b", "c"]
+        assert pipeline.dependencies == {"audit": (), "b": ("audit",), "c": ("b",)}
+
+    @pytest.mark.parametrize(
+        ("spec", "message"),
+        [
+            ({"steps": []}, "non-empty 'steps'"),
+            (_spec({"id": "a"}), "needs a 'tool'"),
+            (_spec({"tool": "a", "retries": 2}), "unknown keys: retries"),
+            (_spec({"tool": "a"}, {"tool": "a"}), "Duplicate step id"),
+            (_spec({"tool": "a", "args": {"x": "$b.y"}}), "unknown step 'b'"),
+            (_spec({"tool": "a", "cache": -1}), "'cache' must be seconds"),
+            (
+                _spec(
+                    {"id": "a", "tool": "t", "needs": "b"},
+                    {"id": "b", "tool": "t", "needs": "a"},
+                ),
+                "cycle between steps: a, b",
+            ),
+        ],
+    )
+    def test_invalid(self, spec: dict[str, Any], message: str) -> None:
+        """Malformed specs raise PipelineError."""
+        with pytest.raises(PipelineError, match=message):
+            Pipeline.from_dict(spec)
+
+    def test_load_files(self, tmp_path: Path) -> None:
+        """TOML and JSON files load; the name defaults to the file stem."""
+        toml = tmp_path / "docs.toml"
+        toml.write_text('[[steps]]\ntool = "audit"\nargs = { path = "$input.path" }\n')
+        pipeline = load_pipeline(toml)
+        assert pipeline.name == "docs"
+        assert pipeline.steps[0].args == {"path": "$input.path"}
+
+        spec = tmp_path / "spec.json"
+        spec.write_text(json.dumps(_spec({"tool": "audit"})))
+        assert load_pipeline(spec).name == "test"
+
+        with pytest.raises(PipelineError, match="Unsupported"):
+            load_pipeline(tmp_path / "spec.ini")
+
+
+class TestRun:
+    """run_pipeline runs the DAG in parallel and wires outputs to inputs."""
+
+    def test_parallel_and_wiring(self) -> None:
+        """Independent steps overlap; references resolve to outputs."""
+        echo = EchoTool(delay=0.05)
+        pipeline = Pipeline.from_dict(
+            _spec(
+                {"id": "a", "tool": "echo", "args": {"path": "$input.path"}},
+                {"id": "b", "tool": "echo", "args": {"n": 1}},
+                {"id": "c", "tool": "echo", "args": {"item": "$a.items.1", "b": "$b"}},
+            )
+        )
+        run = run_pipeline(pipeline, {"echo": echo}, {"path": "/p"})
+
+        assert echo.peak == 2
+        assert run.status == {"a": "ok", "b": "ok", "c": "ok"}
+        assert run.outputs["a"]["args"] == {"path": "/p"}
+        assert run.outputs["c"]["args"]["item"] == "b"
+        assert run.outputs["c"]["args"]["b"]["args"] == {"n": 1}
+
+    def test_max_workers_per_run(self) -> None:
+        """A run keeps at most max_workers steps in flight on the shared pool."""
+        echo = EchoTool(delay=0.02)
+        pipeline = Pipeline.from_dict(
+            _spec(*({"id": f"s{i}", "tool": "echo"} for i in range(4)))
+        )
+        run = run_pipeline(pipeline, {"echo": echo}, max_workers=1)
+
+        assert echo.peak == 1
+        assert set(run.status.values()) == {"ok"}
+
+    def test_failures_skip_dependents(self) -> None:
+        """Missing tools, failures and unresolved references are reported."""
+        pipeline = Pipeline.from_dict(
+            _spec(
+                {"id": "bad", "tool": "fail"},
+                {"id": "gone", "tool": "missing"},
+                {"id": "after", "tool": "echo", "args": {"x": "$bad.items"}},
+                {"id": "typo", "tool": "echo", "args": {"x": "$gone"}, "needs": "bad"},
+            )
+        )
+        run = run_pipeline(pipeline, {"echo": EchoTool(), "fail": FailingTool()})
+
+        assert run.status == {
+            "bad": "error",
+            "gone": "missing",
+            "after": "skipped",
+            "typo": "ok",
+        }
+        assert run.outputs["bad"] == {"error": "nope"}
+        assert run.outputs["after"] == {"error": "Step 'bad' did not succeed (error)"}
+        assert run.outputs["typo"]["args"] == {"x": None}
+        assert run.as_dict()["failed"] == 3
+
+    def test_deadline(self) -> None:
+        """Tool steps still running at the deadline are abandoned."""
+        slow = EchoTool(delay=1.0)
+        pipeline = Pipeline.from_dict(
+            _spec({"id": "slow", "tool": "slow"}, {"tool": "echo"})
+        )
+        start = time.monotonic()
+        run = run_pipeline(pipeline, {"slow": slow, "echo": EchoTool()}, timeout=0.1)
+
+        assert time.monotonic() - start < 0.5
+        assert run.timed_out == ["slow"]
+        assert run.status["echo"] == "ok"
+        assert "deadline" in run.outputs["slow"]["error"]
+
+    def test_cache(self) -> None:
+        """Steps declaring cache reuse results for the same arguments."""
+        echo = EchoTool()
+        pipeline = Pipeline.from_dict(
+            _spec(
+                {"id": "kept", "tool": "echo", "args": {"n": 1}, "cache": 60},
+                {"id": "fresh", "tool": "echo", "args": {"n": 2}},
+            )
+        )
+        cache = ResultCache()
+        run_pipeline(pipeline, {"echo": echo}, cache=cache)
+        run = run_pipeline(pipeline, {"echo": echo}, cache=cache)
+
+        assert run.status == {"kept": "cached", "fresh": "ok"}
+        assert run.outputs["kept"]["args"] == {"n": 1}
+        assert echo.calls == 3
+
+    def test_on_step_before_dependents(self) -> None:
+        """on_step sees each step before anything depending on it starts."""
+        events: list[str] = []
+
+        def record(a: Any) -> Any:
+            events.append("b ran")
+            return a
+
+        pipeline = Pipeline(
+            "fn",
+            (
+                Step("a", tool="echo"),
+                Step("b", func=record, args={"a": "$a"}),
+            ),
+        )
+        run = run_pipeline(
+            pipeline,
+            {"echo": EchoTool()},
+            on_step=lambda step, status, output: events.append(f"{step} {status}"),
+        )
+
+        assert events == ["a ok", "b ran", "b ok"]
+        assert run.outputs["b"] is run.outputs["a"]
+
+
+class TestMetaTool:
+    """The pipeline meta-tool runs specs against the discovered tools."""
+
+    def test_spec_argument(self) -> None:
+        """A spec passed inline runs; bad specs are errors."""
+        from axm_mcp import mcp_app
+
+        spec = _spec({"tool": "echo", "args": {"path": "$input.path"}})
+        with patch.object(mcp_app, "_discovered_tools", {"echo": EchoTool()}):
+            result = asyncio.run(
+                mcp_app._pipeline_tool(kwargs={"spec": spec, "inputs": {"path": "."}})
+            )
+            bad = asyncio.run(mcp_app._pipeline_tool(spec={"steps": "x"}))
+            none = asyncio.run(mcp_app._pipeline_tool())
+
+        assert result["pipeline"] == "test"
+        assert result["outputs"]["echo"]["args"] == {"path": "."}
+        assert result["steps"]["echo"]["status"] == "ok"
+        assert result["failed"] == 0
+        assert "non-empty 'steps'" in bad["error"]
+        assert none["error"] == "Pass a pipeline spec or file"
@@ -0,0 +1,132 @@
+"""Tests for the process-pool execution backend."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from axm_mcp.config import Settings
+from axm_mcp.discovery import _LazyTool, accepts_argument
+from axm_mcp.process_backend import ProcessTool, RemoteResult, apply_process_backend
+from tests.fakes import FakeToolResult
+
+_TARGET = "tests.test_process_backend:PidTool"
+
+
+class PidTool:
+    """Tool reporting the process it runs in."""
+
+    name = "pid_tool"
+
+    def execute(
+        self, *, path: str = ".", fail: bool = False, delay: float = 0.0
+    ) -> FakeToolResult:
+        """Return the worker PID after *delay* seconds, or an error result."""
+        time.sleep(delay)
+        if fail:
+            return FakeToolResult(success=False, error="bad input")
+        return FakeToolResult(data={"pid": os.getpid(), "path": path})
+
+
+class DeclaredTool(PidTool):
+    """Tool that asks for the process backend itself."""
+
+    execution_backend = "process"
+
+
+@pytest.fixture()
+def proxy() -> Any:
+    tool = ProcessTool("pid_tool", _TARGET, workers=2, wrapped=PidTool())
+    yield tool
+    tool.shutdown()
+
+
+class TestProcessTool:
+    """ProcessTool runs execute in worker processes."""
+
+    def test_runs_in_other_process(self, proxy: ProcessTool) -> None:
+        """Results come back over IPC in the ToolResult shape."""
+        result = proxy.execute(path="/tmp/x")
+        assert isinstance(result, RemoteResult)
+        assert result.success
+        assert result.data["path"] == "/tmp/x"
+        assert result.data["pid"] != os.getpid()
+
+    def test_error_result_preserved(self, proxy: ProcessTool) -> None:
+        """success=False and error survive the round trip."""
+        result = proxy.execute(fail=True)
+        assert result == RemoteResult(success=False, data={}, error="bad input")
+
+    def test_start_prefork_workers(self, proxy: ProcessTool) -> None:
+        """start() brings up every worker."""
+        proxy.start()
+        assert len(proxy._worker_pids()) == 2
+
+    def test_recycle_fails_calls_in_flight(self, proxy: ProcessTool) -> None:
+        """Recycling kills busy workers; their calls return an error result."""
+        proxy.start()
+        pids = proxy._worker_pids()
+        results: list[RemoteResult] = []
+        calls = [
+            threading.Thread(target=lambda: results.append(proxy.execute(delay=30)))
+            for _ in range(2)
+        ]
+        for call in calls:
+            call.start()
+        time.sleep(0.3)
+
+        proxy.recycle()
+        for call in calls:
+            call.join(timeout=10)
+
+        assert len(results) == 2
+        assert all(not r.success and "terminated" in (r.error or "") for r in results)
+        assert proxy.execute().data["pid"] not in pids
+
+    def test_metadata_from_wrapped(self, proxy: ProcessTool) -> None:
+        """Signature lookups see through the proxy."""
+        assert accepts_argument(proxy, "path")
+        assert not accepts_argument(proxy, "files")
+
+
+class TestApplyProcessBackend:
+    """apply_process_backend selects tools by config or attribute."""
+
+    def test_configured_names(self) -> None:
+        """Configured tools are swapped; others pass through."""
+        other = PidTool()
+        tools = apply_process_backend(
+            {"pid_tool": PidTool(), "other": other}, {"pid_tool"}, workers=1
+        )
+        assert isinstance(tools["pid_tool"], ProcessTool)
+        assert tools["pid_tool"].target == _TARGET
+        assert tools["other"] is other
+
+    def test_class_attribute(self) -> None:
+        """execution_backend = 'process' opts a tool in."""
+        tools = apply_process_backend({"declared": DeclaredTool()}, workers=1)
+        assert isinstance(tools["declared"], ProcessTool)
+        assert tools["declared"].target.endswith(":DeclaredTool")
+
+    def test_lazy_proxy_uses_entry_point_target(self) -> None:
+        """Lazy proxies keep their target and are not imported."""
+        ep = MagicMock()
+        ep.name = "pid_tool"
+        ep.value = _TARGET
+        tools = apply_process_backend({"pid_tool": _LazyTool(ep)}, {"pid_tool"})
+        assert tools["pid_tool"].target == _TARGET
+        ep.load.assert_not_called()
+
+
+def test_settings_process_tools() -> None:
+    """AXM_MCP_PROCESS_TOOLS is a comma-separated list."""
+    settings = Settings.from_env(
+        {"AXM_MCP_PROCESS_TOOLS": "audit, ast_impact,", "AXM_MCP_PROCESS_WORKERS": "4"}
+    )
+    assert settings.process_tools == frozenset({"audit", "ast_impact"})
+    assert settings.process_workers == 4
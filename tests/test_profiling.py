@@ -0,0 +1,124 @@
+"""Tests for on-demand profiling of tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import pstats
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from axm_mcp.config import Settings
+from axm_mcp.profiling import profile_call
+from tests.fakes import FakeToolResult
+
+
+def crunch(n: int = 20000) -> int:
+    """Burn some CPU."""
+    return sum(i * i for i in range(n))
+
+
+def spin(seconds: float) -> None:
+    """Stay busy on the current thread for *seconds*."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        crunch(200)
+
+
+class CrunchTool:
+    """Tool doing pure-Python work."""
+
+    name = "crunch"
+
+    def execute(self, *, n: int = 20000) -> FakeToolResult:
+        """Return the sum of squares below *n*."""
+        return FakeToolResult(data={"total": crunch(n)})
+
+
+class TestProfileCall:
+    """profile_call reports hotspots and saves a profile."""
+
+    def test_cprofile(self, tmp_path: Path) -> None:
+        """The pstats file loads and hotspots name the busy function."""
+        result, profile = profile_call(
+            crunch, {"n": 50000}, output_dir=tmp_path, label="crunch", top=5
+        )
+
+        assert result == sum(i * i for i in range(50000))
+        assert profile.mode == "cprofile"
+        assert len(profile.hotspots) <= 5
+        assert any("crunch" in h["function"] for h in profile.hotspots)
+        assert profile.path is not None
+        assert profile.path.name.startswith("crunch-")
+        stats = pstats.Stats(str(profile.path)).get_stats_profile()
+        assert any("crunch" in name for name in stats.func_profiles)
+
+    def test_sample_only_calling_thread(self, tmp_path: Path) -> None:
+        """A concurrent, unrelated thread stays out of collapsed stacks."""
+        other = threading.Thread(target=spin, args=(0.3,))
+        other.start()
+
+        def busy() -> str:
+            end = time.perf_counter() + 0.2
+            while time.perf_counter() < end:
+                crunch(200)
+            return "done"
+
+        try:
+            result, profile = profile_call(busy, {}, mode="sample", output_dir=tmp_path)
+        finally:
+            other.join()
+
+        assert result == "done"
+        assert profile.path is not None
+        stacks = profile.path.read_text().splitlines()
+        assert any("busy" in line for line in stacks)
+        assert not any("spin" in line for line in stacks)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+        assert sum(h["samples"] for h in profile.hotspots) > 0
+
+    def test_exception_propagates(self) -> None:
+        """A failing call raises; nothing is saved."""
+
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            profile_call(boom, {})
+
+
+class TestProfileTool:
+    """The profile_tool meta-tool."""
+
+    def test_profiles_discovered_tool(self, tmp_path: Path) -> None:
+        """Hotspots and the saved file are reported with the outcome."""
+        from axm_mcp import mcp_app
+
+        with (
+            patch.object(mcp_app, "_discovered_tools", {"crunch": CrunchTool()}),
+            patch.object(mcp_app, "_settings", Settings(cache_dir=tmp_path)),
+        ):
+            report = asyncio.run(
+                mcp_app._profile_tool(
+                    kwargs={"tool": "crunch", "arguments": {"n": 1000}, "top": 3}
+                )
+            )
+
+        assert report["tool"] == "crunch"
+        assert report["success"] is True
+        assert report["mode"] == "cprofile"
+        assert len(report["hotspots"]) == 3
+        assert Path(report["file"]).parent == tmp_path / "profiles"
+
+    def test_rejects_bad_input(self) -> None:
+        """Unknown tools and modes are reported as errors."""
+        from axm_mcp import mcp_app
+
+        unknown = asyncio.run(mcp_app._profile_tool(tool="nope"))
+        assert "Unknown tool" in unknown["error"]
+        with patch.object(mcp_app, "_discovered_tools", {"crunch": CrunchTool()}):
+            bad_mode = asyncio.run(mcp_app._profile_tool(tool="crunch", mode="perf"))
+        assert "Unknown profile mode" in bad_mode["error"]
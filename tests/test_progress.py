@@ -0,0 +1,128 @@
+"""Tests for MCP progress notifications."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from axm_mcp.discovery import register_tools
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.progress import ProgressCallback, reporter_for
+from axm_mcp.verify import verify_project
+from tests.fakes import FakeToolResult
+
+
+class StepTool:
+    """Tool reporting one progress step per item."""
+
+    name = "steps"
+
+    def execute(
+        self, *, count: int = 3, progress: ProgressCallback | None = None
+    ) -> FakeToolResult:
+        """Report each step, then return how many ran."""
+        for step in range(1, count + 1):
+            if progress is not None:
+                progress(step, count, f"step {step}")
+        return FakeToolResult(data={"steps": count, "reported": progress is not None})
+
+
+class FixedTool:
+    """Tool returning fixed data."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return the configured data."""
+        return FakeToolResult(data=dict(self._data))
+
+
+class ImpactTool:
+    """ast_impact stand-in."""
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return one caller per symbol."""
+        return FakeToolResult(data={"callers": [symbol]})
+
+
+class TestReporterFor:
+    """reporter_for only builds a reporter when progress was requested."""
+
+    async def test_no_context(self) -> None:
+        """No context, no reporter."""
+        assert reporter_for(None) is None
+
+    async def test_outside_request(self) -> None:
+        """A context without a request yields no reporter."""
+        assert reporter_for(FastMCP("t").get_context()) is None
+
+
+class TestToolProgress:
+    """Registered tools forward progress to the client."""
+
+    async def test_progress_reaches_client(self) -> None:
+        """Each step arrives as a progress notification."""
+        server = FastMCP("test")
+        dispatcher = Dispatcher(max_workers=2)
+        register_tools(server, {"steps": StepTool()}, dispatcher=dispatcher)
+        updates: list[tuple[float, float | None, str | None]] = []
+
+        async def on_progress(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            updates.append((progress, total, message))
+
+        async with create_connected_server_and_client_session(server) as client:
+            result = await client.call_tool(
+                "steps", {"kwargs": {"count": 3}}, progress_callback=on_progress
+            )
+            await asyncio.sleep(0.05)
+
+        assert result.structuredContent is not None
+        assert result.structuredContent["reported"] is True
+        assert updates == [(1, 3, "step 1"), (2, 3, "step 2"), (3, 3, "step 3")]
+        dispatcher.shutdown()
+
+    async def test_no_callback_without_token(self) -> None:
+        """Without a progress token the tool gets no callback."""
+        server = FastMCP("test")
+        register_tools(server, {"steps": StepTool()})
+
+        async with create_connected_server_and_client_session(server) as client:
+            result = await client.call_tool("steps", {"kwargs": {"count": 1}})
+
+        assert result.structuredContent is not None
+        assert result.structuredContent["reported"] is False
+
+
+class TestVerifyProgress:
+    """verify_project reports stages and enriched failures."""
+
+    def test_stage_and_failure_steps(self) -> None:
+        """Two stage steps, then one step per failure."""
+        failed = [
+            {"rule_id": "A", "message": "Function one failed"},
+            {"rule_id": "B", "message": "no symbol here"},
+            {"rule_id": "C", "message": "Function two failed"},
+        ]
+        tools = {
+            "audit": FixedTool({"failed": failed}),
+            "init_check": FixedTool({"score": 100}),
+            "ast_impact": ImpactTool(),
+        }
+        updates: list[tuple[Any, ...]] = []
+
+        result = verify_project("/tmp", tools, progress=lambda *a: updates.append(a))
+
+        assert [u[:2] for u in updates] == [(1, 5), (2, 5), (3, 5), (4, 5), (5, 5)]
+        assert updates[0][2] == "audit finished"
+        assert sorted(u[2] for u in updates[2:]) == [
+            "enriched A",
+            "enriched B",
+            "enriched C",
+        ]
+        assert result["audit"]["failed"][0]["context"]["callers"] == ["one"]
@@ -0,0 +1,261 @@
+"""Tests for hot reload of tool entry points."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from axm_mcp.discovery import (
+    ToolChanges,
+    discover_tools,
+    register_tools,
+    reload_tools,
+    scan_entry_points,
+)
+from axm_mcp.discovery_cache import ToolSpec, load_specs
+from tests.fakes import FakeMCP
+
+_TOOL = '''
+class Tool:
+    """Synthetic tool."""
+
+    name = "{name}"
+
+    def execute(self, **kwargs):
+        """Answer {answer}."""
+        return {answer!r}
+'''
+
+
+_DIST_FILES = ("METADATA", "entry_points.txt", "RECORD")
+
+
+class Site:
+    """Temporary site directory holding synthetic tool distributions."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def install(
+        self,
+        name: str,
+        version: str,
+        answer: str = "v1",
+        *,
+        namespace: str | None = None,
+    ) -> None:
+        """Install (or upgrade) distribution *name* with one tool.
+
+        With *namespace*, the tool module is a submodule of that
+        namespace package instead of a top-level module.
+        """
+        self.uninstall(name)
+        module = f"{namespace}.{name}" if namespace else f"reload_pkg_{name}"
+        source = Path(*module.split(".")).with_suffix(".py")
+        (self.root / source).parent.mkdir(parents=True, exist_ok=True)
+        (self.root / source).write_text(
+            _TOOL.format(name=f"reload_{name}", answer=answer)
+        )
+        dist_info = self.root / f"reload_{name}-{version}.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: reload-{name}\nVersion: {version}\n"
+        )
+        (dist_info / "entry_points.txt").write_text(
+            f"[axm.tools]\nreload_{name} = {module}:Tool\n"
+        )
+        records = [source.as_posix(), *(f"{dist_info.name}/{f}" for f in _DIST_FILES)]
+        (dist_info / "RECORD").write_text("".join(f"{r},,\n" for r in records))
+
+    def uninstall(self, name: str) -> None:
+        """Remove distribution *name*."""
+        for dist_info in self.root.glob(f"reload_{name}-*.dist-info"):
+            shutil.rmtree(dist_info)
+
+
+@pytest.fixture()
+def site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Site]:
+    """Empty site directory first on ``sys.path``."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    yield Site(tmp_path)
+    for module in [m for m in sys.modules if m.startswith("reload_pkg_")]:
+        del sys.modules[module]
+
+
+def _discover() -> tuple[dict[str, Any], dict[str, ToolSpec]]:
+    specs = [s for s in scan_entry_points() if s.name.startswith("reload_")]
+    return discover_tools(specs=specs), {s.name: s for s in specs}
+
+
+def _ours(changes: ToolChanges) -> ToolChanges:
+    """Drop entry points installed outside the test site."""
+    changes.tools = {n: t for n, t in changes.tools.items() if n.startswith("reload_")}
+    return changes
+
+
+class TestReloadTools:
+    """reload_tools loads only what changed."""
+
+    def test_added_tool_keeps_warm_instances(self, site: Site) -> None:
+        """A new distribution is loaded; existing instances are reused."""
+        site.install("a", "1.0")
+        tools, specs = _discover()
+
+        site.install("b", "1.0")
+        changes = _ours(reload_tools(tools, specs))
+
+        assert changes.added == ["reload_b"]
+        assert changes.changed == changes.removed == []
+        assert changes.tools["reload_a"] is tools["reload_a"]
+        assert changes.tools["reload_b"].execute() == "v1"
+        assert changes.specs["reload_b"].version == "1.0"
+
+    def test_upgrade_imports_new_code(self, site: Site) -> None:
+        """A version bump re-imports the package; the old instance survives."""
+        site.install("a", "1.0", answer="old")
+        tools, specs = _discover()
+        old = tools["reload_a"]
+
+        site.install("a", "2.0", answer="new")
+        changes = _ours(reload_tools(tools, specs))
+
+        assert changes.changed == ["reload_a"]
+        assert changes.tools["reload_a"].execute() == "new"
+        assert old.execute() == "old"
+        assert tools["reload_a"] is old
+
+    def test_upgrade_keeps_namespace_siblings(self, site: Site) -> None:
+        """Only the upgraded distribution's modules are imported afresh."""
+        site.install("a", "1.0", answer="old", namespace="reload_pkg_ns")
+        site.install("b", "1.0", namespace="reload_pkg_ns")
+        tools, specs = _discover()
+        sibling = sys.modules["reload_pkg_ns.b"]
+
+        site.install("a", "2.0", answer="new", namespace="reload_pkg_ns")
+        changes = _ours(reload_tools(tools, specs))
+
+        assert changes.changed == ["reload_a"]
+        assert changes.tools["reload_a"].execute() == "new"
+        assert sys.modules["reload_pkg_ns.b"] is sibling
+        assert changes.tools["reload_b"] is tools["reload_b"]
+
+    def test_upgrade_rebuilds_cache_from_new_code(
+        self, site: Site, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """The discovery cache describes the upgraded module, not the old one."""
+        cache_dir = tmp_path_factory.mktemp("cache")
+        site.install("a", "1.0", answer="old")
+        tools, specs = _discover()
+
+        site.install("a", "2.0", answer="new")
+        changes = _ours(reload_tools(tools, specs, cache_dir=cache_dir))
+
+        assert changes.changed == ["reload_a"]
+        assert changes.specs["reload_a"].doc == "Answer new."
+        cached = {
+            spec.name: spec
+            for spec in load_specs("axm.tools", cache_dir)
+            if spec.name == "reload_a"
+        }
+        assert (cached["reload_a"].version, cached["reload_a"].doc) == (
+            "2.0",
+            "Answer new.",
+        )
+
+    def test_removed_and_failed(self, site: Site) -> None:
+        """Uninstalled tools are dropped; broken upgrades keep the old one."""
+        site.install("a", "1.0")
+        site.install("b", "1.0")
+        tools, specs = _discover()
+
+        site.uninstall("b")
+        site.install("a", "2.0")
+        (site.root / "reload_pkg_a.py").write_text("raise ImportError('broken')\n")
+        changes = _ours(reload_tools(tools, specs))
+
+        assert changes.removed == ["reload_b"]
+        assert changes.changed == []
+        assert "ImportError: broken" in changes.failed["reload_a"]
+        assert changes.tools == {"reload_a": tools["reload_a"]}
+        assert changes.specs["reload_a"].version == "1.0"
+
+
+class FakeTool:
+    """Tool with a fixed answer."""
+
+    def __init__(self, answer: str) -> None:
+        self.answer = answer
+
+    def execute(self) -> Any:
+        """Fake tool."""
+        return self.answer
+
+
+class TestRegisterUpdate:
+    """register_tools(update=...) swaps only what changed."""
+
+    def test_update(self) -> None:
+        """Unchanged wrappers stay; list_tools lists the new set."""
+        server = FakeMCP()
+        tools = {"keep": FakeTool("k"), "old": FakeTool("o"), "gone": FakeTool("g")}
+        register_tools(server, tools)
+        kept = server.tools["keep"]
+        replaced = server.tools["old"]
+
+        new_tools = {"keep": tools["keep"], "old": FakeTool("o2"), "new": FakeTool("n")}
+        update = ToolChanges(
+            tools=new_tools,
+            specs={},
+            added=["new"],
+            changed=["old"],
+            removed=["gone"],
+        )
+        register_tools(server, new_tools, update=update)
+
+        assert set(server.tools) == {"keep", "old", "new", "list_tools", "batch"}
+        assert server.tools["keep"] is kept
+        assert server.tools["old"] is not replaced
+        listing = server.tools["list_tools"]()
+        assert [t["name"] for t in listing["tools"]] == ["keep", "new", "old"]
+
+
+class TestReloadMetaTool:
+    """The reload_tools meta-tool updates the running server."""
+
+    def test_swaps_registrations(self) -> None:
+        """New tools become callable and listed; removed ones disappear."""
+        from axm_mcp import mcp_app
+
+        server = FastMCP("reload-test")
+        old = {"gone": FakeTool("g"), "keep": FakeTool("k")}
+        new = {"keep": old["keep"], "added": FakeTool("a")}
+        changes = ToolChanges(tools=new, specs={}, added=["added"], removed=["gone"])
+        with (
+            patch.object(mcp_app, "mcp", server),
+            patch.object(mcp_app, "_discovered_tools", old),
+            patch.object(mcp_app, "_tool_specs", {}),
+            patch.object(mcp_app, "reload_tools", return_value=changes),
+        ):
+            mcp_app._register(old)
+            result = asyncio.run(mcp_app._reload_tools_tool())
+            assert mcp_app._discovered_tools is new
+
+        assert result == {
+            "added": ["added"],
+            "changed": [],
+            "removed": ["gone"],
+            "failed": {},
+            "count": 2,
+        }
+        names = {tool.name for tool in asyncio.run(server.list_tools())}
+        assert {"added", "keep", "list_tools"} <= names
+        assert "gone" not in names
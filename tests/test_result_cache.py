@@ -0,0 +1,146 @@
+"""Tests for the idempotent-tool result cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from axm_mcp.cache import DiskCache
+from axm_mcp.config import Settings
+from axm_mcp.discovery import _register_one, register_tools
+from axm_mcp.result_cache import ResultCache, canonical_key
+from tests.fakes import FakeMCP, FakeToolResult
+
+_NOW = "time.time"
+
+
+class DoiTool:
+    """Counting lookup tool that declares itself cacheable."""
+
+    name = "bib_doi"
+    cache_ttl = 3600
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Echo the arguments; ``fail`` returns an error result."""
+        self.calls += 1
+        if kwargs.get("fail"):
+            return FakeToolResult(success=False, error="not found")
+        return FakeToolResult(data={"echo": kwargs})
+
+
+class PlainTool(DoiTool):
+    """Same tool without the opt-in attribute."""
+
+    cache_ttl = None  # type: ignore[assignment]
+
+
+class TestCanonicalKey:
+    """canonical_key ignores argument order."""
+
+    def test_order_insensitive(self) -> None:
+        """Reordered arguments give the same key."""
+        assert canonical_key("t", {"a": 1, "b": [2]}) == canonical_key(
+            "t", {"b": [2], "a": 1}
+        )
+        assert canonical_key("t", {"a": 1}) != canonical_key("u", {"a": 1})
+
+    def test_not_json(self) -> None:
+        """Non-JSON arguments are not cacheable."""
+        assert canonical_key("t", {"a": object()}) is None
+
+
+class TestResultCache:
+    """Memory LRU in front of the disk tier, with expiry."""
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry leaves the memory tier first."""
+        cache = ResultCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_ttl_expiry(self, tmp_path: Path) -> None:
+        """Entries expire in both tiers."""
+        cache = ResultCache(DiskCache(tmp_path, max_bytes=10_000))
+        with patch(_NOW, return_value=1000.0):
+            cache.set("k", {"v": 1}, ttl=10)
+        with patch(_NOW, return_value=1005.0):
+            assert cache.get("k") == {"v": 1}
+        fresh = ResultCache(DiskCache(tmp_path, max_bytes=10_000))
+        with patch(_NOW, return_value=1011.0):
+            assert cache.get("k") is None
+            assert fresh.get("k") is None
+
+    def test_disk_promotes_to_memory(self, tmp_path: Path) -> None:
+        """A disk hit is served from memory afterwards."""
+        ResultCache(DiskCache(tmp_path, max_bytes=10_000)).set("k", [1])
+        cache = ResultCache(DiskCache(tmp_path, max_bytes=10_000))
+        assert cache.get("k", memory_only=True) is None
+        assert cache.get("k") == [1]
+        assert cache.get("k", memory_only=True) == [1]
+
+
+class TestWrapperCache:
+    """Registered tools consult the cache and report it in ``_meta``."""
+
+    async def test_attribute_opt_in(self) -> None:
+        """The second identical call is a hit and skips execute."""
+        tool = DoiTool()
+        fake_mcp = FakeMCP()
+        register_tools(fake_mcp, {"bib_doi": tool}, result_cache=ResultCache())
+        call = fake_mcp.tools["bib_doi"]
+
+        first = await call(doi="10.1/x", style="apa")
+        second = await call(style="apa", doi="10.1/x")
+
+        assert first["_meta"] == {"cache": "miss"}
+        assert second["_meta"] == {"cache": "hit"}
+        assert second["echo"] == {"doi": "10.1/x", "style": "apa"}
+        assert tool.calls == 1
+
+    async def test_config_opt_in(self) -> None:
+        """AXM_MCP_CACHE_TOOLS enables caching for a plain tool."""
+        tool = PlainTool()
+        fake_mcp = FakeMCP()
+        settings = Settings.from_env({"AXM_MCP_CACHE_TOOLS": "bib_doi=0"})
+        register_tools(
+            fake_mcp, {"bib_doi": tool}, settings=settings, result_cache=ResultCache()
+        )
+
+        await fake_mcp.tools["bib_doi"](doi="a")
+        result = await fake_mcp.tools["bib_doi"](doi="a")
+
+        assert result["_meta"] == {"cache": "hit"}
+        assert tool.calls == 1
+
+    async def test_not_opted_in(self) -> None:
+        """Other tools always execute and carry no cache metadata."""
+        tool = PlainTool()
+        fake_mcp = FakeMCP()
+        register_tools(fake_mcp, {"bib_doi": tool}, result_cache=ResultCache())
+
+        await fake_mcp.tools["bib_doi"](doi="a")
+        result = await fake_mcp.tools["bib_doi"](doi="a")
+
+        assert "_meta" not in result
+        assert tool.calls == 2
+
+    async def test_errors_not_cached(self) -> None:
+        """Failed results are returned but not stored."""
+        tool = DoiTool()
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "bib_doi", tool, cache=ResultCache(), cache_ttl=60)
+
+        await fake_mcp.tools["bib_doi"](fail=True)
+        result = await fake_mcp.tools["bib_doi"](fail=True)
+
+        assert result["_meta"] == {"cache": "miss"}
+        assert result["error"] == "not found"
+        assert tool.calls == 2
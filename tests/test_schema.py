@@ -0,0 +1,223 @@
+"""Tests for argument schemas and the list_tools catalog."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Literal, cast
+from unittest.mock import patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from axm_mcp.discovery import _LazyTool, catalog_entry, register_tools
+from axm_mcp.discovery_cache import describe_params
+from axm_mcp.schema import annotation_schema, input_schema, split_docstring
+from tests.fakes import FakeToolResult
+
+
+class SearchTool:
+    """Tool with a typed, documented execute."""
+
+    def execute(
+        self,
+        query: str,
+        *,
+        root: Path = Path("."),
+        mode: Literal["title", "doi"] = "title",
+        limit: int | None = None,
+        progress: Any = None,
+    ) -> FakeToolResult:
+        """Search papers.
+
+        Matches titles or DOIs.
+
+        Args:
+            query: Words to search for,
+                case-insensitive.
+            mode: What to match.
+
+        Returns:
+            The matches.
+        """
+        return FakeToolResult(data={"query": query, "mode": mode, "limit": limit})
+
+
+class OpenTool:
+    """Tool accepting anything."""
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Echo arguments."""
+        return FakeToolResult(data=kwargs)
+
+
+class TestAnnotationSchema:
+    """Annotations given as source text map to JSON schemas."""
+
+    @pytest.mark.parametrize(
+        ("annotation", "schema"),
+        [
+            ("str", {"type": "string"}),
+            ("pathlib.Path", {"type": "string"}),
+            ("int | None", {"type": ["integer", "null"]}),
+            ("Optional[float]", {"type": ["number", "null"]}),
+            ("list[str]", {"type": "array", "items": {"type": "string"}}),
+            ("tuple[int, ...]", {"type": "array", "items": {"type": "integer"}}),
+            ("tuple[int, str]", {"type": "array"}),
+            (
+                "dict[str, list[int]]",
+                {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                    },
+                },
+            ),
+            ("Literal['a', 'b']", {"enum": ["a", "b"]}),
+            ("Annotated[bool, 'flag']", {"type": "boolean"}),
+            (
+                "Union[str, list[str]]",
+                {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ]
+                },
+            ),
+            ("str | Widget", {}),
+            ("Widget", {}),
+            (None, {}),
+        ],
+    )
+    def test_mapping(self, annotation: str | None, schema: dict[str, Any]) -> None:
+        """Known types map to their schema; unknown ones accept anything."""
+        assert annotation_schema(annotation) == schema
+
+
+class TestInputSchema:
+    """input_schema describes a signature's keyword arguments."""
+
+    def test_signature(self) -> None:
+        """Types, defaults, required names and descriptions are captured."""
+        execute = SearchTool().execute
+        schema = input_schema(
+            describe_params(execute), execute.__doc__ or "", skip=("progress",)
+        )
+
+        assert schema == {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Words to search for, case-insensitive.",
+                },
+                "root": {"type": "string"},
+                "mode": {
+                    "enum": ["title", "doi"],
+                    "default": "title",
+                    "description": "What to match.",
+                },
+                "limit": {"type": ["integer", "null"], "default": None},
+            },
+            "required": ["query"],
+            "additionalProperties": False,
+        }
+
+    def test_var_keyword_is_open(self) -> None:
+        """Signatures taking **kwargs have no closed schema."""
+        assert input_schema(describe_params(OpenTool().execute)) is None
+
+    def test_split_docstring(self) -> None:
+        """The Args section is removed; other sections are kept."""
+        description, args = split_docstring(SearchTool.execute.__doc__ or "")
+        assert description == (
+            "Search papers.\n\nMatches titles or DOIs.\n\nReturns:\n    The matches."
+        )
+        assert list(args) == ["query", "mode"]
+
+
+class TestCatalog:
+    """Registered tools advertise their schemas; list_tools is prebuilt."""
+
+    def test_catalog_entry(self) -> None:
+        """Entries carry the description, schema and the timeout argument."""
+        entry = catalog_entry("search", SearchTool())
+
+        assert entry["description"].startswith("Search papers.")
+        assert "Args:" not in entry["description"]
+        properties = entry["input_schema"]["properties"]
+        assert list(properties) == ["query", "root", "mode", "limit", "timeout"]
+        assert catalog_entry("open", OpenTool())["input_schema"] == {"type": "object"}
+
+    def test_lazy_entry(self) -> None:
+        """Lazy proxies are described from cached metadata."""
+        proxy = _LazyTool(
+            None,  # type: ignore[arg-type]
+            doc="Cached.",
+            params=[{"name": "n", "kind": "keyword_only", "annotation": "int"}],
+        )
+        schema = catalog_entry("lazy", proxy)["input_schema"]
+        assert schema["properties"]["n"] == {"type": "integer"}
+
+    def test_fastmcp_schema_and_calls(self) -> None:
+        """FastMCP advertises the schema and still accepts wrapped arguments."""
+        server = FastMCP("schema-test")
+        register_tools(server, {"search": SearchTool(), "open": OpenTool()})
+
+        async def call(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+            result = await server.call_tool(name, arguments)
+            _, structured = cast(tuple[Any, dict[str, Any]], result)
+            return structured
+
+        async def run() -> tuple[Any, ...]:
+            listed = {tool.name: tool for tool in await server.list_tools()}
+            direct = await call("search", {"query": "q", "mode": "doi"})
+            wrapped = await call("open", {"kwargs": {"x": 1}})
+            listing = await call("list_tools", {"kwargs": {}})
+            return listed, direct, wrapped, listing
+
+        listed, direct, wrapped, listing = asyncio.run(run())
+
+        schema = listed["search"].inputSchema
+        assert schema["required"] == ["query"]
+        assert schema["properties"]["mode"]["enum"] == ["title", "doi"]
+        assert "kwargs" not in schema["properties"]
+        assert (
+            listed["search"].description
+            == catalog_entry("search", SearchTool())["description"]
+        )
+        assert direct == {
+            "success": True,
+            "query": "q",
+            "mode": "doi",
+            "limit": None,
+        }
+        assert wrapped == {"success": True, "x": 1}
+        assert [entry["name"] for entry in listing["tools"]] == ["open", "search"]
+        assert listing["tools"][1]["input_schema"]["required"] == ["query"]
+
+    def test_description_reused(self) -> None:
+        """Registering the same tools again does not rebuild their schemas."""
+        tools = {"search": SearchTool(), "open": OpenTool()}
+        register_tools(FastMCP("first"), tools)
+
+        with patch("axm_mcp.discovery.catalog_entry") as entry:
+            register_tools(FastMCP("second"), tools)
+
+        entry.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "arguments", [{}, {"kwargs": {"query": "q"}}], ids=["missing", "wrapped"]
+    )
+    def test_fastmcp_checks_required_first(self, arguments: dict[str, Any]) -> None:
+        """FastMCP itself rejects calls lacking a required argument.
+
+        Wrapping the arguments in ``kwargs`` does not get around it.
+        """
+        server = FastMCP("schema-test")
+        register_tools(server, {"search": SearchTool()})
+
+        with pytest.raises(ToolError, match=r"query\n\s+Field required"):
+            asyncio.run(server.call_tool("search", arguments))
@@ -0,0 +1,184 @@
+"""Tests for single-flight coalescing of identical concurrent calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from axm_mcp.discovery import _register_one
+from axm_mcp.singleflight import SingleFlight
+from tests.fakes import FakeMCP, FakeToolResult
+
+
+class SlowCountingTool:
+    """Tool that takes a while and counts its executions."""
+
+    name = "bib_doi"
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Sleep briefly, then echo the arguments."""
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.1)
+        return FakeToolResult(data={"echo": kwargs})
+
+
+class SideEffectTool(SlowCountingTool):
+    """Tool whose identical calls must each execute."""
+
+    coalesce = False
+
+
+class TestSingleFlight:
+    """SingleFlight shares one execution per key."""
+
+    async def test_identical_calls_share_one_run(self) -> None:
+        """Concurrent callers of one key get the same result."""
+        flights = SingleFlight()
+        runs = 0
+
+        async def work() -> int:
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.05)
+            return 42
+
+        results = await asyncio.gather(*(flights.run("k", work) for _ in range(5)))
+
+        assert results == [42] * 5
+        assert runs == 1
+        assert flights.in_flight == 0
+
+    async def test_sequential_calls_rerun(self) -> None:
+        """A finished flight is not reused (no caching)."""
+        flights = SingleFlight()
+        runs = 0
+
+        async def work() -> int:
+            nonlocal runs
+            runs += 1
+            return runs
+
+        assert await flights.run("k", work) == 1
+        assert await flights.run("k", work) == 2
+
+    async def test_exception_shared(self) -> None:
+        """Every waiter sees the shared failure."""
+        flights = SingleFlight()
+
+        async def work() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flights.run("k", work), flights.run("k", work), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_flights_kept_per_loop(self) -> None:
+        """Loops in different threads never join each other's flight."""
+        flights = SingleFlight()
+        started = threading.Barrier(2)
+        runs = 0
+
+        async def work() -> int:
+            nonlocal runs
+            runs += 1
+            started.wait(timeout=5)
+            return threading.get_ident()
+
+        results: list[int] = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(asyncio.run(flights.run("k", work)))
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert runs == 2
+        assert len(set(results)) == 2
+        assert flights.in_flight == 0
+
+    async def test_cancelled_waiter_does_not_cancel_flight(self) -> None:
+        """Cancelling one waiter leaves the others their result."""
+        flights = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(flights.run("k", work))
+        second = asyncio.create_task(flights.run("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestWrapperCoalescing:
+    """Registered tools coalesce identical concurrent calls."""
+
+    async def test_burst_executes_once(self) -> None:
+        """Ten identical calls run the tool once; others run separately."""
+        tool = SlowCountingTool()
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "bib_doi", tool)
+        call = fake_mcp.tools["bib_doi"]
+
+        results = await asyncio.gather(
+            *(call(doi="10.1/x") for _ in range(10)), call(doi="10.1/y")
+        )
+
+        assert tool.calls == 2
+        assert results[0] == {"success": True, "echo": {"doi": "10.1/x"}}
+        assert results[0] is not results[1]
+        assert results[-1]["echo"] == {"doi": "10.1/y"}
+
+    async def test_opt_out(self) -> None:
+        """``coalesce = False`` runs every call."""
+        tool = SideEffectTool()
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "bib_doi", tool)
+
+        await asyncio.gather(*(fake_mcp.tools["bib_doi"](doi="a") for _ in range(3)))
+
+        assert tool.calls == 3
+
+
+class TestVerifyCoalescing:
+    """Concurrent verify calls on one project share a run."""
+
+    async def test_same_path(self) -> None:
+        """verify_project runs once for a burst on the same path."""
+
+        def slow_verify(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            time.sleep(0.1)
+            return {"audit": None, "governance": None}
+
+        with patch("axm_mcp.mcp_app.verify_project", side_effect=slow_verify) as vp:
+            from axm_mcp.mcp_app import _verify_tool
+
+            results = await asyncio.gather(
+                _verify_tool(path="/tmp/proj"),
+                _verify_tool(path="/tmp/proj/"),
+                _verify_tool(kwargs={"path": "/tmp/proj"}),
+            )
+
+        assert vp.call_count == 1
+        assert list(results) == [{"audit": None, "governance": None}] * 3
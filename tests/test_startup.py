@@ -0,0 +1,137 @@
+"""Tests for deferred startup: nothing is discovered at import time."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_SRC = Path(__file__).parent.parent / "src"
+
+_TOOL = '''
+class SlowImportTool:
+    """Synthetic tool from an installed package."""
+
+    name = "startup_probe"
+
+    def execute(self, **kwargs):
+        """Do nothing."""
+        return None
+'''
+
+
+def _loaded_modules(code: str, extra_path: Path | None = None) -> set[str]:
+    """Run *code* in a fresh interpreter; the modules loaded at its end."""
+    paths = [str(_SRC), *sys.path]
+    if extra_path is not None:
+        paths.insert(0, str(extra_path))
+    code += "\nimport sys; print(*sys.modules, sep='\\n')"
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(paths)},
+    )
+    return set(completed.stdout.split())
+
+
+@pytest.fixture()
+def tool_package(tmp_path: Path) -> Path:
+    """Site directory with a distribution exposing one ``axm.tools`` entry point."""
+    dist_info = tmp_path / "startup_probe-0.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: startup-probe\nVersion: 0.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[axm.tools]\nstartup_probe = startup_probe_tool:SlowImportTool\n"
+    )
+    (tmp_path / "startup_probe_tool.py").write_text(_TOOL)
+    return tmp_path
+
+
+class TestImportTime:
+    """Import-time regression checks: what each import pulls in."""
+
+    def test_package_import_is_light(self) -> None:
+        """``import axm_mcp`` loads neither the server nor the MCP SDK."""
+        modules = _loaded_modules("import axm_mcp")
+        assert "axm_mcp" in modules
+        assert "axm_mcp.mcp_app" not in modules
+        assert "mcp" not in modules
+
+    def test_server_import_defers_discovery(self, tool_package: Path) -> None:
+        """Importing the server module imports no tool package."""
+        modules = _loaded_modules("import axm_mcp.mcp_app", tool_package)
+        assert "axm_mcp.mcp_app" in modules
+        assert "startup_probe_tool" not in modules
+        assert "axm_mcp.process_backend" not in modules
+        assert "axm_mcp.profiling" not in modules
+
+    def test_server_import_defers_configuration(self) -> None:
+        """Settings are read and caches set up by _configure(), not import."""
+        modules = _loaded_modules(
+            "import axm_mcp.mcp_app as m\n"
+            "assert not m._configured and m._result_cache is None\n"
+            "m._configure()\n"
+            "assert m._configured and m._result_cache is not None"
+        )
+        assert "axm_mcp.mcp_app" in modules
+
+    def test_build_imports_tools(self, tool_package: Path) -> None:
+        """build_server() discovers and imports the installed tools."""
+        modules = _loaded_modules(
+            "import axm_mcp.mcp_app as m; m.build_server()", tool_package
+        )
+        assert "startup_probe_tool" in modules
+
+
+class TestBuildServer:
+    """build_server() registers the discovered tools once."""
+
+    def test_builds_once(self) -> None:
+        """Tools passed in are registered; later calls do nothing."""
+        from axm_mcp import mcp_app
+
+        tool = MagicMock()
+        server = MagicMock()
+        tools: dict[str, Any] = {"probe": tool}
+        with (
+            patch.object(mcp_app, "mcp", server),
+            patch.object(mcp_app, "_built", False),
+            patch.object(mcp_app, "_discovered_tools", {}),
+            patch.object(mcp_app, "register_tools") as register,
+        ):
+            assert mcp_app.build_server((tools, {})) is server
+            assert mcp_app.build_server() is server
+            assert mcp_app._discovered_tools == {"probe": tool}
+
+        register.assert_called_once()
+        assert register.call_args.args[:2] == (server, {"probe": tool})
+
+    def test_main_overlaps_discovery(self) -> None:
+        """main() discovers off the main thread, then builds and runs."""
+        from axm_mcp import mcp_app
+
+        threads = []
+
+        def discover() -> tuple[dict[str, Any], dict[str, Any]]:
+            threads.append(threading.current_thread())
+            return {}, {}
+
+        with (
+            patch.object(mcp_app, "_discover", side_effect=discover),
+            patch.object(mcp_app, "build_server") as build,
+        ):
+            mcp_app.main()
+
+        assert threads and threads[0] is not threading.main_thread()
+        build.assert_called_once_with(({}, {}))
+        build.return_value.run.assert_called_once()
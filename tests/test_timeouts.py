@@ -0,0 +1,215 @@
+"""Tests for per-tool time limits and cooperative cancellation."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from axm_mcp.config import Settings, as_seconds
+from axm_mcp.discovery import _register_one, register_tools
+from axm_mcp.dispatch import Dispatcher, ToolTimeoutError
+from axm_mcp.process_backend import ProcessTool
+from axm_mcp.verify import verify_project
+from tests.fakes import FakeMCP, FakeToolResult
+
+_TARGET = "tests.test_timeouts:SleepTool"
+
+
+class SleepTool:
+    """Tool that sleeps for ``delay`` seconds."""
+
+    name = "sleep"
+
+    def execute(self, *, delay: float = 0.0, path: str = ".") -> FakeToolResult:
+        """Sleep, then report the executing process."""
+        time.sleep(delay)
+        return FakeToolResult(data={"pid": os.getpid()})
+
+
+class CancellableTool:
+    """Tool that polls its cancel event."""
+
+    name = "cancellable"
+
+    def __init__(self) -> None:
+        self.cancelled = threading.Event()
+
+    def execute(self, *, cancel_event: threading.Event | None = None) -> FakeToolResult:
+        """Run until cancelled."""
+        assert cancel_event is not None
+        if cancel_event.wait(5):
+            self.cancelled.set()
+        return FakeToolResult()
+
+
+class TestSettings:
+    """Time limits are read from the environment."""
+
+    def test_default_and_per_tool(self) -> None:
+        """TIMEOUTS overrides TIMEOUT per tool; 0 means unbounded."""
+        settings = Settings.from_env(
+            {
+                "AXM_MCP_TIMEOUT": "60",
+                "AXM_MCP_TIMEOUTS": "bib_pdf=30, audit=0, bad, x=y",
+            }
+        )
+        assert settings.timeouts == {"bib_pdf": 30.0, "audit": 0.0}
+        assert settings.timeout_for("bib_pdf") == 30.0
+        assert settings.timeout_for("audit") is None
+        assert settings.timeout_for("other") == 60.0
+
+    def test_unbounded_by_default(self) -> None:
+        """No configuration means no limit."""
+        assert Settings().timeout_for("audit") is None
+
+    @pytest.mark.parametrize("raw", ["abc", True, [1]])
+    def test_as_seconds_rejects(self, raw: object) -> None:
+        """Non-numeric timeouts are rejected."""
+        with pytest.raises(ValueError, match="Invalid timeout"):
+            as_seconds(raw)
+
+
+class TestDispatcherTimeout:
+    """run_with_timeout abandons overrunning calls."""
+
+    async def test_timeout_retires_pool(self) -> None:
+        """The stuck pool is replaced so later calls run at once."""
+        dispatcher = Dispatcher(max_workers=1)
+        with pytest.raises(ToolTimeoutError) as info:
+            await dispatcher.run_with_timeout(0.05, time.sleep, 0.5)
+        assert info.value.seconds == 0.05
+
+        start = time.perf_counter()
+        assert await dispatcher.run_with_timeout(1, int, "2") == 2
+        assert time.perf_counter() - start < 0.3
+        dispatcher.shutdown()
+
+
+class TestWrapperTimeout:
+    """Registered tools honour configured and per-call limits."""
+
+    async def test_configured_timeout(self) -> None:
+        """An overrunning call returns a structured error."""
+        fake_mcp = FakeMCP()
+        register_tools(
+            fake_mcp,
+            {"sleep": SleepTool()},
+            settings=Settings(timeouts={"sleep": 0.05}),
+        )
+
+        result = await fake_mcp.tools["sleep"](delay=0.5)
+
+        assert result == {
+            "success": False,
+            "error": "Tool 'sleep' timed out after 0.05s",
+            "timeout": 0.05,
+        }
+
+    async def test_per_call_timeout(self) -> None:
+        """A ``timeout`` argument overrides the default and is not forwarded."""
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "sleep", SleepTool(), timeout=0.01)
+
+        result = await fake_mcp.tools["sleep"](delay=0.05, timeout=2)
+
+        assert result["success"]
+
+    async def test_invalid_timeout(self) -> None:
+        """A malformed ``timeout`` is reported, not executed."""
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "sleep", SleepTool())
+
+        result = await fake_mcp.tools["sleep"](timeout="soon")
+
+        assert result == {
+            "success": False,
+            "error": "Invalid arguments for 'sleep': "
+            "'timeout': expected number, got 'soon'",
+        }
+
+    async def test_cancel_event_set(self) -> None:
+        """Tools accepting ``cancel_event`` are told to stop."""
+        tool = CancellableTool()
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "cancellable", tool, timeout=0.05)
+
+        result = await fake_mcp.tools["cancellable"]()
+
+        assert result["success"] is False
+        assert tool.cancelled.wait(1)
+
+    async def test_process_workers_recycled(self) -> None:
+        """A timed-out process-backed call gets its worker killed."""
+        proxy = ProcessTool("sleep", _TARGET, workers=1, wrapped=SleepTool())
+        fake_mcp = FakeMCP()
+        _register_one(fake_mcp, "sleep", proxy)
+        try:
+            first = await fake_mcp.tools["sleep"]()
+            timed_out = await fake_mcp.tools["sleep"](delay=30, timeout=0.5)
+            after = await fake_mcp.tools["sleep"]()
+        finally:
+            proxy.shutdown()
+
+        assert timed_out["success"] is False
+        assert after["success"]
+        assert after["pid"] != first["pid"]
+
+
+class TestVerifyDeadline:
+    """verify keeps the finished sections when the deadline hits."""
+
+    def test_enrichment_cut_short(self) -> None:
+        """Audit and governance survive a deadline during enrichment."""
+
+        class _Audit:
+            def execute(self, **kwargs: Any) -> FakeToolResult:
+                return FakeToolResult(
+                    data={
+                        "failed": [
+                            {"rule_id": "X", "message": "Function fast failed"},
+                            {"rule_id": "X", "message": "Function slow failed"},
+                        ]
+                    }
+                )
+
+        class _Impact:
+            def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+                if symbol == "slow":
+                    time.sleep(1)
+                return FakeToolResult(data={"callers": [symbol]})
+
+        tools = {
+            "audit": _Audit(),
+            "init_check": SleepTool(),
+            "ast_impact": _Impact(),
+        }
+
+        start = time.perf_counter()
+        result = verify_project("/tmp", tools, timeout=0.3)
+
+        assert time.perf_counter() - start < 0.9
+        assert result["timed_out"] == ["enrichment"]
+        assert "pid" in result["governance"]
+        fast, slow = result["audit"]["failed"]
+        assert fast["context"]["callers"] == ["fast"]
+        assert "context" not in slow
+
+    def test_stage_cut_short(self) -> None:
+        """A late stage becomes an error section."""
+
+        class _SlowGovernance:
+            def execute(self, **kwargs: Any) -> FakeToolResult:
+                time.sleep(1)
+                return FakeToolResult()
+
+        tools = {"audit": SleepTool(), "init_check": _SlowGovernance()}
+
+        result = verify_project("/tmp", tools, timeout=0.1)
+
+        assert result["timed_out"] == ["init_check"]
+        assert "pid" in result["audit"]
+        assert "deadline" in result["governance"]["error"]
@@ -0,0 +1,192 @@
+"""Tests for span-based tracing of tool calls and verify."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from axm_mcp import tracing
+from axm_mcp.config import Settings
+from axm_mcp.discovery import _register_one
+from axm_mcp.dispatch import Dispatcher
+from axm_mcp.verify import verify_project
+from tests.fakes import FakeMCP, FakeToolResult
+
+
+class SpanningTool:
+    """Tool opening its own span, to check propagation to workers."""
+
+    name = "inner"
+
+    def execute(self) -> FakeToolResult:
+        """Open one child span."""
+        with tracing.span("inner.work"):
+            return FakeToolResult(data={"ok": True})
+
+
+class FixedTool:
+    """Tool returning fixed data."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return the configured data."""
+        return FakeToolResult(data=dict(self._data))
+
+
+class ImpactTool:
+    """ast_impact stand-in."""
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return one caller per symbol."""
+        return FakeToolResult(data={"callers": [symbol]})
+
+
+@pytest.fixture()
+def trace_file(tmp_path: Path) -> Iterator[Path]:
+    """Trace into a temporary JSONL file for the test's duration."""
+    path = tmp_path / "traces" / "spans.jsonl"
+    tracing.configure(tracing.JsonlExporter(path))
+    yield path
+    tracing.configure(None)
+
+
+def _spans(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestSpans:
+    """Spans nest through the current context."""
+
+    def test_off_by_default(self) -> None:
+        """Without an exporter, spans are no-ops and bind is identity."""
+
+        def func() -> None:
+            pass
+
+        with tracing.span("x") as span:
+            assert span is None
+        assert tracing.bind(func) is func
+
+    def test_nesting_and_errors(self, trace_file: Path) -> None:
+        """Children share the trace; exceptions mark the span."""
+        with tracing.span("root", path="/p"), pytest.raises(ValueError):
+            with tracing.span("child") as child:
+                assert child is not None
+                child.set("n", 3)
+                raise ValueError("bad")
+
+        child_rec, root_rec = _spans(trace_file)
+        assert root_rec["name"] == "root"
+        assert root_rec["parent_id"] is None
+        assert root_rec["attributes"] == {"path": "/p"}
+        assert child_rec["trace_id"] == root_rec["trace_id"]
+        assert child_rec["parent_id"] == root_rec["span_id"]
+        assert child_rec["attributes"] == {"n": 3}
+        assert child_rec["error"] == "ValueError: bad"
+
+    def test_otlp_format(self, tmp_path: Path) -> None:
+        """OTLP/JSON lines carry resourceSpans with typed attributes."""
+        path = tmp_path / "otlp.jsonl"
+        tracing.configure(tracing.JsonlExporter(path, "otlp"))
+        try:
+            with tracing.span("op", ok=True, count=2, ratio=0.5, tool="audit"):
+                pass
+        finally:
+            tracing.configure(None)
+
+        (batch,) = _spans(path)
+        resource = batch["resourceSpans"][0]
+        (span,) = resource["scopeSpans"][0]["spans"]
+        assert span["name"] == "op"
+        assert len(span["traceId"]) == 32
+        assert "parentSpanId" not in span
+        assert span["status"] == {"code": 1}
+        assert {a["key"]: a["value"] for a in span["attributes"]} == {
+            "ok": {"boolValue": True},
+            "count": {"intValue": "2"},
+            "ratio": {"doubleValue": 0.5},
+            "tool": {"stringValue": "audit"},
+        }
+
+
+class TestToolTracing:
+    """Registered tools trace each MCP call."""
+
+    def test_root_span_reaches_worker(self, trace_file: Path) -> None:
+        """Spans opened by the tool on the pool nest under the call."""
+        fake_mcp = FakeMCP()
+        dispatcher = Dispatcher(max_workers=1)
+        _register_one(fake_mcp, "inner", SpanningTool(), dispatcher)
+
+        asyncio.run(fake_mcp.tools["inner"]())
+        dispatcher.shutdown()
+
+        inner, call = _spans(trace_file)
+        assert call["name"] == "mcp.call"
+        assert call["attributes"] == {"tool": "inner", "success": True}
+        assert inner["parent_id"] == call["span_id"]
+
+
+class TestVerifyTracing:
+    """verify_project traces tool runs, failures and symbol lookups."""
+
+    def test_span_tree(self, trace_file: Path) -> None:
+        """Every verify span belongs to the caller's trace."""
+        failed = [
+            {"rule_id": "A", "message": "Function one failed"},
+            {"rule_id": "B", "message": "Function two failed"},
+        ]
+        tools = {
+            "audit": FixedTool({"failed": failed}),
+            "init_check": FixedTool({"score": 100}),
+            "ast_impact": ImpactTool(),
+        }
+
+        with tracing.span("mcp.call", tool="verify"):
+            verify_project("/tmp", tools)
+
+        spans = _spans(trace_file)
+        by_name: dict[str, list[dict[str, Any]]] = {}
+        for span in spans:
+            by_name.setdefault(span["name"], []).append(span)
+        (root,) = by_name["mcp.call"]
+        (enrichment,) = by_name["verify.enrichment"]
+        assert {s["trace_id"] for s in spans} == {root["trace_id"]}
+        assert sorted(s["attributes"]["tool"] for s in by_name["verify.run_tool"]) == [
+            "audit",
+            "init_check",
+        ]
+        assert all(
+            s["parent_id"] == root["span_id"] for s in by_name["verify.run_tool"]
+        )
+        lookups = by_name["verify.ast_impact"]
+        assert sorted(s["attributes"]["symbol"] for s in lookups) == ["one", "two"]
+        assert all(s["parent_id"] == enrichment["span_id"] for s in lookups)
+        assert sorted(
+            s["attributes"]["rule_id"] for s in by_name["verify.enrich_failure"]
+        ) == ["A", "B"]
+
+
+class TestSettings:
+    """Tracing is configured from the environment."""
+
+    def test_from_env(self, tmp_path: Path) -> None:
+        """A trace file turns tracing on; the format is validated."""
+        env = {
+            "AXM_MCP_TRACE_FILE": str(tmp_path / "t.jsonl"),
+            "AXM_MCP_TRACE_FORMAT": "otlp",
+        }
+        settings = Settings.from_env(env)
+        assert settings.trace_file == tmp_path / "t.jsonl"
+        assert settings.trace_format == "otlp"
+        assert Settings.from_env({}).trace_file is None
+        assert Settings.from_env({"AXM_MCP_TRACE_FORMAT": "xml"}).trace_format == (
+            "jsonl"
+        )
@@ -0,0 +1,184 @@
+"""Tests for compiled argument validation."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from axm_mcp.discovery import _register_one
+from axm_mcp.validation import ArgumentError, compile_validator
+from tests.fakes import FakeMCP, FakeToolResult
+
+_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "limit": {"type": ["integer", "null"], "default": None},
+        "ratio": {"type": "number"},
+        "exact": {"type": "boolean"},
+        "mode": {"enum": ["title", "doi"]},
+        "ids": {"type": "array", "items": {"type": "integer"}},
+        "weights": {"type": "object", "additionalProperties": {"type": "number"}},
+        "anything": {},
+    },
+    "required": ["query"],
+    "additionalProperties": False,
+}
+
+
+class CountTool:
+    """Tool counting its executions."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def execute(self, *, path: str, depth: int = 1) -> FakeToolResult:
+        """Walk *path* down to *depth*."""
+        self.calls += 1
+        return FakeToolResult(data={"path": path, "depth": depth})
+
+
+class DeclaredTool:
+    """Tool declaring its schema instead of its signature."""
+
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"n": {"type": "integer"}},
+        "required": ["n"],
+        "additionalProperties": False,
+    }
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Echo arguments."""
+        return FakeToolResult(data=kwargs)
+
+
+class TestCompileValidator:
+    """Validators check and coerce arguments against the schema."""
+
+    def test_valid_arguments_pass(self) -> None:
+        """Matching values come back unchanged."""
+        validate = compile_validator(_SCHEMA)
+        assert validate is not None
+        args = {
+            "query": "q",
+            "limit": None,
+            "ratio": 1,
+            "exact": True,
+            "mode": "doi",
+            "ids": [1, 2],
+            "weights": {"a": 0.5},
+            "anything": object,
+        }
+        assert validate(args) == args
+
+    def test_coercion(self) -> None:
+        """Unambiguous strings, floats, tuples and paths are converted."""
+        validate = compile_validator(_SCHEMA)
+        assert validate is not None
+        checked = validate(
+            {
+                "query": Path("q"),
+                "limit": "5",
+                "ratio": "0.5",
+                "exact": "False",
+                "ids": ("1", 2.0),
+                "weights": {"a": "2"},
+            }
+        )
+        assert checked == {
+            "query": "q",
+            "limit": 5,
+            "ratio": 0.5,
+            "exact": False,
+            "ids": [1, 2],
+            "weights": {"a": 2.0},
+        }
+
+    def test_all_problems_reported(self) -> None:
+        """Every bad argument is listed, with its location."""
+        validate = compile_validator(_SCHEMA)
+        assert validate is not None
+        with pytest.raises(ArgumentError) as info:
+            validate(
+                {
+                    "limit": "many",
+                    "exact": 1,
+                    "mode": "isbn",
+                    "ids": [1, "x"],
+                    "weights": {"a": None},
+                    "extra": 1,
+                }
+            )
+        assert info.value.problems == [
+            "'limit': expected integer or null, got 'many'",
+            "'exact': expected boolean, got 1",
+            "'mode': expected one of 'title', 'doi', got 'isbn'",
+            "'ids[1]': expected integer, got 'x'",
+            "'weights.a': expected number, got None",
+            "unexpected argument 'extra'",
+            "missing required argument 'query'",
+        ]
+
+    def test_open_schema(self) -> None:
+        """Schemas accepting any object compile to nothing."""
+        assert compile_validator({"type": "object"}) is None
+
+    def test_nested_and_alternatives(self) -> None:
+        """anyOf tries each schema; nested objects are validated."""
+        validate = compile_validator(
+            {
+                "properties": {
+                    "target": {
+                        "anyOf": [
+                            {"type": "integer"},
+                            {
+                                "type": "object",
+                                "properties": {"path": {"type": "string"}},
+                                "required": ["path"],
+                            },
+                        ]
+                    }
+                }
+            }
+        )
+        assert validate is not None
+        assert validate({"target": "3"}) == {"target": 3}
+        assert validate({"target": {"path": "p"}}) == {"target": {"path": "p"}}
+        with pytest.raises(ArgumentError, match="one of the allowed schemas"):
+            validate({"target": {"file": "p"}})
+
+
+class TestWrapperValidation:
+    """Registered wrappers reject bad calls before any work starts."""
+
+    def test_rejected_before_execute(self) -> None:
+        """Invalid calls never reach the tool; valid ones are coerced."""
+        tool = CountTool()
+        server = FakeMCP()
+        _register_one(server, "walk", tool)
+
+        bad = asyncio.run(server.tools["walk"](depth="deep"))
+        good = asyncio.run(server.tools["walk"](kwargs={"path": "p", "depth": "2"}))
+
+        assert bad == {
+            "success": False,
+            "error": "Invalid arguments for 'walk': 'depth': expected integer, "
+            "got 'deep'; missing required argument 'path'",
+        }
+        assert good == {"success": True, "path": "p", "depth": 2}
+        assert tool.calls == 1
+
+    def test_declared_schema(self) -> None:
+        """A class-level input_schema is advertised and enforced."""
+        server = FakeMCP()
+        _register_one(server, "declared", DeclaredTool())
+
+        ok = asyncio.run(server.tools["declared"](n="4"))
+        bad = asyncio.run(server.tools["declared"](m=1))
+
+        assert ok == {"success": True, "n": 4}
+        assert "unexpected argument 'm'" in bad["error"]
@@ -122,7 +122,7 @@ class TestVerifyProject:
         assert result["audit"] is None
         assert result["governance"] is None
 
-    @patch("axm_mcp.verify._enrich_failure")
+    @patch("axm_mcp.verify.enrich_failure")
     def test_enrichment_called_for_failures(
         self, mock_enrich: MagicMock, mock_tools: dict[str, MagicMock]
     ) -> None:
@@ -134,7 +134,7 @@ class TestVerifyProject:
         verify_project("/tmp/fake", mock_tools)
         mock_enrich.assert_called()
 
-    @patch("axm_mcp.verify._enrich_failure")
+    @patch("axm_mcp.verify.enrich_failure")
     def test_enrichment_skipped_no_failures(self, mock_enrich: MagicMock) -> None:
         """AST enrichment should NOT be called when no failures."""
         from axm_mcp.verify import verify_project
@@ -0,0 +1,170 @@
+"""Tests for the content-hash keyed verify result cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from axm_mcp.cache import DiskCache
+from axm_mcp.project_index import FileIndex, list_files
+from axm_mcp.verify import verify_project
+from tests.fakes import FakeToolResult
+
+
+class CountingTool:
+    """Tool that counts its calls."""
+
+    def __init__(self, result: FakeToolResult | None = None) -> None:
+        self.calls = 0
+        self._result = result or FakeToolResult(data={"score": 90, "failed": []})
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return the configured result."""
+        self.calls += 1
+        return self._result
+
+
+def _project(root: Path) -> Path:
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "mod.py").write_text("x = 1\n")
+    (root / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    return root
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestDiskCache:
+    """DiskCache stores JSON values with LRU eviction by size."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """A stored value is returned on the next get."""
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+        cache.set("k", {"a": [1, 2]})
+        assert cache.get("k") == {"a": [1, 2]}
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Over budget, the entry read least recently is dropped."""
+        cache = DiskCache(tmp_path, max_bytes=250)
+        cache.set("old", "x" * 60)
+        cache.set("mid", "y" * 60)
+        # Make "old" the most recently used entry
+        for name in ("mid", "old"):
+            time.sleep(0.01)
+            cache.get(name)
+        cache.set("new", "z" * 60)
+
+        assert cache.get("mid") is None
+        assert cache.get("old") == "x" * 60
+        assert cache.get("new") == "z" * 60
+
+    def test_directory_scanned_only_over_budget(self, tmp_path: Path) -> None:
+        """Writes under budget keep a running total instead of rescanning."""
+        cache = DiskCache(tmp_path, max_bytes=250)
+        with patch.object(cache, "_entries", wraps=cache._entries) as entries:
+            cache.set("a", "x" * 60)
+            cache.set("b", "y" * 60)
+            cache.set("a", "w" * 60)
+            assert entries.call_count == 1
+            cache.set("c", "z" * 60)
+            assert entries.call_count == 2
+
+        assert cache.get("b") is None
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 250
+
+    def test_oversized_value_not_stored(self, tmp_path: Path) -> None:
+        """A value larger than the whole budget is skipped."""
+        cache = DiskCache(tmp_path, max_bytes=10)
+        cache.set("k", "x" * 100)
+        assert cache.get("k") is None
+
+    def test_corrupt_entry_is_miss(self, tmp_path: Path) -> None:
+        """An unreadable entry is a miss, not an error."""
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+        cache.set("k", 1)
+        for entry in tmp_path.glob("*.json"):
+            entry.write_text("{broken")
+        assert cache.get("k") is None
+
+
+class TestFileIndex:
+    """FileIndex fingerprints reflect file content."""
+
+    def test_fingerprint_changes_with_content(self, tmp_path: Path) -> None:
+        """Editing a file changes the fingerprint."""
+        root = _project(tmp_path)
+        index = FileIndex()
+        before = index.fingerprint(root)
+        (root / "src" / "mod.py").write_text("x = 2\n")
+        _bump_mtime(root / "src" / "mod.py")
+        assert index.fingerprint(root) != before
+
+    def test_unchanged_files_not_reread(self, tmp_path: Path) -> None:
+        """A second snapshot reuses memoized hashes."""
+        root = _project(tmp_path)
+        index = FileIndex()
+        index.snapshot(root)
+        with patch.object(Path, "read_bytes") as mock_read:
+            index.snapshot(root)
+        mock_read.assert_not_called()
+
+    def test_walk_skips_caches(self, tmp_path: Path) -> None:
+        """Without git, cache and virtualenv directories are skipped."""
+        root = _project(tmp_path)
+        (root / ".venv").mkdir()
+        (root / ".venv" / "x.py").write_text("")
+        (root / "src" / "__pycache__").mkdir()
+        (root / "src" / "__pycache__" / "mod.pyc").write_text("")
+        with patch("axm_mcp.project_index.shutil.which", return_value=None):
+            files = list_files(root)
+        assert files == ["pyproject.toml", "src/mod.py"]
+
+
+class TestVerifyCache:
+    """verify_project returns cached results for unchanged projects."""
+
+    def test_repeat_verify_hits_cache(self, tmp_path: Path) -> None:
+        """The second verify of an unchanged tree skips the tools."""
+        root = _project(tmp_path / "proj")
+        cache = DiskCache(tmp_path / "cache", max_bytes=1_000_000)
+        audit = CountingTool()
+        tools = {"audit": audit}
+
+        first = verify_project(str(root), tools, cache=cache)
+        start = time.perf_counter()
+        second = verify_project(str(root), tools, cache=cache)
+        elapsed = time.perf_counter() - start
+
+        assert audit.calls == 1
+        assert second == first
+        assert elapsed < 0.1
+
+    def test_change_invalidates(self, tmp_path: Path) -> None:
+        """Editing a project file forces a fresh verify."""
+        root = _project(tmp_path / "proj")
+        cache = DiskCache(tmp_path / "cache", max_bytes=1_000_000)
+        audit = CountingTool()
+
+        verify_project(str(root), {"audit": audit}, cache=cache)
+        (root / "src" / "mod.py").write_text("x = 3\n")
+        _bump_mtime(root / "src" / "mod.py")
+        verify_project(str(root), {"audit": audit}, cache=cache)
+
+        assert audit.calls == 2
+
+    def test_errors_not_cached(self, tmp_path: Path) -> None:
+        """A tool error is retried on the next verify."""
+        root = _project(tmp_path / "proj")
+        cache = DiskCache(tmp_path / "cache", max_bytes=1_000_000)
+        audit = CountingTool(FakeToolResult(success=False, error="boom"))
+
+        verify_project(str(root), {"audit": audit}, cache=cache)
+        verify_project(str(root), {"audit": audit}, cache=cache)
+
+        assert audit.calls == 2
@@ -0,0 +1,158 @@
+"""Tests for the compact, deduplicated caller graph of verify."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from typing import Any
+from unittest.mock import patch
+
+from axm_mcp.verify import compact_enrichment, enrich_failure
+from tests.fakes import FakeToolResult
+
+
+class SharedCallersTool:
+    """ast_impact stand-in where every symbol has the same callers."""
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return the shared callers plus one of the symbol's own."""
+        callers = [{"file": "cli.py", "line": 58}, {"file": "main.py", "line": 10}]
+        return FakeToolResult(data={"callers": [*callers, f"{symbol}:own"]})
+
+
+def _result(failures: int) -> dict[str, Any]:
+    shared = [{"file": "cli.py", "line": 58}, {"file": "main.py", "line": 10}]
+    return {
+        "audit": {
+            "score": 40,
+            "failed": [
+                {
+                    "rule_id": f"R{i}",
+                    "context": {
+                        "affected_modules": ["pkg.core", f"pkg.m{i % 3}"],
+                        "callers": [*shared, f"own{i}"],
+                        "impact_score": 0.5,
+                    },
+                }
+                for i in range(failures)
+            ]
+            + [{"rule_id": "PLAIN", "message": "no context"}],
+        },
+        "governance": {"score": 100},
+    }
+
+
+def _expand(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """Resolve compact indices back to caller and module entries."""
+    graph = result["graph"]
+    return [
+        {
+            "callers": [graph["callers"][i] for i in f["context"]["callers"]],
+            "affected_modules": [
+                graph["modules"][i] for i in f["context"]["affected_modules"]
+            ],
+        }
+        for f in result["audit"]["failed"]
+        if "context" in f
+    ]
+
+
+class TestEnrichFailureDedupe:
+    """A failure lists each caller once."""
+
+    def test_callers_shared_by_symbols(self) -> None:
+        """Symbols of one failure do not repeat their common callers."""
+        failure = {
+            "rule_id": "QUALITY_COMPLEXITY",
+            "details": {"top_offenders": [{"function": "a"}, {"function": "b"}]},
+        }
+
+        context = enrich_failure(
+            {"ast_impact": SharedCallersTool()}, "/tmp/proj", failure
+        )
+
+        assert context is not None
+        assert context["callers"] == [
+            {"file": "cli.py", "line": 58},
+            {"file": "main.py", "line": 10},
+            "a:own",
+            "b:own",
+        ]
+
+
+class TestCompactEnrichment:
+    """compact_enrichment shares one table across failures."""
+
+    def test_round_trip(self) -> None:
+        """Indices resolve to exactly the original contexts."""
+        result = _result(5)
+
+        compact = compact_enrichment(result)
+
+        original = [
+            {k: f["context"][k] for k in ("callers", "affected_modules")}
+            for f in result["audit"]["failed"]
+            if "context" in f
+        ]
+        assert _expand(compact) == original
+        assert compact["audit"]["failed"][-1] == {
+            "rule_id": "PLAIN",
+            "message": "no context",
+        }
+        assert compact["audit"]["failed"][0]["context"]["impact_score"] == 0.5
+        assert compact["governance"] == {"score": 100}
+
+    def test_counts(self) -> None:
+        """Aggregate counts describe the tables and references."""
+        counts = compact_enrichment(_result(5))["graph"]["counts"]
+
+        assert counts == {
+            "callers": 2 + 5,
+            "modules": 1 + 3,
+            "caller_refs": 5 * 3,
+            "failures": 5,
+        }
+
+    def test_smaller_payload(self) -> None:
+        """Shared callers make the compact form several times smaller."""
+        shared = [{"file": f"pkg/mod{j}.py", "line": j} for j in range(40)]
+        result = _result(50)
+        for failure in result["audit"]["failed"][:-1]:
+            failure["context"]["callers"] = shared
+
+        compact = compact_enrichment(result)
+
+        assert len(json.dumps(compact)) * 3 < len(json.dumps(result))
+
+    def test_input_not_modified(self) -> None:
+        """Cached results stay in their full form."""
+        result = _result(3)
+        before = copy.deepcopy(result)
+
+        compact_enrichment(result)
+
+        assert result == before
+
+    def test_nothing_enriched(self) -> None:
+        """Results without contexts are returned as is."""
+        result = {"audit": {"failed": [{"rule_id": "A"}]}, "governance": None}
+        assert compact_enrichment(result) is result
+        missing = {"audit": None, "governance": None}
+        assert compact_enrichment(missing) is missing
+
+
+class TestVerifyToolCompact:
+    """The verify tool's ``compact`` argument."""
+
+    def test_compact_argument(self) -> None:
+        """``compact=true`` returns the shared-table form."""
+        from axm_mcp.mcp_app import _verify_tool
+
+        with patch("axm_mcp.mcp_app.verify_project", return_value=_result(2)):
+            full = asyncio.run(_verify_tool(path="/tmp/compact-a"))
+            compact = asyncio.run(_verify_tool(path="/tmp/compact-b", compact=True))
+
+        assert "graph" not in full
+        assert compact["graph"]["counts"]["failures"] == 2
+        assert compact["audit"]["failed"][0]["context"]["callers"] == [0, 1, 2]
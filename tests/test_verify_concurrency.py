@@ -0,0 +1,141 @@
+"""Tests for concurrent execution inside verify_project."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from axm_mcp.verify import verify_project
+from tests.fakes import FakeToolResult
+
+
+class SlowTool:
+    """Tool that sleeps, then returns fixed data."""
+
+    def __init__(self, data: dict[str, Any], delay: float = 0.2) -> None:
+        self._data = data
+        self._delay = delay
+        self.threads: list[str] = []
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Sleep and return a copy of the configured data."""
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self._delay)
+        return FakeToolResult(data=dict(self._data))
+
+
+class TestStagesConcurrent:
+    """audit and init_check run in parallel."""
+
+    def test_wall_time_is_slowest_tool(self) -> None:
+        """Two 0.2 s tools finish in well under 0.4 s."""
+        tools = {
+            "audit": SlowTool({"score": 90, "failed": []}),
+            "init_check": SlowTool({"score": 80, "failed": []}),
+        }
+
+        start = time.perf_counter()
+        result = verify_project("/tmp/fake", tools)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert result == {
+            "audit": {"score": 90, "failed": []},
+            "governance": {"score": 80, "failed": []},
+        }
+
+    def test_runs_off_caller_thread(self) -> None:
+        """Both stages execute on the shared, bounded pipeline pool."""
+        audit = SlowTool({"failed": []}, delay=0)
+        init = SlowTool({"failed": []}, delay=0)
+
+        verify_project("/tmp/fake", {"audit": audit, "init_check": init})
+
+        assert all(t.startswith("axm-pipeline") for t in audit.threads + init.threads)
+
+
+class ImpactTool:
+    """ast_impact stand-in that records the symbols it was asked about."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.symbols: list[str] = []
+        self.threads: set[int] = set()
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return one caller named after the symbol."""
+        with self._lock:
+            self.symbols.append(symbol)
+            self.threads.add(threading.get_ident())
+        time.sleep(self._delay)
+        return FakeToolResult(
+            data={"callers": [f"{symbol}:caller"], "score": 0.5},
+        )
+
+
+def _type_failure(*files: str) -> dict[str, Any]:
+    return {
+        "rule_id": "QUALITY_TYPE",
+        "message": "errors",
+        "details": {"errors": [{"file": f} for f in files]},
+    }
+
+
+class TestEnrichmentFanOut:
+    """ast_impact runs once per distinct symbol, in parallel."""
+
+    def _tools(self, failed: list[dict[str, Any]], impact: ImpactTool) -> Any:
+        return {
+            "audit": SlowTool({"failed": failed}, delay=0),
+            "ast_impact": impact,
+        }
+
+    def test_shared_symbols_analyzed_once(self) -> None:
+        """A module shared by several failures is looked up once."""
+        impact = ImpactTool()
+        failed = [
+            _type_failure("src/pkg/a.py", "src/pkg/b.py"),
+            _type_failure("src/pkg/a.py"),
+            _type_failure("src/pkg/b.py", "src/pkg/c.py"),
+        ]
+
+        result = verify_project("/tmp/fake", self._tools(failed, impact))
+
+        assert sorted(impact.symbols) == ["pkg.a", "pkg.b", "pkg.c"]
+        contexts = [f["context"] for f in result["audit"]["failed"]]
+        assert contexts[0]["callers"] == ["pkg.a:caller", "pkg.b:caller"]
+        assert contexts[1]["callers"] == ["pkg.a:caller"]
+        assert contexts[2]["affected_modules"] == ["pkg.b", "pkg.c"]
+
+    def test_lookups_run_in_parallel(self) -> None:
+        """Eight 0.1 s lookups take about one lookup of wall time."""
+        impact = ImpactTool(delay=0.1)
+        failed = [_type_failure(f"src/pkg/m{i}.py") for i in range(8)]
+
+        start = time.perf_counter()
+        verify_project("/tmp/fake", self._tools(failed, impact))
+        elapsed = time.perf_counter() - start
+
+        assert len(impact.symbols) == 8
+        assert elapsed < 0.4
+
+    def test_concurrent_verifies_share_the_pool(self) -> None:
+        """Simultaneous verifies never run more than eight lookups at once."""
+        impact = ImpactTool(delay=0.05)
+        failed = [_type_failure(f"src/pkg/m{i}.py") for i in range(8)]
+        runs = [
+            threading.Thread(
+                target=verify_project,
+                args=(f"/tmp/fake{n}", self._tools(failed, impact)),
+            )
+            for n in range(3)
+        ]
+        for run in runs:
+            run.start()
+        for run in runs:
+            run.join()
+
+        assert len(impact.symbols) == 24
+        assert len(impact.threads) <= 8
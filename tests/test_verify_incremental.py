@@ -0,0 +1,251 @@
+"""Tests for incremental verify (re-check only changed files)."""
+
+from __future__ import annotations
+
+import copy
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from axm_mcp.incremental import IncrementalVerifier, _merge_audit
+from axm_mcp.project_index import FileIndex
+from tests.fakes import FakeToolResult
+
+
+def _type_failure(*files: str) -> dict[str, Any]:
+    return {
+        "rule_id": "QUALITY_TYPE",
+        "message": f"{len(files)} errors",
+        "details": {
+            "error_count": len(files),
+            "errors": [{"file": f, "line": 1} for f in files],
+        },
+    }
+
+
+class RecordingTool:
+    """Tool returning fixed data and recording its calls."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self.calls: list[dict[str, Any]] = []
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return a copy of the configured data."""
+        self.calls.append(kwargs)
+        return FakeToolResult(data=copy.deepcopy(self.data))
+
+
+class SubsetAuditTool(RecordingTool):
+    """Audit tool that understands a ``files`` subset."""
+
+    def execute(  # type: ignore[override]
+        self, *, path: str, files: list[str] | None = None
+    ) -> FakeToolResult:
+        """Return failures, restricted to *files* when given."""
+        self.calls.append({"path": path, "files": files})
+        data = copy.deepcopy(self.data)
+        if files is not None:
+            data["failed"] = [
+                f
+                for f in data["failed"]
+                if any(e["file"] in files for e in f["details"]["errors"])
+            ]
+            for failure in data["failed"]:
+                errors = failure["details"]["errors"]
+                failure["details"]["errors"] = [e for e in errors if e["file"] in files]
+        return FakeToolResult(data=data)
+
+
+class ImpactTool(RecordingTool):
+    """ast_impact stand-in."""
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return one caller per symbol."""
+        self.calls.append(kwargs)
+        return FakeToolResult(data={"callers": [f"{kwargs['symbol']}:c"]})
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("a = 1\n")
+    (tmp_path / "src" / "b.py").write_text("b = 1\n")
+    (tmp_path / "pyproject.toml").write_text("[project]\n")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _no_git() -> Any:
+    with patch("axm_mcp.project_index.shutil.which", return_value=None):
+        yield
+
+
+def _tools(audit: RecordingTool) -> dict[str, Any]:
+    return {
+        "audit": audit,
+        "init_check": RecordingTool({"score": 90, "failed": []}),
+        "ast_impact": ImpactTool({}),
+    }
+
+
+class TestIncrementalVerify:
+    """IncrementalVerifier re-runs only what a change affects."""
+
+    def test_unchanged_tree_reruns_nothing(self, project: Path) -> None:
+        """A second call on an unchanged tree calls no tool."""
+        tools = _tools(RecordingTool({"failed": [_type_failure("src/a.py")]}))
+        verifier = IncrementalVerifier(FileIndex())
+
+        first = verifier.verify(str(project), tools)
+        second = verifier.verify(str(project), tools)
+
+        assert first["incremental"]["audit"] == "full"
+        assert second["incremental"] == {
+            "changed_files": [],
+            "audit": "retained",
+            "governance": "retained",
+            "symbols_reanalyzed": 0,
+        }
+        assert second["audit"] == first["audit"]
+        assert len(tools["audit"].calls) == 1
+        assert len(tools["ast_impact"].calls) == 1
+
+    def test_python_edit_keeps_governance(self, project: Path) -> None:
+        """Editing a module re-runs audit but keeps init_check."""
+        tools = _tools(
+            RecordingTool(
+                {"failed": [_type_failure("src/a.py"), _type_failure("src/b.py")]}
+            )
+        )
+        verifier = IncrementalVerifier(FileIndex())
+        verifier.verify(str(project), tools)
+
+        _touch(project / "src" / "a.py", "a = 2\n")
+        result = verifier.verify(str(project), tools)
+
+        assert result["incremental"]["changed_files"] == ["src/a.py"]
+        assert result["incremental"]["audit"] == "full"
+        assert result["incremental"]["governance"] == "retained"
+        assert len(tools["init_check"].calls) == 1
+        # Only the changed module's symbol is looked up again
+        symbols = [c["symbol"] for c in tools["ast_impact"].calls]
+        assert sorted(symbols) == ["a", "a", "b"]
+        assert result["audit"]["failed"][1]["context"]["callers"] == ["b:c"]
+
+    def test_config_edit_reruns_governance(self, project: Path) -> None:
+        """Editing pyproject.toml re-runs init_check."""
+        tools = _tools(RecordingTool({"failed": []}))
+        verifier = IncrementalVerifier(FileIndex())
+        verifier.verify(str(project), tools)
+
+        _touch(project / "pyproject.toml", "[project]\nname = 'x'\n")
+        result = verifier.verify(str(project), tools)
+
+        assert result["incremental"]["governance"] == "full"
+        assert len(tools["init_check"].calls) == 2
+
+    def test_subset_audit_merged(self, project: Path) -> None:
+        """An audit accepting ``files`` only sees the changed files."""
+        audit = SubsetAuditTool(
+            {"score": 80, "failed": [_type_failure("src/a.py", "src/b.py")]}
+        )
+        tools = _tools(audit)
+        verifier = IncrementalVerifier(FileIndex())
+        verifier.verify(str(project), tools)
+
+        # b.py is fixed: the subset audit no longer reports it
+        audit.data = {"score": 90, "failed": [_type_failure("src/a.py")]}
+        _touch(project / "src" / "b.py", "b: int = 1\n")
+        result = verifier.verify(str(project), tools)
+
+        assert audit.calls[-1]["files"] == ["src/b.py"]
+        assert result["incremental"]["audit"] == "subset"
+        (failure,) = result["audit"]["failed"]
+        assert failure["details"]["errors"] == [{"file": "src/a.py", "line": 1}]
+        assert failure["details"]["error_count"] == 1
+        assert result["audit"]["score"] == 80
+
+    def test_deletion_skips_audit(self, project: Path) -> None:
+        """Removed files' entries are dropped without running audit."""
+        audit = SubsetAuditTool(
+            {"score": 80, "failed": [_type_failure("src/a.py", "src/b.py")]}
+        )
+        tools = _tools(audit)
+        verifier = IncrementalVerifier(FileIndex())
+        verifier.verify(str(project), tools)
+
+        (project / "src" / "b.py").unlink()
+        result = verifier.verify(str(project), tools)
+
+        assert len(audit.calls) == 1
+        assert result["incremental"]["changed_files"] == ["src/b.py"]
+        (failure,) = result["audit"]["failed"]
+        assert failure["details"]["errors"] == [{"file": "src/a.py", "line": 1}]
+
+    def test_forget_forces_full_run(self, project: Path) -> None:
+        """forget() drops retained state."""
+        tools = _tools(RecordingTool({"failed": []}))
+        verifier = IncrementalVerifier(FileIndex())
+        verifier.verify(str(project), tools)
+        verifier.forget(str(project))
+
+        result = verifier.verify(str(project), tools)
+
+        assert result["incremental"]["audit"] == "full"
+        assert len(tools["audit"].calls) == 2
+
+
+class TestMergeAudit:
+    """_merge_audit combines retained and subset failures per rule."""
+
+    def test_new_rule_appended(self) -> None:
+        """A rule only reported by the subset is added."""
+        previous = {"failed": [_type_failure("src/a.py")]}
+        subset = {
+            "failed": [
+                {
+                    "rule_id": "QUALITY_COMPLEXITY",
+                    "details": {"top_offenders": [{"file": "src/b.py"}]},
+                }
+            ]
+        }
+        merged = _merge_audit(previous, subset, {"src/b.py"})
+        assert merged is not None
+        assert [f["rule_id"] for f in merged["failed"]] == [
+            "QUALITY_TYPE",
+            "QUALITY_COMPLEXITY",
+        ]
+
+    def test_project_wide_rule_replaced(self) -> None:
+        """A rule without file details is replaced when re-reported."""
+        previous = {"failed": [{"rule_id": "COVERAGE", "message": "70%"}]}
+        subset = {"failed": [{"rule_id": "COVERAGE", "message": "75%"}]}
+        merged = _merge_audit(previous, subset, {"src/a.py"})
+        assert merged is not None
+        assert merged["failed"] == [{"rule_id": "COVERAGE", "message": "75%"}]
+
+    def test_project_wide_rule_not_reproduced_is_stale(self) -> None:
+        """A rule without file details the subset misses is flagged."""
+        previous = {"failed": [{"rule_id": "COVERAGE", "message": "70%"}]}
+        merged = _merge_audit(previous, {"failed": []}, {"src/a.py"})
+        assert merged is not None
+        assert merged["failed"] == [
+            {"rule_id": "COVERAGE", "message": "70%", "stale": True}
+        ]
+        assert "stale" not in previous["failed"][0]
+
+    def test_subset_error_returned(self) -> None:
+        """A failing subset audit is surfaced, not merged."""
+        assert _merge_audit({"failed": []}, {"error": "boom"}, set()) == {
+            "error": "boom"
+        }
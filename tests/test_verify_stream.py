@@ -0,0 +1,160 @@
+"""Tests for streaming verify (sections first, contexts as they land)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from axm_mcp.verify_stream import VerifyRuns
+from tests.fakes import FakeToolResult
+
+
+class FixedTool:
+    """Tool returning fixed data."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def execute(self, **kwargs: Any) -> FakeToolResult:
+        """Return a copy of the configured data."""
+        return FakeToolResult(data=json.loads(json.dumps(self._data)))
+
+
+class GatedImpactTool:
+    """ast_impact stand-in that holds ``slow`` until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def execute(self, *, path: str, symbol: str) -> FakeToolResult:
+        """Return one caller per symbol, blocking on ``slow``."""
+        if symbol == "slow":
+            self.release.wait(5)
+        return FakeToolResult(data={"callers": [symbol]})
+
+
+def _failure(rule_id: str, symbol: str) -> dict[str, Any]:
+    return {"rule_id": rule_id, "message": f"Function {symbol} failed"}
+
+
+class TestVerifyRun:
+    """VerifyRun collects hook calls made from worker threads."""
+
+    async def test_contexts_in_arrival_order(self) -> None:
+        """Snapshots return contexts after the given cursor."""
+        run = VerifyRuns().create()
+        loop_done: asyncio.Future[dict[str, Any]] = asyncio.Future()
+        run.attach(loop_done)
+
+        def worker() -> None:
+            run.on_sections({"audit": {"failed": [{"rule_id": "A"}, {"rule_id": "B"}]}})
+            run.on_context(1, {"callers": ["b"]})
+            run.on_context(0, {"callers": ["a"]})
+
+        await asyncio.to_thread(worker)
+        await asyncio.sleep(0)
+
+        first = run.snapshot()
+        assert [c["rule_id"] for c in first["contexts"]] == ["B", "A"]
+        assert first["cursor"] == 2
+        assert not first["complete"]
+        assert run.snapshot(cursor=1)["contexts"] == [
+            {"index": 0, "rule_id": "A", "context": {"callers": ["a"]}}
+        ]
+
+        loop_done.set_result({"timed_out": ["enrichment"]})
+        await asyncio.sleep(0)
+        final = run.snapshot(cursor=2)
+        assert final["complete"]
+        assert final["timed_out"] == ["enrichment"]
+
+    async def test_wait_returns_on_new_context(self) -> None:
+        """A long-poll wakes up as soon as a context lands."""
+        run = VerifyRuns().create()
+        run.attach(asyncio.Future())
+        asyncio.get_running_loop().call_later(0.05, run.on_context, 0, {"x": 1})
+
+        await asyncio.wait_for(run.wait(0, 5), 1)
+
+        assert run.snapshot()["cursor"] == 1
+
+    async def test_notify_on_change(self) -> None:
+        """The notifier is called with the run URI on each change."""
+        uris: list[str] = []
+        run = VerifyRuns().create(notify=uris.append)
+        run.on_sections({"audit": None})
+        await asyncio.sleep(0)
+        assert uris == [run.uri]
+        assert run.uri.startswith("axm://verify/")
+
+    async def test_registry_drops_oldest(self) -> None:
+        """Only the most recent runs are kept."""
+        runs = VerifyRuns(max_runs=2)
+        first = runs.create()
+        runs.create()
+        runs.create()
+        assert runs.get(first.run_id) is None
+
+
+class TestStreamingVerifyTool:
+    """verify(stream=true) returns sections before enrichment finishes."""
+
+    @pytest.fixture()
+    def tools(self) -> dict[str, Any]:
+        return {
+            "audit": FixedTool(
+                {"score": 70, "failed": [_failure("A", "fast"), _failure("B", "slow")]}
+            ),
+            "init_check": FixedTool({"score": 100, "failed": []}),
+            "ast_impact": GatedImpactTool(),
+        }
+
+    async def test_sections_then_contexts(self, tools: dict[str, Any]) -> None:
+        """Sections arrive first; contexts follow via verify_results."""
+        from axm_mcp import mcp_app
+
+        with (
+            patch.object(mcp_app, "_discovered_tools", tools),
+            patch.object(mcp_app, "_verify_cache", None),
+        ):
+            first = await mcp_app._verify_tool(path="/tmp/proj", stream=True)
+            assert first["governance"]["score"] == 100
+            assert "context" not in first["audit"]["failed"][1]
+            stream = first["stream"]
+            assert stream["failures"] == 2
+            assert not stream["complete"]
+
+            page = await mcp_app._verify_results_tool(
+                run_id=stream["run_id"], cursor=0, wait=2
+            )
+            assert [c["rule_id"] for c in page["contexts"]] == ["A"]
+
+            tools["ast_impact"].release.set()
+            contexts: list[dict[str, Any]] = []
+            cursor = page["cursor"]
+            for _ in range(5):
+                rest = await mcp_app._verify_results_tool(
+                    run_id=stream["run_id"], cursor=cursor, wait=2
+                )
+                contexts += rest["contexts"]
+                cursor = rest["cursor"]
+                if rest["complete"]:
+                    break
+
+            assert rest["complete"]
+            assert [c["context"]["callers"] for c in contexts] == [["slow"]]
+            resource = json.loads(mcp_app._verify_run_resource(stream["run_id"]))
+            assert resource["complete"]
+            assert len(resource["contexts"]) == 2
+
+    async def test_unknown_run(self) -> None:
+        """An unknown run id is reported as an error."""
+        from axm_mcp import mcp_app
+
+        result = await mcp_app._verify_results_tool(run_id="nope")
+        assert "Unknown verify run" in result["error"]